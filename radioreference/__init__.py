@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+import csv
+import sys
+
+# CSV column for each TrunkedChannel field
+COLUMNS = {
+    "tgid": "Decimal",
+    "alpha_tag": "Alpha Tag",
+    "mode": "Mode",
+    "description": "Description",
+    "tag": "Tag",
+    "category": "Category",
+}
+
+
+def _positions(header: list[str]) -> tuple[int, ...]:
+    """
+    Finds where each column is in the header row, so rows can be read by position.
+    """
+    header = [name.strip() for name in header]
+    missing = [column for column in COLUMNS.values() if column not in header]
+    if missing:
+        raise ValueError(f"RadioReference CSV is missing columns: {', '.join(missing)}")
+    return tuple(header.index(column) for column in COLUMNS.values())
+
+
+def read_rows(rows: Iterable[list[str]]) -> Iterator['TrunkedChannel']:
+    """
+    Turns CSV rows, starting with the header, into TrunkedChannels one at a time. TGIDs are converted to ints and
+    checked as each row is read, and the Mode, Tag and Category values repeated across rows are interned so they're
+    only stored once.
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    tgid, alpha_tag, mode, description, tag, category = _positions(header)
+    width = max(tgid, alpha_tag, mode, description, tag, category)
+    intern = sys.intern
+    for line_number, row in enumerate(rows, 2):
+        if not row:
+            continue
+        if len(row) <= width:
+            raise ValueError(f"Line {line_number} has {len(row)} columns, expected at least {width + 1}")
+        try:
+            value = int(row[tgid])
+        except ValueError:
+            raise ValueError(f"Line {line_number} has an invalid TGID: {row[tgid]!r}") from None
+        yield TrunkedChannel(
+            value, row[alpha_tag], intern(row[mode]), row[description], intern(row[tag]), intern(row[category])
+        )
+
+
+def iter_csv(file) -> Iterator['TrunkedChannel']:
+    """
+    Streams the talkgroups from a RadioReference CSV export without holding the whole file in memory.
+    """
+    with open(file, newline='', encoding='utf-8-sig') as channel_file:
+        yield from read_rows(csv.reader(channel_file, dialect='excel'))
+
+
+class TrunkedChannelDict(dict):
+    """
+    Talkgroups from a RadioReference CSV export, keyed by their integer TGID.
+    """
+
+    @classmethod
+    def import_csv(cls, file):
+        self = cls()
+        for channel in iter_csv(file):
+            self[channel.tgid] = channel
+        return self
+
+
+@dataclass(slots=True)
+class TrunkedChannel:
+    tgid: int
+    alpha_tag: str
+    mode: str
+    description: str
+    tag: str
+    category: str
+
+    def __str__(self):
+        return f"{self.tgid}: {self.alpha_tag}"
+
+    @property
+    def tgid_hex(self):
+        return hex(self.tgid)
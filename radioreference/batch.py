@@ -0,0 +1,62 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from . import TrunkedChannelDict
+
+
+@dataclass
+class ImportResult:
+    """
+    The outcome of importing one CSV file. value holds the TrunkedChannelDict, or whatever convert turned it into, and
+    error holds the exception if the file couldn't be imported.
+    """
+    file: str
+    value: object = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def csv_files(source) -> list[str]:
+    """
+    Lists the .csv files in a directory in name order, or passes a list of files straight through.
+    """
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        return sorted(
+            os.path.join(source, name) for name in os.listdir(source) if name.lower().endswith(".csv")
+        )
+    if isinstance(source, (str, os.PathLike)):
+        return [os.fspath(source)]
+    return [os.fspath(file) for file in source]
+
+
+def import_file(file: str, convert: Callable | None = None) -> ImportResult:
+    """
+    Imports and converts one file. Any exception along the way is caught and returned in the result, so one bad file
+    or a convert that fails on it can't stop a batch.
+    """
+    try:
+        channels = TrunkedChannelDict.import_csv(file)
+        return ImportResult(file, convert(channels) if convert is not None else channels)
+    except Exception as error:
+        return ImportResult(file, error=error)
+
+
+def import_many(source: str | Iterable, convert: Callable | None = None, workers: int | None = None,
+                processes: bool = True) -> list[ImportResult]:
+    """
+    Imports every CSV in a directory or list of files in parallel, returning a result per file in the same order as
+    the files. A file that fails to read or validate is reported in its result rather than stopping the others.
+    convert is called on each file's TrunkedChannelDict in the worker, e.g. to build a System, and must be a module level
+    function when processes is True.
+    """
+    files = csv_files(source)
+    if workers == 1 or len(files) < 2:
+        return [import_file(file, convert) for file in files]
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        return list(executor.map(import_file, files, [convert] * len(files)))
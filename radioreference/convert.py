@@ -0,0 +1,80 @@
+import os
+from typing import Iterable
+
+from uniden.objects import ServiceType, System, TrunkedChannel as UnidenChannel, TrunkedGroup, TrunkedSystem
+from uniden.base_classes import UnidenBool
+
+from . import TrunkedChannel, iter_csv
+
+# RadioReference tags that are named differently to the Uniden service types. Matching is done with dashes turned into
+# spaces and ignoring case, so "Law Tac" and "Law-Tac" are the same tag.
+TAG_ALIASES = {
+    "data": "Other",
+    "deprecated": "Other",
+}
+MAX_QUICK_KEY = 99
+ENCRYPTED_MODES = {"E", "DE", "TE"}
+
+
+def _tag_key(tag: str) -> str:
+    return tag.replace("-", " ").strip().lower()
+
+
+# Uniden service type name for each tag
+SERVICE_TYPE_NAMES = {_tag_key(name): name for name in ServiceType.services}
+SERVICE_TYPE_NAMES.update(TAG_ALIASES)
+OTHER = "Other"
+
+
+def service_type(tag: str, shared: dict | None = None) -> ServiceType:
+    """
+    The Uniden service type for a RadioReference tag, falling back to Other for tags Uniden has no equivalent for.
+    Service types are created once per name in the shared dict when one is given, otherwise a new one is returned.
+    """
+    name = SERVICE_TYPE_NAMES.get(_tag_key(tag), OTHER)
+    if shared is None:
+        return ServiceType(name)
+    service = shared.get(name)
+    if service is None:
+        service = shared[name] = ServiceType(name)
+    return service
+
+
+def to_system(channels: Iterable[TrunkedChannel], name: str, first_quick_key: int | None = 1,
+              avoid_encrypted: bool = True) -> System:
+    """
+    Builds a trunked System from RadioReference talkgroups in a single pass. Talkgroups are grouped by Category, with
+    groups in the order their category first appears, and each group gets the next quick key until they run out
+    (None turns quick keys off). Encrypted talkgroups are set to avoid unless avoid_encrypted is False. Channels with
+    the same service type share one ServiceType object, which isn't shared with any other system.
+    Pass iter_csv() to convert an export without loading all of its rows first.
+    """
+    if isinstance(channels, dict):
+        channels = channels.values()
+    system = System(line_prefix=TrunkedSystem.line_prefix, value=name)
+    groups = {}
+    service_types = {}
+    for channel in channels:
+        group = groups.get(channel.category)
+        if group is None:
+            quick_key = "Off"
+            if first_quick_key is not None and first_quick_key + len(groups) <= MAX_QUICK_KEY:
+                quick_key = first_quick_key + len(groups)
+            group = groups[channel.category] = TrunkedGroup(name=channel.category, quick_key=quick_key)
+            system.groups.append(group)
+        group.channels.append(UnidenChannel(
+            tgid=channel.tgid,
+            name=channel.alpha_tag,
+            avoid=UnidenBool(avoid_encrypted and channel.mode in ENCRYPTED_MODES),
+            service_type=service_type(channel.tag, service_types),
+        ))
+    return system
+
+
+def csv_to_system(file, name: str | None = None, **options) -> System:
+    """
+    Converts a RadioReference CSV export straight to a System, named after the file unless a name is given.
+    """
+    if name is None:
+        name = os.path.splitext(os.path.basename(file))[0]
+    return to_system(iter_csv(file), name, **options)
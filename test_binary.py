@@ -0,0 +1,59 @@
+import io
+
+import pytest
+from uniden.binary import decode, encode
+from uniden.events import parse
+from uniden.objects import UnidenFile, TrunkedChannel, TrunkedGroup, System
+
+HPD = (
+    "TargetModel\tBCDx36HP\n"
+    "FormatVersion\t1.00\n"
+    "Trunk\t\t\tP25 System\n"
+    "DQKs_Status\t\tOn\tOff\n"
+    "UnitIds\t\t\tUnit 1\t12345\tOff\tAuto\tOff\tOn\n"
+    "Site\t\t\tMy Site Info\n"
+    "BandPlan_P25\t\t" + "\t".join("0" for _ in range(32)) + "\n"
+    "T-Group\t\t\tFire\tOff\t0.000000\t0.000000\t0.0\tCircle\t1\n"
+    "TGID\t\t\tFire Dispatch\tOff\t100\tALL\t3\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "TGID\t\t\tLaw Tac\tOff\t200\tALL\t7\t2\t-1\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "Conventional\t\t\tLocal Freqs\n"
+    "C-Group\t\t\tWeather\tOff\t0.000000\t0.000000\t0.0\tCircle\tOff\tGlobal\n"
+    "C-Freq\t\t\tWeather\tOff\t162550000\tNFM\t\t21\tOff\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\n"
+    "C-Freq\t\t\tLeading zero\tOff\t0162550000\tNFM\t\t21\tOff\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\n"
+)
+
+
+def test_encode_decode_events():
+    events = list(parse(io.StringIO(HPD)))
+    assert list(decode(encode(events))) == events
+
+
+def test_binary_is_smaller_than_text():
+    channels = [TrunkedChannel(tgid=1000 + i, name=f"Talkgroup {i % 50}") for i in range(1000)]
+    uf = UnidenFile(systems=[System(line_prefix="Trunk", value="Big", groups=[
+        TrunkedGroup(name="Group", quick_key=1, channels=channels),
+    ])])
+    assert len(uf.to_binary()) * 3 < len(uf.export())
+
+
+def test_empty_file_roundtrip():
+    uf = UnidenFile()
+    assert UnidenFile.from_binary(uf.to_binary()).export() == uf.export()
+
+
+def test_uniden_file_roundtrip(tmp_path):
+    path = tmp_path / "test.hpd"
+    path.write_text(HPD)
+    uf = UnidenFile.from_file(str(path))
+    restored = UnidenFile.from_binary(uf.to_binary())
+    assert restored.export() == HPD
+    assert restored.systems[0].groups[0].channels[1].volume_offset == "-1"
+
+
+def test_decode_rejects_bad_data():
+    with pytest.raises(ValueError, match="too short"):
+        list(decode(b"UH"))
+    with pytest.raises(ValueError, match="not a binary config"):
+        list(decode(b"ABCD" + bytes(14)))
+    with pytest.raises(ValueError, match="version"):
+        list(decode(b"UHPD\x09" + bytes(13)))
@@ -0,0 +1,85 @@
+import pytest
+from uniden import ServiceType
+from uniden.objects import TrunkedChannel, TrunkedGroup, ConventionalFrequency, ConventionalGroup, System
+from uniden.bulk import (
+    Batch, adjust_where, channels_of, reassign_service_type, renumber_quick_keys, service_type_is, set_where,
+    shift_frequencies,
+)
+
+
+def make_system():
+    law = TrunkedGroup(name="Law", quick_key=5, channels=[
+        TrunkedChannel(tgid=1, name="Law Tac 1", service_type=ServiceType("Law-Tac")),
+        TrunkedChannel(tgid=2, name="Law Dispatch", service_type=ServiceType("Law Dispatch")),
+        TrunkedChannel.from_text("TGID\t\t\tLaw Tac 2\tOff\t3\tALL\t7\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"),
+    ])
+    fire = TrunkedGroup(name="Fire", quick_key=9, channels=[
+        TrunkedChannel(tgid=10, name="Fire Dispatch", service_type=ServiceType("Fire Dispatch")),
+    ])
+    return System(line_prefix="Trunk", value="County", groups=[law, fire])
+
+
+def test_channels_of():
+    system = make_system()
+    assert len(channels_of(system)) == 4
+    assert len(channels_of(system.groups[0])) == 3
+    assert len(channels_of(system.groups)) == 4
+
+
+def test_set_where():
+    system = make_system()
+    changed = set_where(system, service_type_is("Law-Tac"), delay=0)
+    assert [ch.tgid for ch in changed] == [1, "3"]
+    assert [ch.delay for ch in channels_of(system)] == [0, 2, 0, 2]
+
+
+def test_adjust_where_handles_parsed_strings():
+    system = make_system()
+    adjust_where(system, service_type_is("Law-Tac"), volume_offset=1)
+    assert [ch.volume_offset for ch in channels_of(system)] == [1, 0, 1, 0]
+
+
+def test_reassign_service_type_shares_instance():
+    system = make_system()
+    changed = reassign_service_type(system, "Law-Tac", "Law-Talk")
+    assert len(changed) == 2
+    assert changed[0].service_type is changed[1].service_type
+    assert changed[0].service_type.value == "Law-Talk"
+
+
+def test_shift_frequencies():
+    group = ConventionalGroup(name="Wx", channels=[
+        ConventionalFrequency(name="A", freq="162550000", modulation="NFM"),
+        ConventionalFrequency(name="B", freq=162400000, modulation="NFM"),
+    ])
+    shift_frequencies(group, 12500, where=lambda ch: ch.name == "A")
+    assert [ch.freq for ch in group.channels] == [162562500, 162400000]
+
+
+def test_renumber_quick_keys():
+    system = make_system()
+    renumber_quick_keys(system, start=1)
+    assert [group.quick_key for group in system.groups] == [1, 2]
+
+
+def test_batch_applies_on_exit_and_calls_back_once():
+    system = make_system()
+    calls = []
+    with Batch(system) as batch:
+        batch.on_commit(calls.append)
+        batch.set_where(service_type_is("Law-Tac"), delay=0).adjust_where(service_type_is("Law-Tac"), volume_offset=1)
+        batch.renumber_quick_keys()
+        assert system.groups[0].channels[0].delay == 2
+    assert system.groups[0].channels[0].delay == 0
+    assert system.groups[0].channels[0].volume_offset == 1
+    assert len(calls) == 1
+    assert len(calls[0]) == 4
+
+
+def test_batch_discarded_on_error():
+    system = make_system()
+    with pytest.raises(RuntimeError):
+        with Batch(system) as batch:
+            batch.set_where(delay=0)
+            raise RuntimeError
+    assert system.groups[0].channels[0].delay == 2
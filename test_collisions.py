@@ -0,0 +1,44 @@
+from uniden.collisions import collision_report
+from uniden.objects import ConventionalFrequency, ConventionalGroup, System, TrunkedChannel, TrunkedGroup, UnidenFile
+
+
+def trunk(name, *channels):
+    return System(line_prefix="Trunk", value=name, groups=[TrunkedGroup(name="G", quick_key=1, channels=list(channels))])
+
+
+def conventional(name, *channels):
+    return System(line_prefix="Conventional", value=name, groups=[ConventionalGroup(name="C", channels=list(channels))])
+
+
+def test_reused_and_conflicting_tgids():
+    uf = UnidenFile(systems=[
+        trunk("A", TrunkedChannel(tgid=100, name="Fire"), TrunkedChannel(tgid=200, name="Law")),
+        trunk("B", TrunkedChannel(tgid=100, name="FIRE "), TrunkedChannel(tgid=200, name="Public Works")),
+    ])
+    report = collision_report(uf)
+    assert [finding.key for finding in report.reused] == [100, 200]
+    assert [finding.key for finding in report.conflicting_names] == [200]
+    assert report.conflicting_settings == []
+
+
+def test_conflicting_settings_across_files():
+    a = UnidenFile(systems=[trunk("A", TrunkedChannel(tgid=100, name="Fire"))])
+    b = UnidenFile(systems=[trunk("A", TrunkedChannel(tgid=100, name="Fire", delay=0))])
+    report = collision_report({"a.hpd": a, "b.hpd": b})
+    finding, = report.conflicting_settings
+    assert finding.systems == {("a.hpd", "A"), ("b.hpd", "A")}
+    assert "Conflicting settings: tgid 100" in "\n".join(report.lines())
+
+
+def test_frequency_collisions_and_near_duplicates():
+    uf = UnidenFile(systems=[
+        conventional("A", ConventionalFrequency(name="Ops", freq=154250000, modulation="FM"),
+                     ConventionalFrequency(name="Tac", freq=154265000, modulation="FM")),
+        conventional("B", ConventionalFrequency(name="Dispatch", freq=154250000, modulation="FM"),
+                     ConventionalFrequency(name="Far", freq=155000000, modulation="FM")),
+    ])
+    report = collision_report([uf], tolerance=15000)
+    assert [finding.key for finding in report.conflicting_names] == [154250000]
+    assert [finding.key for finding in report.near_duplicates] == [(154250000, 154265000)]
+    assert len(report.near_duplicates[0].occurrences) == 3
+    assert not collision_report(UnidenFile(systems=[conventional("A")]))
@@ -0,0 +1,62 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+from uniden.compression import detect, open_config
+from uniden.events import parse_file
+from uniden.objects import UnidenFile
+
+HPD = (
+    "TargetModel\tBCDx36HP\n"
+    "FormatVersion\t1.00\n"
+    "Conventional\t\t\tLocal Freqs\n"
+    "C-Group\t\t\tWeather\tOff\t0.000000\t0.000000\t0.0\tCircle\tOff\tGlobal\n"
+    "C-Freq\t\t\tWeather\tOff\t162550000\tNFM\t\t21\tOff\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\n"
+)
+
+
+@pytest.mark.parametrize("extension, module", [(".gz", gzip), (".xz", lzma), (".bz2", bz2)])
+def test_from_file_compressed(tmp_path, extension, module):
+    path = tmp_path / f"test.hpd{extension}"
+    path.write_bytes(module.compress(HPD.encode()))
+    uf = UnidenFile.from_file(path)
+    assert uf.export() == HPD
+
+
+@pytest.mark.parametrize("extension, module", [(".gz", gzip), (".xz", lzma), (".bz2", bz2)])
+def test_to_file_compressed(tmp_path, extension, module):
+    path = tmp_path / f"test.hpd{extension}"
+    source = tmp_path / "plain.hpd"
+    source.write_text(HPD)
+    UnidenFile.from_file(source).to_file(path)
+    assert module.decompress(path.read_bytes()).decode() == HPD
+
+
+def test_detect_by_magic_not_extension(tmp_path):
+    path = tmp_path / "misnamed.hpd"
+    path.write_bytes(gzip.compress(HPD.encode()))
+    assert detect(path) == "gzip"
+    assert len(list(parse_file(path))) == 6
+
+
+def test_plain_file(tmp_path):
+    path = tmp_path / "plain.hpd"
+    path.write_text(HPD)
+    assert detect(path) is None
+    assert detect(tmp_path / "new.hpd", "w") is None
+    # Legacy .lzma files are a different format to xz, so the extension isn't treated as xz
+    assert detect(tmp_path / "new.hpd.lzma", "w") is None
+    assert UnidenFile.from_file(path).export() == HPD
+
+
+def test_explicit_compression(tmp_path):
+    path = tmp_path / "out.dat"
+    with open_config(path, "w", compression="xz") as config_file:
+        config_file.write(HPD)
+    assert lzma.decompress(path.read_bytes()).decode() == HPD
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError, match="Unknown compression"):
+        open_config(tmp_path / "out.hpd", "w", compression="zip")
@@ -0,0 +1,131 @@
+import pytest
+from uniden.objects import (
+    TrunkedChannel, TrunkedGroup, ConventionalFrequency, ConventionalGroup, Site, SiteFrequency, BandPlan, System,
+    Radio, DQKStatus, UnidenFile,
+)
+from uniden.dedup import dedupe, site_fingerprint, stable_hash
+
+
+def make_system(name="County P25", channel_name="Fire Dispatch", site_name="Site 1"):
+    site = Site(value=site_name, frequencies=[SiteFrequency(frequency=851012500)], bandplan=BandPlan())
+    group = TrunkedGroup(name="Fire", quick_key=1, channels=[
+        TrunkedChannel(tgid=100, name=channel_name),
+        TrunkedChannel(tgid=200, name="Fire Tac"),
+    ])
+    return System(line_prefix="Trunk", value=name, groups=[group], sites=[site],
+                  radios=[Radio(name="Unit 1", radio_id=1)])
+
+
+def test_stable_hash_is_deterministic():
+    assert stable_hash("a", 1) == stable_hash("a", 1)
+    assert stable_hash("a", 1) != stable_hash("a1")
+
+
+def test_site_fingerprint_ignores_name_and_order():
+    a = Site(value="A", frequencies=[SiteFrequency(frequency=1), SiteFrequency(frequency=2)])
+    b = Site(value="B", frequencies=[SiteFrequency(frequency="2"), SiteFrequency(frequency="1")])
+    assert site_fingerprint(a) == site_fingerprint(b)
+
+
+def test_site_fingerprint_from_exported_text():
+    parsed = Site.from_text("Site\t\t\tA\n")
+    parsed.bandplan = BandPlan.from_text(BandPlan().export())
+    parsed.frequencies.append_values(("Off", "851012500", "Off", "Off"))
+    built = Site(value="A", frequencies=[SiteFrequency(frequency=851012500)], bandplan=BandPlan())
+    assert site_fingerprint(parsed) == site_fingerprint(built)
+    searching = Site(value="A", frequencies=[SiteFrequency(frequency="Srch")])
+    assert len(dedupe(UnidenFile(systems=[System(line_prefix="Trunk", value="S", sites=[searching, built])]))
+               .systems[0].sites) == 2
+
+
+def test_dedupe_collapses_identical_systems():
+    uf = UnidenFile(systems=[make_system(), make_system()])
+    deduped = dedupe(uf)
+    assert len(deduped.systems) == 1
+    system = deduped.systems[0]
+    assert len(system.sites) == 1
+    assert len(system.radios) == 1
+    assert len(system.groups) == 1
+    assert len(system.groups[0].channels) == 2
+
+
+def test_dedupe_does_not_modify_original():
+    uf = UnidenFile(systems=[make_system(), make_system()])
+    dedupe(uf)
+    assert len(uf.systems) == 2
+    assert len(uf.systems[0].groups[0].channels) == 2
+
+
+def test_dedupe_matches_string_and_int_tgids():
+    group = TrunkedGroup(name="Fire", quick_key=1, channels=[
+        TrunkedChannel(tgid=100, name="A"),
+        TrunkedChannel(tgid="100", name="A"),
+    ])
+    uf = UnidenFile(systems=[System(line_prefix="Trunk", value="X", groups=[group])])
+    assert len(dedupe(uf).systems[0].groups[0].channels) == 1
+
+
+def test_dedupe_keeps_different_systems():
+    uf = UnidenFile(systems=[make_system(name="A"), make_system(name="B")])
+    assert len(dedupe(uf).systems) == 2
+
+
+def test_dedupe_conventional():
+    group = ConventionalGroup(name="Weather", channels=[
+        ConventionalFrequency(name="NOAA", freq=162550000, modulation="NFM"),
+        ConventionalFrequency(name="NOAA", freq=162550000, modulation="NFM"),
+    ])
+    uf = UnidenFile(systems=[System(line_prefix="Conventional", value="Local", groups=[group])])
+    assert len(dedupe(uf).systems[0].groups[0].channels) == 1
+
+
+def test_dedupe_conflict_first_and_last():
+    uf = UnidenFile(systems=[make_system(channel_name="Old"), make_system(channel_name="New")])
+    assert dedupe(uf, policy="first").systems[0].groups[0].channels[0].name == "Old"
+    assert dedupe(uf, policy="last").systems[0].groups[0].channels[0].name == "New"
+
+
+def test_dedupe_conflict_error():
+    uf = UnidenFile(systems=[make_system(channel_name="Old"), make_system(channel_name="New")])
+    with pytest.raises(ValueError, match="Conflicting"):
+        dedupe(uf, policy="error")
+
+
+def test_dedupe_conflict_on_site_name():
+    uf = UnidenFile(systems=[make_system(site_name="North"), make_system(site_name="South")])
+    assert dedupe(uf, policy="last").systems[0].sites[0].value == "South"
+
+
+def test_dedupe_conflict_on_group_settings():
+    a, b = make_system(), make_system()
+    b.groups[0].quick_key = 5
+    uf = UnidenFile(systems=[a, b])
+    assert dedupe(uf, policy="first").systems[0].groups[0].quick_key == 1
+    last = dedupe(uf, policy="last").systems[0].groups[0]
+    assert last.quick_key == 5 and len(last.channels) == 2
+    with pytest.raises(ValueError, match="Conflicting"):
+        dedupe(uf, policy="error")
+
+
+def test_dedupe_conflict_on_dqk_status():
+    a, b = make_system(), make_system()
+    a.dqk_status = DQKStatus(["On"] * 4)
+    b.dqk_status = DQKStatus(["Off"] * 4)
+    uf = UnidenFile(systems=[a, b])
+    assert dedupe(uf, policy="last").systems[0].dqk_status.statuses == ["Off"] * 4
+    with pytest.raises(ValueError, match="Conflicting"):
+        dedupe(uf, policy="error")
+    kept = dedupe(uf, policy=lambda existing, new: new if new.statuses < existing.statuses else existing)
+    assert kept.systems[0].dqk_status.statuses == ["Off"] * 4
+
+
+def test_dedupe_conflict_callable():
+    uf = UnidenFile(systems=[make_system(channel_name="Old"), make_system(channel_name="New")])
+    deduped = dedupe(uf, policy=lambda existing, new: new if new.name > existing.name else existing)
+    assert deduped.systems[0].groups[0].channels[0].name == "Old"
+
+
+def test_dedupe_unknown_policy():
+    uf = UnidenFile(systems=[make_system(channel_name="Old"), make_system(channel_name="New")])
+    with pytest.raises(ValueError, match="Unknown conflict policy"):
+        dedupe(uf, policy="newest")
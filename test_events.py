@@ -0,0 +1,118 @@
+import io
+from collections import Counter
+
+import pytest
+from uniden.events import Event, dispatch, parse, parse_file, to_line, tree_events
+from uniden.objects import TreeBuilder, UnidenFile, TrunkedChannel, TrunkedGroup, System
+
+HEADER = "TargetModel\tBCDx36HP\nFormatVersion\t1.00\n"
+TRUNK = (
+    "Trunk\t\t\tP25 System\n"
+    "DQKs_Status\t\tOn\tOff\n"
+    "UnitIds\t\t\tUnit 1\t12345\tOff\tAuto\tOff\tOn\n"
+    "Site\t\t\tMy Site Info\n"
+    "T-Freq\t\t\tOff\t851012500\tOff\tOff\n"
+    "T-Group\t\t\tFire\tOff\t0.000000\t0.000000\t0.0\tCircle\t1\n"
+    "TGID\t\t\tFire Dispatch\tOff\t100\tALL\t3\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "TGID\t\t\tLaw Tac\tOff\t200\tALL\t7\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+)
+CONV = (
+    "Conventional\t\t\tLocal Freqs\n"
+    "C-Group\t\t\tWeather\tOff\t0.000000\t0.000000\t0.0\tCircle\tOff\tGlobal\n"
+    "C-Freq\t\t\tWeather\tOff\t162550000\tNFM\t\t21\tOff\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\n"
+)
+
+
+def test_parse_events_in_order():
+    events = [event.event for event in parse(io.StringIO(HEADER + TRUNK + CONV))]
+    assert events == [
+        "target_model", "format_version", "start_system", "dqk_status", "unit_id", "site", "site_freq", "group",
+        "tgid", "tgid", "end_system", "start_system", "group", "cfreq", "end_system",
+    ]
+
+
+def test_parse_fields():
+    events = list(parse(io.StringIO(HEADER + TRUNK)))
+    assert events[0] == Event("target_model", "TargetModel", ("BCDx36HP",))
+    assert events[2] == Event("start_system", "Trunk", ("P25 System",))
+    assert events[3].fields == ("On", "Off")
+    assert events[8].fields[2] == "100"
+
+
+def test_parse_keeps_empty_fields():
+    event = list(parse(io.StringIO(CONV)))[2]
+    assert event.fields[4] == ""
+
+
+def test_parse_unknown_line():
+    with pytest.raises(ValueError, match="Unknown entry type"):
+        list(parse(io.StringIO("Garbage\tline\n")))
+
+
+def test_count_tgids_by_service_type():
+    counts = Counter(fields[4] for event, _, fields in parse(io.StringIO(TRUNK)) if event == "tgid")
+    assert counts == {"3": 1, "7": 1}
+
+
+def test_dispatch_skips_missing_callbacks():
+    class Names:
+        def __init__(self):
+            self.names = []
+
+        def tgid(self, prefix, fields):
+            self.names.append(fields[0])
+
+    assert dispatch(parse(io.StringIO(TRUNK)), Names()).names == ["Fire Dispatch", "Law Tac"]
+
+
+def test_to_line_roundtrip():
+    lines = [to_line(event) for event in parse(io.StringIO(HEADER + TRUNK + CONV))]
+    assert "".join(lines) == HEADER + TRUNK + CONV
+
+
+def test_tree_builder():
+    uf = TreeBuilder().feed(parse(io.StringIO(HEADER + TRUNK + CONV)))
+    assert uf.target_model == "BCDx36HP"
+    assert len(uf.systems) == 2
+    trunk = uf.systems[0]
+    assert trunk.dqk_status.statuses == ["On", "Off"]
+    assert len(trunk.radios) == 1
+    assert len(trunk.sites[0].frequencies) == 1
+    assert [ch.name for ch in trunk.groups[0].channels] == ["Fire Dispatch", "Law Tac"]
+    assert uf.systems[1].groups[0].channels[0].freq == "162550000"
+
+
+def test_tree_builder_rejects_orphan_records():
+    lines = "Trunk\t\t\tX\nTGID\t\t\tFire Dispatch\tOff\t100\tALL\t3\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    with pytest.raises(ValueError, match="Unknown entry type"):
+        TreeBuilder().feed(parse(io.StringIO(lines)))
+
+
+def test_tree_builder_rejects_channels_in_the_wrong_group_type():
+    tgid = TRUNK.splitlines(keepends=True)[6]
+    cfreq = CONV.splitlines(keepends=True)[2]
+    for lines in (CONV.replace(cfreq, tgid), TRUNK.replace(tgid, cfreq)):
+        with pytest.raises(ValueError, match="Unknown entry type"):
+            TreeBuilder().feed(parse(io.StringIO(lines)))
+
+
+def test_tree_events():
+    group = TrunkedGroup(name="Fire", quick_key=1, channels=[TrunkedChannel(tgid=100, name="A")])
+    uf = UnidenFile(systems=[System(line_prefix="Trunk", value="X", groups=[group])])
+    events = list(tree_events(uf))
+    assert [event.event for event in events] == [
+        "target_model", "format_version", "start_system", "group", "tgid", "end_system",
+    ]
+    assert TreeBuilder().feed(events).export() == uf.export()
+
+
+def test_parse_file(tmp_path):
+    p = tmp_path / "test.hpd"
+    p.write_text(HEADER + CONV)
+    assert len(list(parse_file(p))) == 6
+
+
+def test_from_file_export_roundtrip(tmp_path):
+    p = tmp_path / "test.hpd"
+    p.write_text(HEADER + CONV)
+    assert UnidenFile.from_file(p).export() == HEADER + CONV
@@ -0,0 +1,99 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from uniden.favorites import NEW_FILE_MODE, FavoritesTree
+from uniden.objects import System, TrunkedChannel, TrunkedGroup, UnidenFile
+
+
+def make_config(name):
+    return UnidenFile(systems=[System(line_prefix="Trunk", value=name, groups=[
+        TrunkedGroup(name="G", quick_key=1, channels=[TrunkedChannel(tgid=100, name="Fire")]),
+    ])])
+
+
+def test_write_and_read_roundtrip(tmp_path):
+    tree = FavoritesTree()
+    tree.add("County", make_config("County P25"))
+    tree.add("State", make_config("State P25"), settings=("On", "On", "3", "Off"))
+    assert tree.write(str(tmp_path), workers=2) == ["f_000001.hpd", "f_000002.hpd"]
+    assert sorted(os.listdir(tmp_path)) == ["f_000001.hpd", "f_000002.hpd", "f_list.cfg"]
+    assert (tmp_path / "f_list.cfg").read_text().splitlines()[3] == "F-List\tState\tf_000002.hpd\tOn\tOn\t3\tOff"
+
+    loaded = FavoritesTree.read(str(tmp_path))
+    assert [(fav.name, fav.filename, fav.settings) for fav in loaded.lists] == [
+        (fav.name, fav.filename, fav.settings) for fav in tree.lists
+    ]
+    assert loaded.lists[1].config.export() == tree.lists[1].config.export()
+
+
+def test_non_ascii_names_roundtrip_whatever_the_locale(tmp_path):
+    script = (
+        "import locale, sys\n"
+        "from uniden.favorites import NEW_FILE_MODE, FavoritesTree\n"
+        "from test_favorites import make_config\n"
+        "assert locale.getpreferredencoding(False).lower() not in ('utf-8', 'utf8')\n"
+        "tree = FavoritesTree()\n"
+        "tree.add('Montr\\u00e9al', make_config('R\\u00e9seau \\u00c9T\\u00c9'))\n"
+        "tree.write(sys.argv[1])\n"
+        "loaded = FavoritesTree.read(sys.argv[1])\n"
+        "assert loaded.lists[0].name == tree.lists[0].name\n"
+        "assert loaded.lists[0].config.export() == tree.lists[0].config.export()\n"
+    )
+    env = dict(os.environ, LC_ALL="C", PYTHONCOERCECLOCALE="0", PYTHONUTF8="0",
+               PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", script, str(tmp_path)], env=env, check=True)
+
+
+def test_unchanged_lists_are_skipped(tmp_path):
+    tree = FavoritesTree()
+    tree.add("County", make_config("County P25"))
+    tree.add("State", make_config("State P25"))
+    tree.write(str(tmp_path))
+    assert tree.write(str(tmp_path)) == []
+
+    tree.lists[1].config.systems[0].groups[0].channels[0].name = "Law"
+    assert tree.write(str(tmp_path)) == ["f_000002.hpd"]
+
+    loaded = FavoritesTree.read(str(tmp_path))
+    assert loaded.write(str(tmp_path)) == []
+    fresh = FavoritesTree([FavoritesTree.read(str(tmp_path)).lists[0]])
+    fresh.saved.clear()
+    assert fresh.write(str(tmp_path)) == []  # same bytes already on disk
+
+
+def test_written_files_are_synced_with_normal_modes(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda handle: synced.append(handle) or real_fsync(handle))
+    tree = FavoritesTree()
+    tree.add("County", make_config("County P25"))
+    tree.write(str(tmp_path))
+    assert len(synced) >= 2
+    for name in ("f_000001.hpd", "f_list.cfg"):
+        assert (tmp_path / name).stat().st_mode & 0o777 == NEW_FILE_MODE
+
+    os.chmod(tmp_path / "f_000001.hpd", 0o640)
+    tree.lists[0].config.systems[0].value = "Renamed"
+    tree.write(str(tmp_path))
+    assert (tmp_path / "f_000001.hpd").stat().st_mode & 0o777 == 0o640
+
+
+def test_failed_write_leaves_no_temp_files(tmp_path, monkeypatch):
+    tree = FavoritesTree()
+    tree.add("County", make_config("County P25"))
+
+    def fail(source, destination):
+        raise OSError("card removed")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        tree.write(str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_unknown_index_entry(tmp_path):
+    (tmp_path / "f_list.cfg").write_text("TargetModel\tBCDx36HP\nBogus\tline\n")
+    with pytest.raises(ValueError):
+        FavoritesTree.read(str(tmp_path))
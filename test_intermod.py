@@ -0,0 +1,54 @@
+import random
+
+import pytest
+from uniden.intermod import Entry, collect, intermod_products, spacing_violations
+from uniden.objects import ConventionalFrequency, ConventionalGroup, Site, SiteFrequency, System, UnidenFile
+
+
+def make_file():
+    site = Site(value="North", frequencies=[SiteFrequency(frequency=851000000), SiteFrequency(frequency=851025000)])
+    trunk = System(line_prefix="Trunk", value="P25", sites=[site])
+    group = ConventionalGroup(name="Fire", channels=[
+        ConventionalFrequency(name="Ops", freq=851050000, modulation="FM"),
+        ConventionalFrequency(name="Tac", freq=851060000, modulation="FM"),
+    ])
+    return UnidenFile(systems=[trunk, System(line_prefix="Conventional", value="County", groups=[group])])
+
+
+def test_collect():
+    entries = collect(make_file())
+    assert Entry(851000000, "P25", "North") in entries
+    assert Entry(851060000, "County", "Fire", "Tac") in entries
+
+
+def test_spacing_violations():
+    violations = spacing_violations(collect(make_file()), 12500)
+    assert [(v.first.name, v.second.name, v.separation) for v in violations] == [("Ops", "Tac", 10000)]
+
+
+def test_intermod_products():
+    hits = intermod_products(collect(make_file()))
+    # 2 * 851025000 - 851000000 = 851050000 (Ops), and the mirror image 2 * 851025000 - 851050000 = 851000000
+    assert [(hit.product, hit.victims[0].name) for hit in hits] == [(851050000, "Ops"), (851000000, "")]
+    assert hits[0].a[0].location == "North"
+
+
+def brute_force(frequencies, tolerance):
+    return sorted(
+        (2 * a - b, a, b, c) for a in frequencies for b in frequencies for c in frequencies
+        if len({a, b, c}) == 3 and abs(2 * a - b - c) <= tolerance
+    )
+
+
+def results(hits):
+    return sorted((hit.product, hit.a[0].frequency, hit.b[0].frequency, hit.victims[0].frequency) for hit in hits)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_matches_brute_force(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    rng = random.Random(1)
+    frequencies = sorted({851000000 + rng.randrange(200) * 12500 for _ in range(60)})
+    entries = [Entry(frequency, "S", "L") for frequency in frequencies]
+    assert results(intermod_products(entries, 2500, use_numpy)) == brute_force(frequencies, 2500)
@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+from uniden.live import LiveConfig
+from uniden.objects import (
+    BandPlan, DQKStatus, Radio, Site, SiteFrequency, System, TrunkedChannel, TrunkedGroup, UnidenFile,
+)
+
+
+def make_file():
+    return UnidenFile(systems=[
+        System(line_prefix="Trunk", value=f"System {i}", groups=[
+            TrunkedGroup(name=f"G{g}", quick_key=g, channels=[TrunkedChannel(tgid=n, name=f"TG {n}") for n in range(5)])
+            for g in range(3)
+        ])
+        for i in range(3)
+    ])
+
+
+def test_edit_publishes_new_snapshot_with_sharing():
+    live = LiveConfig(make_file())
+    before = live.snapshot()
+    with live.edit() as draft:
+        draft.channel(1, 2, 0).name = "Renamed"
+    after = live.snapshot()
+
+    assert after.version == before.version + 1
+    assert before.systems[1].groups[2].channels[0].name == "TG 0"
+    assert after.systems[1].groups[2].channels[0].name == "Renamed"
+    assert after.systems[0] is before.systems[0]
+    assert after.systems[1] is not before.systems[1]
+    assert after.systems[1].groups[0] is before.systems[1].groups[0]
+    assert after.systems[1].groups[2].channels[1] is before.systems[1].groups[2].channels[1]
+
+
+def test_system_dqk_sites_and_radios_are_copied():
+    uf = make_file()
+    uf.systems[0].dqk_status = DQKStatus(["Off", "Off", "Off"])
+    uf.systems[0].sites = [Site(value="S", frequencies=[SiteFrequency(frequency=851012500)], bandplan=BandPlan())]
+    uf.systems[0].radios = [Radio(name="Unit", radio_id=1)]
+    live = LiveConfig(uf)
+    before = live.snapshot()
+    with live.edit() as draft:
+        draft.system(0).dqk_status.statuses[0] = "On"
+        draft.site(0, 0).frequencies[0] = SiteFrequency(frequency=852000000)
+        draft.site(0, 0).bandplan.band_plans[0] = ("1", "2")
+        draft.radio(0, 0).name = "Renamed"
+        assert draft.site(0, 0) is draft.site(0, 0) and draft.radio(0, 0) is draft.radio(0, 0)
+    system = before.systems[0]
+    assert system.dqk_status.statuses == ["Off", "Off", "Off"]
+    assert system.sites[0].frequencies.hz() == [851012500]
+    assert system.sites[0].bandplan.band_plans[0] == (0, 0)
+    assert system.radios[0].name == "Unit"
+    assert live.snapshot().systems[0].radios[0].name == "Renamed"
+
+
+def test_repeated_access_returns_same_copy():
+    live = LiveConfig(make_file())
+    with live.edit() as draft:
+        assert draft.system(0) is draft.system(0)
+        assert draft.group(0, 1) is draft.group(0, 1)
+        assert draft.channel(0, 1, 2) is draft.channel(0, 1, 2)
+
+
+def test_failed_edit_is_discarded():
+    live = LiveConfig(make_file())
+    before = live.snapshot()
+    with pytest.raises(RuntimeError):
+        with live.edit() as draft:
+            draft.remove_system(0)
+            raise RuntimeError
+    assert live.snapshot() is before
+
+
+def test_readers_see_consistent_snapshots_during_writes():
+    live = LiveConfig(make_file())
+    errors = []
+
+    def read():
+        for _ in range(2000):
+            snapshot = live.snapshot()
+            names = {group.name for system in snapshot.systems for group in system.groups}
+            if len(names) != 1 and names != {"G0", "G1", "G2"}:
+                errors.append(names)
+
+    def write():
+        for version in range(200):
+            with live.edit() as draft:
+                for s in range(len(draft.systems)):
+                    for g in range(3):
+                        draft.group(s, g).name = f"V{version}"
+
+    threads = [threading.Thread(target=read) for _ in range(4)] + [threading.Thread(target=write)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert live.version == 200
+    assert live.snapshot().to_uniden_file().systems[2].groups[0].name == "V199"
@@ -0,0 +1,74 @@
+import io
+import json
+
+from uniden.events import parse
+from uniden import ndjson
+
+HPD = (
+    "TargetModel\tBCDx36HP\n"
+    "FormatVersion\t1.00\n"
+    "Trunk\t\t\tP25 System\n"
+    "DQKs_Status\t\tOn\tOff\n"
+    "UnitIds\t\t\tUnit 1\t12345\tOff\tAuto\tOff\tOn\n"
+    "Site\t\t\tMy Site\tInfo\n"
+    "BandPlan_P25\t\t" + "\t".join("0" for _ in range(32)) + "\n"
+    "T-Freq\t\t\tOff\t851012500\tOff\tOff\n"
+    "T-Group\t\t\tFire\tOff\t0.000000\t0.000000\t0.0\tCircle\t1\n"
+    "TGID\t\t\tFire Dispatch\tOff\t100\tALL\t3\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "TGID\t\t\tLaw Tac\tOff\t0200\tALL\t7\t2\t-1\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "Conventional\t\t\tLocal Freqs\n"
+    "C-Group\t\t\tWeather\tOff\t0.000000\t0.000000\t0.0\tCircle\tOff\tGlobal\n"
+    "C-Freq\t\t\tWeather\tOff\t162550000\tNFM\t\t21\tOff\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\n"
+)
+
+
+def write_records():
+    out = io.StringIO()
+    ndjson.write(parse(io.StringIO(HPD)), out)
+    return out.getvalue()
+
+
+def test_one_flat_record_per_line():
+    lines = write_records().splitlines()
+    assert len(lines) == 14
+    tgid = json.loads(lines[9])
+    assert tgid["record"] == "tgid"
+    assert tgid["system"] == "P25 System"
+    assert tgid["group"] == "Fire"
+    assert tgid["tgid"] == 100
+    assert tgid["name"] == "Fire Dispatch"
+    assert tgid["alert_colour"] == "Off"
+
+
+def test_numbers_only_converted_when_lossless():
+    record = json.loads(write_records().splitlines()[10])
+    assert record["tgid"] == "0200"
+    assert record["volume_offset"] == -1
+
+
+def test_site_frequency_context():
+    record = json.loads(write_records().splitlines()[7])
+    assert record == {
+        "record": "site_freq", "prefix": "T-Freq", "system": "P25 System", "site": "My Site\tInfo",
+        "unknown_value": "Off", "frequency": 851012500, "dmr_lcn": "Off", "colour": "Off",
+    }
+
+
+def test_read_returns_same_events():
+    events = list(parse(io.StringIO(HPD)))
+    assert list(ndjson.read(io.StringIO(write_records()))) == events
+
+
+def test_load_rebuilds_tree():
+    uf = ndjson.load(io.StringIO(write_records()))
+    assert len(uf.systems) == 2
+    assert uf.systems[0].groups[0].channels[1].name == "Law Tac"
+    assert uf.systems[1].groups[0].channels[0].freq == "162550000"
+
+
+def test_write_uniden_file():
+    uf = ndjson.load(io.StringIO(write_records()))
+    uf.systems[0].sites.clear()
+    out = io.StringIO()
+    assert ndjson.write(uf, out) == 11
+    assert ndjson.load(io.StringIO(out.getvalue())).export() == uf.export()
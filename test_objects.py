@@ -1,9 +1,14 @@
+import copy
 import io
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
 import pytest
 from uniden import UnidenBool, UnidenRange, AlertLight, AlertTone, ServiceType
 from uniden.objects import (
     Radio, TrunkedChannel, TrunkedGroup, ConventionalFrequency,
-    ConventionalGroup, SiteFrequency, BandPlan, Site, DQKStatus,
+    ConventionalGroup, SiteFrequency, SiteFrequencies, BandPlan, Site, DQKStatus,
     System, UnidenFile, TrunkedSystem, ConventionalSystem,
 )
 from uniden.base_classes import UnidenTextType
@@ -701,3 +706,184 @@ def test_uniden_text_type_export():
 def test_uniden_text_type_tabs_text():
     s = Site(value="x")
     assert s.tabs_text == "\t\t\t"
+
+
+# ── Export caching ──────────────────────────────────────────
+
+def test_channel_export_is_cached():
+    ch = TrunkedChannel(tgid=100, name="A")
+    assert ch.export() is ch.export()
+
+
+def test_channel_export_cache_invalidated_on_change():
+    ch = TrunkedChannel(tgid=100, name="A")
+    ch.export()
+    ch.name = "B"
+    assert "\tB\t" in ch.export()
+
+
+def test_parsed_records_cache_and_invalidate():
+    for record, line in ((Radio.from_text(RADIO_LINE), RADIO_LINE), (TrunkedChannel.from_text(TGID_LINE), TGID_LINE),
+                         (ConventionalFrequency.from_text(CFREQ_LINE), CFREQ_LINE)):
+        assert record.export() == line
+        assert record.export() is record.export()
+        digest = record.digest()
+        record.name = "Renamed"
+        assert "\tRenamed\t" in record.export()
+        assert record.digest() != digest
+
+
+def test_channel_export_cache_invalidate():
+    ch = TrunkedChannel(tgid=100, name="A")
+    ch.export()
+    ch.alert_tone.value = 3
+    assert "\tOff\tAuto\t" in ch.export()
+    ch.invalidate()
+    assert "\t3\tAuto\t" in ch.export()
+
+
+def test_group_export_reflects_channel_changes():
+    ch = TrunkedChannel(tgid=100, name="A")
+    g = TrunkedGroup(name="Test", quick_key=1, channels=[ch])
+    g.export()
+    ch.delay = 5
+    g.channels.append(TrunkedChannel(tgid=200, name="B"))
+    g.quick_key = 3
+    exported = g.export()
+    assert exported.splitlines()[0].endswith("\t3")
+    assert exported.splitlines()[1] == ch.export().strip("\n")
+    assert len(exported.splitlines()) == 3
+
+
+def test_system_export_reflects_changes():
+    s = System(line_prefix="Trunk", value="Test")
+    s.export()
+    s.value = "Renamed"
+    assert s.export() == "Trunk\t\t\tRenamed\n"
+
+
+def test_export_cache_not_part_of_equality():
+    r1 = Radio(name="Unit", radio_id=1)
+    r2 = r1.clone()
+    r1.export()
+    assert r1 == r2
+
+
+def test_uniden_file_to_file_parallel(tmp_path):
+    systems = [
+        System(line_prefix="Trunk", value=f"System {i}", groups=[
+            TrunkedGroup(name="G", quick_key=1, channels=[TrunkedChannel(tgid=n, name=f"TG {n}") for n in range(50)]),
+        ])
+        for i in range(4)
+    ]
+    uf = UnidenFile(systems=systems)
+    serial = tmp_path / "serial.hpd"
+    parallel = tmp_path / "parallel.hpd"
+    uf.to_file(serial)
+    uf.to_file(parallel, workers=2)
+    assert parallel.read_bytes() == serial.read_bytes()
+
+
+def test_uniden_file_to_file_parallel_from_threads(tmp_path):
+    files = [
+        UnidenFile(systems=[System(line_prefix="Trunk", value=f"File {n} System {i}") for i in range(3)])
+        for n in range(2)
+    ]
+    threads = [
+        threading.Thread(target=uf.to_file, args=(tmp_path / f"{n}.hpd",), kwargs={"workers": 2})
+        for n, uf in enumerate(files)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for n, uf in enumerate(files):
+        assert (tmp_path / f"{n}.hpd").read_text() == uf.export()
+
+
+def test_digest_tracks_changes_bottom_up():
+    channels = [TrunkedChannel(tgid=n, name=f"TG {n}") for n in range(3)]
+    group = TrunkedGroup(name="G", quick_key=1, channels=channels)
+    system = System(line_prefix="Trunk", value="Sys", groups=[group])
+    uf = UnidenFile(systems=[system])
+    before = uf.digest()
+    assert system.digest() == system.clone().digest()
+
+    channels[1].name = "Changed"
+    assert uf.digest() != before
+    channels[1].name = "TG 1"
+    assert uf.digest() == before
+
+    group.channels.append(TrunkedChannel(tgid=9, name="New"))
+    assert uf.digest() != before
+
+
+def test_changed_systems():
+    systems = [System(line_prefix="Trunk", value=f"Sys {n}", groups=[TrunkedGroup(name="G", quick_key=1)])
+               for n in range(3)]
+    previous = UnidenFile(systems=systems)
+    current = UnidenFile(systems=[systems[0].clone(), systems[1].clone(value="Renamed"), systems[2]])
+    assert current.changed_systems(previous) == [current.systems[1]]
+
+
+def test_site_frequency_export():
+    assert SiteFrequency.from_text(SITEFREQ_LINE).export() == SITEFREQ_LINE
+
+
+def test_site_frequencies_columns():
+    frequencies = SiteFrequencies([SiteFrequency(frequency=851012500), SiteFrequency(frequency="852000000")])
+    frequencies.append_values(("On", "853000000", "12", "3"))
+    frequencies.append_values(("Off", "0854", "Off", "x"))
+    assert len(frequencies) == 4
+    assert frequencies.hz() == [851012500, 852000000, 853000000]
+    entry = frequencies[2]
+    assert (entry.frequency, entry.unknown_value.value, entry.dmr_lcn, entry.colour) == ("853000000", True, "12", "3")
+    assert frequencies[-1].frequency == "0854"
+    frequencies[0] = SiteFrequency(frequency=851500000)
+    del frequencies[1]
+    assert [entry.frequency for entry in frequencies] == ["851500000", "853000000", "0854"]
+    assert copy.copy(frequencies) == frequencies
+    assert frequencies == list(frequencies)
+    with pytest.raises(ValueError):
+        frequencies.append_values(("Maybe", "1", "Off", "Off"))
+
+
+def test_site_frequencies_string_tables_are_per_container():
+    first = SiteFrequencies()
+    first.append_values(("Off", "851012500", "Srch", "Off"))
+    second = SiteFrequencies()
+    second.append_values(("Off", "852012500", "Off", "Srch"))
+    second.append_values(("On", "853012500", "7", "x"))
+    first.extend(second)
+    assert first.export() == (
+        "T-Freq\t\t\tOff\t851012500\tSrch\tOff\n"
+        "T-Freq\t\t\tOff\t852012500\tOff\tSrch\n"
+        "T-Freq\t\t\tOn\t853012500\t7\tx\n"
+    )
+    assert SiteFrequencies(list(first)) == first
+
+
+def test_site_frequencies_pickle_in_another_process():
+    frequencies = SiteFrequencies()
+    frequencies.append_values(("Off", "851012500", "Srch", "x"))
+    data = pickle.dumps(frequencies)
+    assert pickle.loads(data) == frequencies
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        assert executor.submit(SiteFrequencies.export, frequencies).result() == frequencies.export()
+
+
+def test_site_export_roundtrip_with_frequencies(tmp_path):
+    text = (
+        "TargetModel\tBCDx36HP\nFormatVersion\t1.00\nTrunk\t\t\tP25\n" + SITE_LINE
+        + "BandPlan_P25\t\t" + "\t".join(["0"] * 32) + "\n"
+        + SITEFREQ_LINE + "T-Freq\t\t\tOn\t852012500\t5\t7\n"
+    )
+    path = tmp_path / "sites.hpd"
+    path.write_text(text)
+    uf = UnidenFile.from_file(str(path))
+    assert uf.export() == text
+    assert UnidenFile.from_binary(uf.to_binary()).export() == text
+    site = uf.systems[0].sites[0]
+    assert isinstance(site.frequencies, SiteFrequencies)
+    assert site.clone().frequencies == site.frequencies
+    assert site.clone().frequencies is not site.frequencies
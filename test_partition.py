@@ -0,0 +1,80 @@
+import pytest
+from uniden.objects import Radio, Site, System, TrunkedChannel, TrunkedGroup, UnidenFile
+from uniden.partition import Limits, partition, write_partitions
+
+
+def make_system(name, groups, channels, first_key=1):
+    return System(line_prefix="Trunk", value=name, groups=[
+        TrunkedGroup(name=f"G{g}", quick_key=first_key + g,
+                     channels=[TrunkedChannel(tgid=n, name=f"TG {n}") for n in range(channels)])
+        for g in range(groups)
+    ])
+
+
+def totals(uf):
+    return len(uf.systems), sum(len(s.groups) for s in uf.systems), sum(len(g.channels) for s in uf.systems for g in s.groups)
+
+
+def test_first_fit_decreasing_respects_limits():
+    uf = UnidenFile(systems=[make_system(f"S{n}", 2, size) for n, size in enumerate([30, 10, 25, 5, 20])])
+    limits = Limits(systems=3, groups=100, channels=100)
+    parts = partition(uf, limits)
+    assert [totals(part)[2] for part in parts] == [100, 80]
+    for part in parts:
+        systems, groups, channels = totals(part)
+        assert systems <= 3 and channels <= 100
+        positions = [uf.systems.index(system) for system in part.systems]
+        assert positions == sorted(positions)
+    assert sorted(system.value for part in parts for system in part.systems) == [f"S{n}" for n in range(5)]
+
+
+def test_oversized_system_is_split_by_group():
+    system = make_system("Big", 5, 40)
+    parts = partition(UnidenFile(systems=[system]), Limits(channels=100))
+    assert [totals(part)[2] for part in parts] == [80, 80, 40]
+    assert [part.systems[0].value for part in parts] == ["Big (1)", "Big (2)", "Big (3)"]
+    assert system.value == "Big" and len(system.groups) == 5
+
+
+def test_split_system_with_settings_numbers_only_its_name():
+    system = make_system("County P25\tOff\tP25Standard\tOff", 2, 60)
+    parts = partition(UnidenFile(systems=[system]), Limits(channels=100))
+    assert [part.systems[0].export().splitlines()[0] for part in parts] == [
+        "Trunk\t\t\tCounty P25 (1)\tOff\tP25Standard\tOff", "Trunk\t\t\tCounty P25 (2)\tOff\tP25Standard\tOff",
+    ]
+
+
+def test_parts_sharing_a_file_stay_in_order():
+    system = make_system("Big", 3, 1)
+    for group, size in zip(system.groups, (20, 90, 30)):
+        group.channels = [TrunkedChannel(tgid=n, name=f"TG {n}") for n in range(size)]
+    parts = partition(UnidenFile(systems=[system]), Limits(channels=100))
+    assert [[s.value for s in part.systems] for part in parts] == [["Big (2)"], ["Big (1)", "Big (3)"]]
+
+
+def test_parts_have_their_own_site_and_radio_lists():
+    system = make_system("Big", 2, 60)
+    first, second = (part.systems[0] for part in partition(UnidenFile(systems=[system]), Limits(channels=100)))
+    first.sites.append(Site(value="New"))
+    first.radios.append(Radio(name="Unit", radio_id=1))
+    assert system.sites == [] and system.radios == [] and second.sites == [] and second.radios == []
+
+
+def test_oversized_group_and_quick_key_limits():
+    parts = partition(UnidenFile(systems=[make_system("S", 1, 250)]), Limits(channels=100))
+    assert [part.systems[0].groups[0].name for part in parts] == ["G0 (1)", "G0 (2)", "G0 (3)"]
+    parts = partition(UnidenFile(systems=[make_system("A", 3, 1), make_system("B", 3, 1, first_key=10)]),
+                      Limits(quick_keys=4))
+    assert [len(part.systems[0].groups) for part in parts] == [3, 3]
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        Limits(channels=0)
+
+
+def test_write_partitions(tmp_path):
+    uf = UnidenFile(systems=[make_system(f"S{n}", 1, 60) for n in range(3)])
+    filenames = write_partitions(uf, str(tmp_path / "fav_{}.hpd"), Limits(channels=100))
+    assert [name.rsplit("/", 1)[1] for name in filenames] == ["fav_1.hpd", "fav_2.hpd", "fav_3.hpd"]
+    assert UnidenFile.from_file(filenames[0]).systems[0].value == "S0"
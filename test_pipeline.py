@@ -0,0 +1,104 @@
+import io
+
+import pytest
+from uniden.events import parse, to_line
+from uniden.objects import UnidenFile
+from uniden.pipeline import Pipeline, from_object, radioreference_source, to_object
+
+HPD = (
+    "TargetModel\tBCDx36HP\n"
+    "FormatVersion\t1.00\n"
+    "Trunk\t\t\tP25 System\n"
+    "UnitIds\t\t\tUnit 1\t12345\tOff\tAuto\tOff\tOn\n"
+    "T-Group\t\t\tFire\tOff\t0.000000\t0.000000\t0.0\tCircle\t1\n"
+    "TGID\t\t\tFire Dispatch\tOff\t100\tALL\t3\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "T-Group\t\t\tLaw\tOff\t0.000000\t0.000000\t0.0\tCircle\t2\n"
+    "TGID\t\t\tLaw Tac\tOff\t200\tALL\t7\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "Conventional\t\t\tLocal Freqs\n"
+    "C-Group\t\t\tWeather\tOff\t0.000000\t0.000000\t0.0\tCircle\tOff\tGlobal\n"
+    "C-Freq\t\t\tWeather\tOff\t162550000\tNFM\t\t21\tOff\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\n"
+)
+
+
+def run(pipeline):
+    out = io.StringIO()
+    pipeline.write(out)
+    return out.getvalue()
+
+
+def test_passthrough():
+    assert run(Pipeline(parse(io.StringIO(HPD)))) == HPD
+
+
+def test_filter_group_drops_its_channels():
+    pipeline = Pipeline(parse(io.StringIO(HPD))).filter(lambda r: r.fields[0] != "Fire", "group")
+    output = run(pipeline)
+    assert "Fire" not in output
+    assert "Law Tac" in output
+    assert "Weather" in output
+
+
+def test_filter_system_drops_everything_inside():
+    pipeline = Pipeline(parse(io.StringIO(HPD))).filter(lambda r: r.prefix == "Conventional", "start_system")
+    output = run(pipeline)
+    assert "P25 System" not in output
+    assert "Unit 1" not in output
+    assert "Law Tac" not in output
+    assert "C-Freq" in output
+
+
+def test_map_rename():
+    pipeline = Pipeline(parse(io.StringIO(HPD))).map(
+        lambda r: r._replace(fields=(r.fields[0].upper(),) + r.fields[1:]), "tgid"
+    )
+    output = run(pipeline)
+    assert "FIRE DISPATCH" in output
+    assert "\tFire\t" in output
+
+
+def test_map_objects_retag():
+    def retag(channel):
+        channel.service_type.value = "Law Dispatch"
+        return channel
+
+    pipeline = Pipeline(parse(io.StringIO(HPD))).map_objects(retag, "tgid")
+    records = [r for r in pipeline if r.event == "tgid"]
+    assert [r.fields[4] for r in records] == ["2", "2"]
+
+
+def test_map_objects_without_events_passes_header_records_through():
+    pipeline = Pipeline(parse(io.StringIO(HPD))).map_objects(lambda obj: obj)
+    assert [to_line(record) for record in pipeline] == [to_line(record) for record in parse(io.StringIO(HPD))]
+
+
+def test_to_object_without_record_class():
+    with pytest.raises(ValueError):
+        to_object(next(parse(io.StringIO(HPD))))
+
+
+def test_to_and_from_object():
+    record = list(parse(io.StringIO(HPD)))[5]
+    channel = to_object(record)
+    assert channel.name == "Fire Dispatch"
+    assert from_object(channel) == record
+
+
+def test_write_to_file_roundtrip(tmp_path):
+    path = tmp_path / "out.hpd"
+    Pipeline(parse(io.StringIO(HPD))).write(str(path))
+    assert len(UnidenFile.from_file(str(path)).systems) == 2
+
+
+def test_radioreference_source(tmp_path):
+    csv_path = tmp_path / "rr.csv"
+    csv_path.write_text(
+        "Decimal,Hex,Alpha Tag,Mode,Description,Tag,Category\n"
+        "100,064,Fire Disp,D,Fire Dispatch,Fire Dispatch,Fire\n"
+        "101,065,Fire Tac,D,Fire Tac 1,Fire-Tac,Fire\n"
+        "200,0c8,Law Disp,D,Law Dispatch,Law Dispatch,Law\n",
+        encoding="utf-8-sig",
+    )
+    output = run(Pipeline(radioreference_source(str(csv_path), "County")))
+    assert output.startswith("TargetModel\tBCDx36HP\nFormatVersion\t1.00\nTrunk\t\t\tCounty\n")
+    assert output.count("T-Group") == 2
+    assert output.count("TGID") == 3
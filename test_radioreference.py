@@ -0,0 +1,48 @@
+import pytest
+from radioreference import TrunkedChannelDict, iter_csv
+
+CSV = (
+    "Decimal,Hex,Alpha Tag,Mode,Description,Tag,Category\n"
+    "100,064,Fire Disp,D,Fire Dispatch,Fire Dispatch,Fire\n"
+    "101,065,Fire Tac,D,Fire Tac 1,Fire-Tac,Fire\n"
+    "200,0c8,Law Disp,DE,Law Dispatch,Law Dispatch,Law\n"
+)
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / "rr.csv"
+    path.write_text(text, encoding="utf-8-sig")
+    return str(path)
+
+
+def test_import_csv(tmp_path):
+    channels = TrunkedChannelDict.import_csv(write_csv(tmp_path, CSV))
+    assert list(channels) == [100, 101, 200]
+    channel = channels[200]
+    assert channel.alpha_tag == "Law Disp"
+    assert channel.mode == "DE"
+    assert channel.category == "Law"
+    assert channel.tgid_hex == "0xc8"
+    assert channels[100].category is channels[101].category
+
+
+def test_columns_found_by_name(tmp_path):
+    text = "Category,Tag,Description,Mode,Alpha Tag,Decimal\nFire,Fire Dispatch,Fire Dispatch,D,Fire Disp,100\n"
+    channel, = iter_csv(write_csv(tmp_path, text))
+    assert (channel.tgid, channel.alpha_tag, channel.category) == (100, "Fire Disp", "Fire")
+
+
+def test_missing_column(tmp_path):
+    with pytest.raises(ValueError, match="Category"):
+        list(iter_csv(write_csv(tmp_path, "Decimal,Alpha Tag,Mode,Description,Tag\n")))
+
+
+def test_invalid_tgid(tmp_path):
+    text = "Decimal,Hex,Alpha Tag,Mode,Description,Tag,Category\n100,064,A,D,A,T,C\nabc,0,A,D,A,T,C\n"
+    with pytest.raises(ValueError, match="Line 3 has an invalid TGID"):
+        list(iter_csv(write_csv(tmp_path, text)))
+
+
+def test_short_row(tmp_path):
+    with pytest.raises(ValueError, match="Line 2 has 3 columns"):
+        list(iter_csv(write_csv(tmp_path, "Decimal,Hex,Alpha Tag,Mode,Description,Tag,Category\n100,064,A\n")))
@@ -0,0 +1,49 @@
+from radioreference.batch import csv_files, import_many
+
+HEADER = "Decimal,Hex,Alpha Tag,Mode,Description,Tag,Category\n"
+
+
+def channel_count(channels):
+    return len(channels)
+
+
+def make_files(tmp_path):
+    for n in range(4):
+        rows = "".join(f"{tgid},0,TG {tgid},D,Desc,Fire Dispatch,Fire\n" for tgid in range(n + 1))
+        (tmp_path / f"system_{n}.csv").write_text(HEADER + rows)
+    (tmp_path / "notes.txt").write_text("not a csv")
+    return tmp_path
+
+
+def test_import_directory_in_order(tmp_path):
+    results = import_many(str(make_files(tmp_path)), workers=2)
+    assert [result.file for result in results] == csv_files(str(tmp_path))
+    assert [len(result.value) for result in results] == [1, 2, 3, 4]
+    assert all(result.ok for result in results)
+
+
+def test_errors_are_reported_per_file(tmp_path):
+    make_files(tmp_path)
+    (tmp_path / "system_1.csv").write_text(HEADER + "bad,0,TG,D,Desc,Fire Dispatch,Fire\n")
+    files = csv_files(str(tmp_path)) + [str(tmp_path / "missing.csv")]
+    results = import_many(files, workers=2, processes=False)
+    assert [result.ok for result in results] == [True, False, True, True, False]
+    assert "invalid TGID" in str(results[1].error)
+    assert isinstance(results[4].error, OSError)
+
+
+def test_convert(tmp_path):
+    results = import_many(str(make_files(tmp_path)), convert=channel_count, workers=2)
+    assert [result.value for result in results] == [1, 2, 3, 4]
+
+
+def require_tgid_1(channels):
+    if 1 not in channels:
+        raise TypeError("no TGID 1")
+    return len(channels)
+
+
+def test_convert_errors_are_reported_per_file(tmp_path):
+    results = import_many(str(make_files(tmp_path)), convert=require_tgid_1, workers=2)
+    assert [result.ok for result in results] == [False, True, True, True]
+    assert isinstance(results[0].error, TypeError)
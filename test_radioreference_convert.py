@@ -0,0 +1,59 @@
+from radioreference import TrunkedChannel, TrunkedChannelDict
+from radioreference.convert import csv_to_system, service_type, to_system
+from uniden.objects import UnidenFile
+
+
+def rr(tgid, category, tag="Law Dispatch", mode="D"):
+    return TrunkedChannel(tgid, f"TG {tgid}", mode, "", tag, category)
+
+
+def test_groups_by_category_in_first_seen_order():
+    system = to_system([rr(1, "Law"), rr(2, "Fire"), rr(3, "Law")], "County")
+    assert [(group.name, group.quick_key) for group in system.groups] == [("Law", 1), ("Fire", 2)]
+    assert [channel.tgid for channel in system.groups[0].channels] == [1, 3]
+    assert system.line_prefix == "Trunk"
+
+
+def test_service_types_from_tags():
+    assert service_type("Law Tac").value == "Law-Tac"
+    assert service_type("fire-talk").value == "Fire-Talk"
+    assert service_type("Data").value == "Other"
+    assert service_type("Something New").value == "Other"
+    assert service_type("EMS Dispatch") is not service_type("EMS Dispatch")
+    shared = {}
+    assert service_type("EMS Dispatch", shared) is service_type("ems-dispatch", shared)
+
+
+def test_service_types_are_not_shared_between_systems():
+    first = to_system([rr(1, "Law"), rr(2, "Law")], "First")
+    channel = first.groups[0].channels[0]
+    assert channel.service_type is first.groups[0].channels[1].service_type
+    channel.service_type.value = "Fire Dispatch"
+    assert service_type("Law Dispatch").value == "Law Dispatch"
+    assert to_system([rr(1, "Law")], "Second").groups[0].channels[0].service_type.value == "Law Dispatch"
+
+
+def test_quick_keys_and_encryption():
+    system = to_system([rr(n, f"Cat {n}", mode="DE" if n == 0 else "D") for n in range(101)], "Big")
+    assert system.groups[0].quick_key == 1
+    assert system.groups[98].quick_key == 99
+    assert system.groups[99].quick_key == "Off"
+    assert system.groups[0].channels[0].avoid.value is True
+    assert system.groups[1].channels[0].avoid.value is False
+    assert to_system([rr(1, "Law")], "S", first_quick_key=None).groups[0].quick_key == "Off"
+
+
+def test_csv_to_system_roundtrip(tmp_path):
+    path = tmp_path / "County P25.csv"
+    path.write_text(
+        "Decimal,Hex,Alpha Tag,Mode,Description,Tag,Category\n"
+        "100,064,Fire Disp,D,Fire Dispatch,Fire Dispatch,Fire\n"
+        "200,0c8,Law Tac,D,Law Tac,Law Tac,Law\n"
+    )
+    system = csv_to_system(str(path))
+    assert system.value == "County P25"
+    assert to_system(TrunkedChannelDict.import_csv(str(path)), "County P25").export() == system.export()
+    output = tmp_path / "out.hpd"
+    UnidenFile(systems=[system]).to_file(str(output))
+    loaded = UnidenFile.from_file(str(output)).systems[0]
+    assert loaded.groups[1].channels[0].service_type.value == "Law-Tac"
@@ -0,0 +1,53 @@
+import pytest
+from uniden.objects import Radio, System
+from uniden.roster import RadioRoster, import_csv, iter_csv
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / "units.csv"
+    path.write_text(text)
+    return str(path)
+
+
+def test_read_csv_shares_alerts(tmp_path):
+    path = write_csv(tmp_path, "Unit ID,Alpha Tag,Alert Tone,Alert Volume,Alert Color,Alert Pattern\n"
+                               "1001,Engine 1,,,,\n1002,Engine 2,,,,\n1003,Chief,3,5,Red,Slow Blink\n")
+    radios = list(iter_csv(path))
+    assert [radio.radio_id for radio in radios] == [1001, 1002, 1003]
+    assert radios[0].alert_tone is radios[1].alert_tone
+    assert radios[0].alert_light is radios[1].alert_light
+    assert str(radios[0].alert_tone) == "Off\tAuto" and str(radios[0].alert_light) == "Off\tOn"
+    assert radios[2].export() == "UnitIds\t\t\tChief\t1003\t3\t5\tRed\tSlow Blink\n"
+
+
+def test_missing_id_column(tmp_path):
+    with pytest.raises(ValueError, match="Unit ID"):
+        list(iter_csv(write_csv(tmp_path, "Name\nEngine 1\n")))
+
+
+def test_roster_dedup_and_policy():
+    roster = RadioRoster([Radio("A", 1), Radio("B", 2), Radio("A", 1)])
+    assert len(roster) == 2
+    roster.add(Radio("A renamed", 1))
+    assert roster[1].name == "A renamed"
+    assert list(roster)[0] is roster[1]
+    first = RadioRoster([Radio("A", 1)], policy="first")
+    first.add(Radio("Other", 1))
+    assert first[1].name == "A"
+    with pytest.raises(ValueError):
+        RadioRoster([Radio("A", 1), Radio("B", 1)], policy="error")
+
+
+def test_import_csv_merges_into_system(tmp_path):
+    system = System(line_prefix="Trunk", value="Fleet", radios=[Radio("Old", 1), Radio("Keep", 2)])
+    roster = import_csv(system, write_csv(tmp_path, "Radio ID,Name\n1,New\n3,Added\n"))
+    assert [(radio.radio_id, radio.name) for radio in system.radios] == [(1, "New"), (2, "Keep"), (3, "Added")]
+    assert 3 in roster and roster.get(4) is None
+
+
+def test_alerts_are_not_shared_between_imports(tmp_path):
+    path = write_csv(tmp_path, "Unit ID,Alpha Tag,Alert Color\n1001,Engine 1,Red\n")
+    first, second = next(iter_csv(path)), next(iter_csv(path))
+    first.alert_light.colour = "Blue"
+    assert second.alert_light.colour == "Red"
+    assert first.alert_tone is not second.alert_tone
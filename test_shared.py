@@ -0,0 +1,56 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from uniden.objects import System, TrunkedChannel, TrunkedGroup, UnidenFile
+from uniden.shared import attach, publish
+
+
+def make_file():
+    return UnidenFile(systems=[
+        System(line_prefix="Trunk", value=f"System {i}", groups=[
+            TrunkedGroup(name="G", quick_key=1, channels=[TrunkedChannel(tgid=n, name=f"TG {n}") for n in range(20)]),
+        ])
+        for i in range(3)
+    ])
+
+
+def count_channels(name, index):
+    with attach(name) as view:
+        return len(view[index].groups[0].channels)
+
+
+def test_publish_and_attach():
+    uf = make_file()
+    with publish(uf) as shared:
+        with attach(shared.name) as view:
+            assert len(view) == 3
+            assert view.target_model == "BCDx36HP"
+            assert view[1].value == "System 1"
+            assert view[1] is view.system(1)
+            assert view[-1].value == "System 2"
+            assert view.to_uniden_file().export() == uf.export()
+
+
+def test_system_index_out_of_range():
+    with publish(make_file()) as shared:
+        with attach(shared.name) as view:
+            with pytest.raises(IndexError):
+                view.system(3)
+
+
+def test_attach_from_worker_processes():
+    with publish(make_file()) as shared:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            counts = list(executor.map(count_channels, [shared.name] * 3, range(3)))
+    assert counts == [20, 20, 20]
+
+
+def test_attach_to_other_memory():
+    from multiprocessing.shared_memory import SharedMemory
+    memory = SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError, match="does not hold"):
+            attach(memory.name)
+    finally:
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,71 @@
+from uniden.objects import Site, SiteFrequency, BandPlan, System, UnidenFile
+from uniden.sharing import SharedPool
+
+
+def make_site(name="Site 1"):
+    return Site(value=name, frequencies=[SiteFrequency(frequency=851012500)], bandplan=BandPlan())
+
+
+def make_file():
+    return UnidenFile(systems=[
+        System(line_prefix="Trunk", value=f"System {i}", sites=[make_site()]) for i in range(3)
+    ])
+
+
+def test_share_stores_identical_sites_once():
+    uf = SharedPool().share(make_file())
+    assert uf.systems[0].sites[0] is uf.systems[1].sites[0] is uf.systems[2].sites[0]
+
+
+def test_share_keeps_different_sites_apart_but_shares_band_plan():
+    pool = SharedPool()
+    a = pool.intern_site(make_site("North"))
+    b = pool.intern_site(make_site("South"))
+    assert a is not b
+    assert a.bandplan is b.bandplan
+    assert len(pool.sites) == 2
+    assert len(pool.band_plans) == 1
+
+
+def test_mutable_site_copies_on_write():
+    pool = SharedPool()
+    uf = pool.share(make_file())
+    site = pool.mutable_site(uf.systems[0], 0)
+    site.frequencies.append(SiteFrequency(frequency=852000000))
+    assert not pool.is_shared(site)
+    assert len(uf.systems[1].sites[0].frequencies) == 1
+    assert len(uf.systems[0].sites[0].frequencies) == 2
+    assert pool.mutable_site(uf.systems[0], 0) is site
+
+
+def test_mutable_band_plan_copies_on_write():
+    pool = SharedPool()
+    uf = pool.share(make_file())
+    bandplan = pool.mutable_band_plan(uf.systems[0], 0)
+    bandplan.band_plans[0] = ("1", "2")
+    assert uf.systems[1].sites[0].bandplan.band_plans[0] == (0, 0)
+
+
+def test_shared_sites_export_per_system():
+    uf = make_file()
+    expected = [system.export() for system in uf.systems]
+    SharedPool().share(uf)
+    assert [system.export() for system in uf.systems] == expected
+
+
+def test_share_keeps_sites_with_reordered_frequencies_apart():
+    uf = make_file()
+    uf.systems[1].sites[0].frequencies.append(SiteFrequency(frequency=852000000))
+    uf.systems[2].sites[0].frequencies = [SiteFrequency(frequency=852000000), SiteFrequency(frequency=851012500)]
+    expected = [system.export() for system in uf.systems]
+    SharedPool().share(uf)
+    assert uf.systems[1].sites[0] is not uf.systems[2].sites[0]
+    assert [system.export() for system in uf.systems] == expected
+
+
+def test_mutable_site_has_its_own_frequencies():
+    pool = SharedPool()
+    uf = pool.share(make_file())
+    site = pool.mutable_site(uf.systems[0], 0)
+    site.frequencies[0] = SiteFrequency(frequency=852000000)
+    assert uf.systems[1].sites[0].frequencies.hz() == [851012500]
@@ -0,0 +1,48 @@
+import gzip
+
+from uniden.objects import (
+    ConventionalFrequency, ConventionalGroup, Radio, ServiceType, Site, System, TrunkedChannel, TrunkedGroup, UnidenFile,
+)
+from uniden.stats import band, scan, scan_file, scan_many
+
+
+def make_file():
+    trunk = System(line_prefix="Trunk", value="P25", sites=[Site(value="North")], radios=[Radio("A", 1), Radio("B", 2)],
+                   groups=[TrunkedGroup(name="G", quick_key=1, channels=[
+                       TrunkedChannel(tgid=1, name="A", service_type=ServiceType("Fire Dispatch")),
+                       TrunkedChannel(tgid=2, name="B", service_type=ServiceType("Fire Dispatch")),
+                       TrunkedChannel(tgid=3, name="C", service_type=ServiceType("Law-Tac")),
+                   ])])
+    conventional = System(line_prefix="Conventional", value="County", groups=[ConventionalGroup(name="C", channels=[
+        ConventionalFrequency(name="Ops", freq=154250000, modulation="FM"),
+        ConventionalFrequency(name="Tac", freq=460125000, modulation="FM"),
+        ConventionalFrequency(name="Ham", freq=1296000000, modulation="FM"),
+    ])])
+    return UnidenFile(systems=[trunk, conventional])
+
+
+def test_scan_counts():
+    stats = scan(make_file().export().splitlines(keepends=True))
+    assert (stats.systems, stats.sites, stats.groups, stats.tgids, stats.unit_ids) == (2, 1, 2, 3, 2)
+    assert stats.conventional_frequencies == 3
+    assert stats.service_types == {"3": 2, "7": 1}
+    assert stats.service_type_names() == {"Fire Dispatch": 2, "Law-Tac": 1}
+    assert stats.bands == {"VHF High": 1, "UHF": 1, "Other": 1}
+
+
+def test_band_edges():
+    assert band(806_000_000) == "800/900 MHz"
+    assert band(54_000_000) == "Other"
+    assert band(1) == "Other"
+
+
+def test_scan_many_and_totals(tmp_path):
+    plain = tmp_path / "a.hpd"
+    make_file().to_file(str(plain))
+    compressed = tmp_path / "b.hpd.gz"
+    with gzip.open(compressed, "wt") as output:
+        output.write(make_file().export())
+    assert scan_file(str(compressed)).tgids == 3
+    results = scan_many([str(plain), str(compressed)], workers=2)
+    total = results[0] + results[1]
+    assert total.tgids == 6 and total.bands["UHF"] == 2
@@ -0,0 +1,95 @@
+import pytest
+from uniden.objects import UnidenFile
+from uniden.storage import SQLiteStore
+
+HPD = (
+    "TargetModel\tBCDx36HP\n"
+    "FormatVersion\t1.00\n"
+    "Trunk\t\t\tP25 System\tOff\tP25Standard\n"
+    "DQKs_Status\t\tOn\tOff\n"
+    "UnitIds\t\t\tUnit 1\t12345\tOff\tAuto\tOff\tOn\n"
+    "Site\t\t\tMy Site Info\n"
+    "BandPlan_P25\t\t" + "\t".join("0" for _ in range(32)) + "\n"
+    "T-Freq\t\t\tOff\t851012500\tOff\tOff\n"
+    "T-Freq\t\t\tOn\tSrch\t12\tOff\n"
+    "T-Freq\t\t\tOff\t851512500\tOff\tOff\n"
+    "T-Group\t\t\tFire\tOff\t0.000000\t0.000000\t0.0\tCircle\t1\n"
+    "TGID\t\t\tFire Dispatch\tOff\t100\tALL\t3\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "TGID\t\t\tLaw Tac\tOff\t200\tALL\t7\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\tAny\n"
+    "Conventional\t\t\tLocal Freqs\n"
+    "C-Group\t\t\tWeather\tOff\t0.000000\t0.000000\t0.0\tCircle\tOff\tGlobal\n"
+    "C-Freq\t\t\tWeather\tOff\t162550000\tNFM\t\t21\tOff\t2\t0\tOff\tAuto\tOff\tOn\tOff\tOff\n"
+)
+
+
+@pytest.fixture
+def hpd_file(tmp_path):
+    path = tmp_path / "test.hpd"
+    path.write_text(HPD)
+    return path
+
+
+@pytest.mark.parametrize("batch_size", [1, 5000])
+def test_load_file_and_roundtrip(hpd_file, batch_size):
+    with SQLiteStore(batch_size=batch_size) as store:
+        file_id = store.load_file(hpd_file)
+        assert store.files() == [(file_id, str(hpd_file), "BCDx36HP", "1.00")]
+        assert [row[2:] for row in store.systems(file_id)] == [("Trunk", "P25 System"), ("Conventional", "Local Freqs")]
+        assert store.file(file_id).export() == HPD
+
+
+def test_query_across_files(hpd_file):
+    with SQLiteStore() as store:
+        store.load_file(hpd_file)
+        store.load(UnidenFile.from_file(hpd_file), name="copy")
+        assert store.query("SELECT COUNT(*) FROM files") == [(2,)]
+        rows = store.query("SELECT COUNT(*) FROM channels WHERE number = 100")
+        assert rows == [(2,)]
+        rows = store.query("SELECT name FROM channels WHERE service_type = '7'")
+        assert rows == [("Law Tac",), ("Law Tac",)]
+        assert store.query("SELECT COUNT(*) FROM radios WHERE radio_id = 12345") == [(2,)]
+
+
+def test_site_frequencies(hpd_file):
+    with SQLiteStore() as store:
+        store.load_file(hpd_file)
+        assert store.query("SELECT frequency FROM site_frequencies WHERE frequency > 851100000") == [(851512500,)]
+        assert store.query("SELECT frequency, dmr_lcn FROM site_frequencies WHERE unknown_value = 'On'") == [
+            (None, "12"),
+        ]
+        system_id = store.systems()[0][0]
+        events = [event for event in store.system_events(system_id) if event.event == "site_freq"]
+        assert [event.fields for event in events] == [
+            ("Off", "851012500", "Off", "Off"), ("On", "Srch", "12", "Off"), ("Off", "851512500", "Off", "Off"),
+        ]
+
+
+def test_system_name_column(hpd_file):
+    with SQLiteStore() as store:
+        store.load_file(hpd_file)
+        assert store.query("SELECT fields FROM systems WHERE name = 'P25 System'") == [("P25 System\tOff\tP25Standard",)]
+
+
+def test_to_uniden_file_by_system_id(hpd_file):
+    with SQLiteStore() as store:
+        store.load_file(hpd_file)
+        system_ids = [row[0] for row in store.systems()]
+        uf = store.to_uniden_file(reversed(system_ids))
+        assert [system.value.split("\t")[0] for system in uf.systems] == ["Local Freqs", "P25 System"]
+        assert uf.systems[1].dqk_status.statuses == ["On", "Off"]
+
+
+def test_persists_to_disk(hpd_file, tmp_path):
+    database = tmp_path / "configs.db"
+    with SQLiteStore(database) as store:
+        file_id = store.load_file(hpd_file)
+    with SQLiteStore(database) as store:
+        assert store.file(file_id).export() == HPD
+
+
+def test_missing_ids():
+    with SQLiteStore() as store:
+        with pytest.raises(KeyError):
+            store.file(1)
+        with pytest.raises(KeyError):
+            list(store.system_events(1))
@@ -0,0 +1,101 @@
+from uniden import AlertTone, UnidenBool, ServiceType
+from uniden.objects import (
+    TrunkedChannel, TrunkedGroup, ConventionalFrequency, ConventionalGroup, Site, Radio, System, DQKStatus,
+)
+from uniden.templates import Override, SystemTemplate
+
+
+def make_system():
+    fire = TrunkedGroup(name="Fire", quick_key=1, channels=[
+        TrunkedChannel(tgid=100, name="Fire Dispatch", service_type=ServiceType("Fire Dispatch")),
+        TrunkedChannel(tgid=101, name="Fire Tac", service_type=ServiceType("Fire-Tac")),
+    ])
+    law = TrunkedGroup(name="Law", quick_key=2, channels=[
+        TrunkedChannel(tgid=200, name="Law Tac", service_type=ServiceType("Law-Tac")),
+    ])
+    return System(line_prefix="Trunk", value="County", groups=[fire, law], sites=[Site(value="Site 1")],
+                  radios=[Radio(name="Unit 1", radio_id=1)], dqk_status=DQKStatus(["On", "Off"]))
+
+
+def test_channel_clone_shares_value_objects():
+    ch = TrunkedChannel(tgid=100, name="A")
+    copy = ch.clone(name="B")
+    assert copy is not ch
+    assert copy.name == "B" and ch.name == "A"
+    assert copy.alert_tone is ch.alert_tone
+
+
+def test_slotted_clone():
+    g = TrunkedGroup(name="Fire", quick_key=1, channels=[TrunkedChannel(tgid=1, name="A")])
+    copy = g.clone(name="EMS")
+    assert copy.name == "EMS"
+    assert copy.channels == g.channels and copy.channels is not g.channels
+    r = Radio(name="Unit", radio_id=5).clone(radio_id=6)
+    assert r.radio_id == 6 and r.name == "Unit"
+
+
+def test_conventional_clone():
+    g = ConventionalGroup(name="Wx", channels=[ConventionalFrequency(name="NOAA", freq=162550000, modulation="NFM")])
+    copy = g.clone()
+    assert copy.channels[0] is g.channels[0]
+    assert copy.channels is not g.channels
+
+
+def test_system_clone():
+    system = make_system()
+    copy = system.clone(value="Copy")
+    assert copy.value == "Copy" and system.value == "County"
+    assert copy.groups[0] is not system.groups[0]
+    assert copy.groups[0].channels[0] is system.groups[0].channels[0]
+    assert copy.sites[0] is system.sites[0]
+    assert copy.dqk_status is not system.dqk_status
+    assert copy.export().replace("Copy", "County") == system.export()
+
+
+def test_render_without_overrides_shares_groups():
+    system = make_system()
+    variant = SystemTemplate(system).render(value="Variant")
+    assert variant.value == "Variant"
+    assert variant.groups[0] is system.groups[0]
+
+
+def test_render_copies_dqk_status():
+    system = make_system()
+    variant = SystemTemplate(system).render(value="Variant")
+    variant.dqk_status.statuses[0] = "Off"
+    assert system.dqk_status.statuses == ["On", "Off"]
+
+
+def test_render_applies_channel_overrides():
+    system = make_system()
+    law_tac = Override(channel_fields={"delay": 0, "alert_tone": AlertTone((3, 5))},
+                       where=lambda ch: ch.service_type.value == "Law-Tac")
+    variant = SystemTemplate(system).render([law_tac])
+    assert variant.groups[0] is system.groups[0]
+    assert variant.groups[1].channels[0].delay == 0
+    assert str(variant.groups[1].channels[0].alert_tone) == "3\t5"
+    assert system.groups[1].channels[0].delay == 2
+
+
+def test_render_reuses_untouched_channels():
+    system = make_system()
+    variant = SystemTemplate(system).render([Override(channel_fields={"delay": 5}, where=lambda ch: ch.tgid == 100)])
+    assert variant.groups[0].channels[0] is not system.groups[0].channels[0]
+    assert variant.groups[0].channels[1] is system.groups[0].channels[1]
+
+
+def test_render_group_fields():
+    system = make_system()
+    variant = SystemTemplate(system).render([Override(group_fields={"avoid": UnidenBool(True)}, group="Fire")])
+    assert str(variant.groups[0].avoid) == "On"
+    assert str(system.groups[0].avoid) == "Off"
+    assert variant.groups[0].channels[0] is system.groups[0].channels[0]
+
+
+def test_render_many():
+    template = SystemTemplate(make_system())
+    variants = list(template.render_many(
+        ([Override(channel_fields={"delay": delay})], {"value": f"Customer {delay}"}) for delay in range(3)
+    ))
+    assert [v.value for v in variants] == ["Customer 0", "Customer 1", "Customer 2"]
+    assert variants[2].groups[0].channels[0].delay == 2
@@ -1,6 +1,101 @@
+import hashlib
 from dataclasses import dataclass
 
 
+def clone_object(obj, **changes):
+    """
+    Makes a shallow copy of an object without running its __init__, then sets any changed attributes on the copy.
+    Attribute values are shared with the original, so they should be replaced rather than modified in place.
+    """
+    cls = type(obj)
+    new = object.__new__(cls)
+    if hasattr(obj, "__dict__"):
+        new.__dict__.update(obj.__dict__)
+    for name in _slot_names(cls):
+        object.__setattr__(new, name, getattr(obj, name))
+    for name, value in changes.items():
+        setattr(new, name, value)
+    return new
+
+
+def build_object(cls, **values):
+    """
+    Makes an object from a value for every one of its fields without running its __init__ or __setattr__, so parsers
+    creating thousands of records don't pay for ExportCache invalidating caches that don't exist yet on each field.
+    Values are used as given, with no defaults or conversion.
+    """
+    new = object.__new__(cls)
+    if hasattr(new, "__dict__"):
+        new.__dict__.update(values)
+    else:
+        for name, value in values.items():
+            object.__setattr__(new, name, value)
+    object.__setattr__(new, "_export_cache", None)
+    object.__setattr__(new, "_digest_cache", None)
+    return new
+
+
+def _slot_names(cls):
+    try:
+        return cls.__dict__["_clone_slots"]
+    except KeyError:
+        names = tuple(name for base in cls.__mro__ for name in base.__dict__.get("__slots__", ())
+                      if name not in ("__dict__", "__weakref__"))
+        cls._clone_slots = names
+        return names
+
+
+def content_digest(*parts) -> bytes:
+    """
+    Hashes text and child digests into a 16 byte digest that's the same across interpreter runs.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else part)
+        digest.update(b"\x1f")
+    return digest.digest()
+
+
+class ExportCache:
+    """
+    Mixin which keeps the text an object last exported and its content digest, and throws both away whenever one of the
+    object's attributes is assigned. Values held by the object (alert tones, service types etc.) aren't watched, so call
+    invalidate() after changing one of those in place.
+    """
+    __slots__ = ("_export_cache", "_digest_cache")
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_export_cache" and name != "_digest_cache":
+            object.__setattr__(self, "_export_cache", None)
+            object.__setattr__(self, "_digest_cache", None)
+
+    def invalidate(self):
+        object.__setattr__(self, "_export_cache", None)
+        object.__setattr__(self, "_digest_cache", None)
+
+    def digest(self) -> bytes:
+        """
+        A hash of everything the object exports. Equal digests mean identical exported text.
+        """
+        if self._digest_cache is None:
+            self._digest_cache = content_digest(self.export())
+        return self._digest_cache
+
+    def _tree_digest(self, header: str, children: tuple) -> bytes:
+        """
+        Digest for objects with children, built from their own line and their children's digests. Child lists can be
+        changed in place without an attribute being assigned, so the child digests are compared on every call, but the
+        hash is only recalculated when something has actually changed.
+        """
+        cache = self._digest_cache
+        if cache is not None and cache[0] == children:
+            return cache[1]
+        digest = content_digest(header, *children)
+        self._digest_cache = (children, digest)
+        return digest
+
+
 class UnidenBool:
     """
     Stores and returns a Uniden boolean value of On or Off.
@@ -128,3 +223,7 @@ class UnidenTextType:
         else:
             raise TypeError(f"Text does not match {cls.__name__} type")
         return cls(text)
+
+    @classmethod
+    def from_values(cls, values):
+        return cls("\t".join(values))
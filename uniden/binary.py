@@ -0,0 +1,119 @@
+import sys
+import zlib
+from array import array
+from struct import Struct
+from typing import Iterable, Iterator
+
+from .events import EVENTS, Event
+
+MAGIC = b"UHPD"
+VERSION = 1
+# Magic, version, index width in bytes, string count, record count, field count
+HEADER = Struct("<4sBBIII")
+
+# Record codes. New prefixes must only ever be added to the end, or older files will decode wrongly.
+PREFIXES = (
+    "TargetModel",
+    "FormatVersion",
+    "Trunk",
+    "Conventional",
+    "DQKs_Status",
+    "UnitIds",
+    "Site",
+    "BandPlan_P25",
+    "T-Freq",
+    "T-Group",
+    "C-Group",
+    "TGID",
+    "C-Freq",
+)
+CODES = {prefix: code for code, prefix in enumerate(PREFIXES)}
+END_SYSTEM = len(PREFIXES)
+
+# .hpd text can't contain NUL, so it's safe to separate the string table with it
+SEPARATOR = "\x00"
+
+
+def _index_array(width: int, values=()) -> array:
+    typecode = "H" if width == 2 else "I"
+    if array(typecode).itemsize != width:
+        typecode = "L"
+    return array(typecode, values)
+
+
+def _to_little_endian(index_array: array) -> array:
+    if sys.byteorder == "big":
+        index_array.byteswap()
+    return index_array
+
+
+def encode(events: Iterable[Event], level: int = 6) -> bytes:
+    """
+    Packs a stream of events into the binary format.
+    Each distinct field value is stored once in a string table, and records are stored as columns: a byte per record
+    for its type, a byte for its field count, and a fixed width index into the string table for each field. The columns
+    are then compressed together, which squeezes the repeated index patterns of similar records down to very little.
+    """
+    strings = {}
+    codes = bytearray()
+    counts = bytearray()
+    indexes = []
+    for event, prefix, fields in events:
+        if event == "end_system":
+            codes.append(END_SYSTEM)
+            counts.append(0)
+            continue
+        codes.append(CODES[prefix])
+        counts.append(len(fields))
+        for value in fields:
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            indexes.append(index)
+
+    width = 2 if len(strings) <= 0xffff else 4
+    index_array = _index_array(width, indexes)
+    body = SEPARATOR.join(strings).encode() + bytes(codes) + bytes(counts) + _to_little_endian(index_array).tobytes()
+    header = HEADER.pack(MAGIC, VERSION, width, len(strings), len(codes), len(indexes))
+    return header + zlib.compress(body, level)
+
+
+def decode(data: bytes) -> Iterator[Event]:
+    """
+    Unpacks the binary format back into the events it was made from.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Data is too short to be a binary config")
+    magic, version, width, string_count, record_count, field_count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Data is not a binary config")
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary config version {version}")
+
+    body = zlib.decompress(data[HEADER.size:])
+    index_size = field_count * width
+    index_start = len(body) - index_size
+    counts_start = index_start - record_count
+    codes_start = counts_start - record_count
+    strings = body[:codes_start].decode().split(SEPARATOR) if string_count else []
+    codes = body[codes_start:counts_start]
+    counts = body[counts_start:index_start]
+    index_array = _index_array(width)
+    index_array.frombytes(body[index_start:])
+    _to_little_endian(index_array)
+    values = [strings[index] for index in index_array]
+
+    prefixes = PREFIXES
+    events = EVENTS
+    system = None
+    position = 0
+    for code, count in zip(codes, counts):
+        if code == END_SYSTEM:
+            yield Event("end_system", system, ())
+            continue
+        prefix = prefixes[code]
+        event = events[prefix]
+        if event == "start_system":
+            system = prefix
+        yield Event(event, prefix, tuple(values[position:position + count]))
+        position += count
@@ -0,0 +1,145 @@
+from typing import Callable
+
+from .objects import ConventionalFrequency, ConventionalGroup, ServiceType, System, TrunkedGroup
+
+
+def channels_of(target) -> list:
+    """
+    Collects the channels of a system, a group, or a list of either into a single list.
+    """
+    if isinstance(target, System):
+        return [channel for group in target.groups for channel in group.channels]
+    if isinstance(target, TrunkedGroup | ConventionalGroup):
+        return list(target.channels)
+    return [channel for item in target for channel in channels_of(item)]
+
+
+def groups_of(target) -> list:
+    if isinstance(target, System):
+        return list(target.groups)
+    if isinstance(target, TrunkedGroup | ConventionalGroup):
+        return [target]
+    return [group for item in target for group in groups_of(item)]
+
+
+def service_type_is(*names: str | int) -> Callable:
+    """
+    Returns a predicate matching channels with any of the given service types, by name or index.
+    """
+    indexes = {ServiceType(name).index for name in names}
+    return lambda channel: channel.service_type.index in indexes
+
+
+def select(target, where: Callable | None = None) -> list:
+    channels = channels_of(target)
+    if where is None:
+        return channels
+    return [channel for channel in channels if where(channel)]
+
+
+def set_where(target, where: Callable | None = None, **fields) -> list:
+    """
+    Sets the given fields on every channel matching the predicate and returns the channels changed.
+    The selection is made once and each field is then written across the whole selection.
+    """
+    selected = select(target, where)
+    for name, value in fields.items():
+        for channel in selected:
+            setattr(channel, name, value)
+    return selected
+
+
+def adjust_where(target, where: Callable | None = None, **offsets) -> list:
+    """
+    Adds the given offsets to numeric fields (delay, volume_offset etc.) on every channel matching the predicate.
+    """
+    selected = select(target, where)
+    for name, offset in offsets.items():
+        for channel in selected:
+            setattr(channel, name, int(getattr(channel, name)) + offset)
+    return selected
+
+
+def reassign_service_type(target, old: str | int, new: str | int) -> list:
+    """
+    Moves every channel of one service type to another. All the changed channels share one ServiceType instance.
+    """
+    service_type = ServiceType(new)
+    return set_where(target, service_type_is(old), service_type=service_type)
+
+
+def shift_frequencies(target, offset: int, where: Callable | None = None) -> list:
+    """
+    Moves conventional channels by the given offset in Hz.
+    """
+    selected = [channel for channel in select(target, where) if isinstance(channel, ConventionalFrequency)]
+    for channel in selected:
+        channel.freq = int(channel.freq) + offset
+    return selected
+
+
+def renumber_quick_keys(target, start: int = 0, step: int = 1) -> list:
+    """
+    Gives each group a sequential quick key in the order they appear.
+    """
+    groups = groups_of(target)
+    for number, group in enumerate(groups):
+        group.quick_key = start + number * step
+    return groups
+
+
+class Batch:
+    """
+    Queues bulk operations and applies them together when the batch is committed, or when a with block exits without an
+    exception. Callbacks registered with on_commit() run once per commit with the list of objects changed, so indexes
+    and caches built over the channels only need rebuilding once per batch rather than once per change.
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self.operations = []
+        self.callbacks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.operations.clear()
+
+    def on_commit(self, callback: Callable[[list], None]):
+        self.callbacks.append(callback)
+
+    def _queue(self, operation, *args, **kwargs):
+        self.operations.append((operation, args, kwargs))
+        return self
+
+    def set_where(self, where: Callable | None = None, **fields):
+        return self._queue(set_where, where, **fields)
+
+    def adjust_where(self, where: Callable | None = None, **offsets):
+        return self._queue(adjust_where, where, **offsets)
+
+    def reassign_service_type(self, old: str | int, new: str | int):
+        return self._queue(reassign_service_type, old, new)
+
+    def shift_frequencies(self, offset: int, where: Callable | None = None):
+        return self._queue(shift_frequencies, offset, where)
+
+    def renumber_quick_keys(self, start: int = 0, step: int = 1):
+        return self._queue(renumber_quick_keys, start, step)
+
+    def commit(self) -> list:
+        changed = []
+        seen = set()
+        for operation, args, kwargs in self.operations:
+            for item in operation(self.target, *args, **kwargs):
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    changed.append(item)
+        self.operations.clear()
+        for callback in self.callbacks:
+            callback(changed)
+        return changed
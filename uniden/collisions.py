@@ -0,0 +1,131 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, NamedTuple
+
+from .objects import ConventionalFrequency, TrunkedChannel, UnidenFile
+
+
+class Occurrence(NamedTuple):
+    """
+    Where a channel was found. source is the file's label - its name if files were passed in a dict, otherwise its
+    position.
+    """
+    source: object
+    system: str
+    group: str
+    channel: TrunkedChannel | ConventionalFrequency
+
+
+@dataclass
+class Finding:
+    kind: str
+    key: object
+    occurrences: list[Occurrence]
+
+    @property
+    def systems(self) -> set:
+        return {(occurrence.source, occurrence.system) for occurrence in self.occurrences}
+
+
+@dataclass
+class CollisionReport:
+    """
+    reused - TGIDs or frequencies that appear in more than one system.
+    conflicting_names - the same TGID or frequency with different channel names.
+    conflicting_settings - the same TGID or frequency and name, but different settings (delay, service type etc.).
+    near_duplicates - conventional frequencies closer together than the tolerance, keyed by the pair of frequencies.
+    """
+    reused: list[Finding] = field(default_factory=list)
+    conflicting_names: list[Finding] = field(default_factory=list)
+    conflicting_settings: list[Finding] = field(default_factory=list)
+    near_duplicates: list[Finding] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.reused or self.conflicting_names or self.conflicting_settings or self.near_duplicates)
+
+    def lines(self) -> Iterator[str]:
+        """
+        A plain text summary, one finding per line.
+        """
+        for title, findings in (
+                ("Reused", self.reused),
+                ("Conflicting names", self.conflicting_names),
+                ("Conflicting settings", self.conflicting_settings),
+                ("Near duplicates", self.near_duplicates)):
+            for finding in findings:
+                places = ", ".join(
+                    f"{occurrence.system}/{occurrence.group} ({occurrence.channel.name})"
+                    for occurrence in finding.occurrences
+                )
+                yield f"{title}: {finding.kind} {finding.key} - {places}"
+
+
+def _labelled(sources) -> Iterable[tuple[object, UnidenFile]]:
+    if isinstance(sources, UnidenFile):
+        return [(0, sources)]
+    if isinstance(sources, dict):
+        return sources.items()
+    return enumerate(sources)
+
+
+def _settings(channel) -> str:
+    """
+    A channel's exported fields apart from its name.
+    """
+    return channel.export().split("\t", 4)[4]
+
+
+def index_channels(sources) -> dict[tuple, list[Occurrence]]:
+    """
+    Indexes every channel by ("tgid", TGID) or ("frequency", Hz) in a single pass over the files.
+    """
+    index = defaultdict(list)
+    for source, uniden_file in _labelled(sources):
+        for system in uniden_file.systems:
+            for group in system.groups:
+                for channel in group.channels:
+                    if isinstance(channel, TrunkedChannel):
+                        key = ("tgid", int(channel.tgid))
+                    else:
+                        key = ("frequency", int(channel.freq))
+                    index[key].append(Occurrence(source, system.value, group.name, channel))
+    return index
+
+
+def collision_report(sources, tolerance: int = 0) -> CollisionReport:
+    """
+    Checks one UnidenFile, or a list or dict of them, for channels that clash with each other. Each channel is indexed
+    once and each group of channels sharing a TGID or frequency is then checked once, so the work grows with the
+    number of channels rather than the number of pairs of them.
+    Set tolerance (in Hz) to also report conventional frequencies that are close together but not equal.
+    """
+    index = index_channels(sources)
+    report = CollisionReport()
+    for (kind, key), occurrences in index.items():
+        if len(occurrences) < 2:
+            continue
+        finding = Finding(kind, key, occurrences)
+        if len(finding.systems) > 1:
+            report.reused.append(finding)
+        names = {occurrence.channel.name.strip().casefold() for occurrence in occurrences}
+        if len(names) > 1:
+            report.conflicting_names.append(finding)
+        else:
+            settings = {_settings(occurrence.channel) for occurrence in occurrences}
+            if len(settings) > 1:
+                report.conflicting_settings.append(finding)
+
+    if tolerance > 0:
+        # Frequencies are bucketed by the tolerance, so only neighbouring buckets need comparing
+        frequencies = sorted(key for kind, key in index if kind == "frequency")
+        buckets = defaultdict(list)
+        for frequency in frequencies:
+            buckets[frequency // tolerance].append(frequency)
+        for frequency in frequencies:
+            bucket = frequency // tolerance
+            for other in (*buckets[bucket], *buckets.get(bucket + 1, ())):
+                if frequency < other <= frequency + tolerance:
+                    report.near_duplicates.append(Finding(
+                        "frequency", (frequency, other), index["frequency", frequency] + index["frequency", other]
+                    ))
+    return report
@@ -0,0 +1,61 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+
+BUFFER_SIZE = 1 << 20
+
+OPENERS = {
+    "gzip": gzip.open,
+    "xz": lzma.open,
+    "bz2": bz2.open,
+}
+MAGIC_BYTES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"BZh", "bz2"),
+)
+EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".xz": "xz",
+    ".bz2": "bz2",
+}
+
+
+def detect(filename, mode: str = "r") -> str | None:
+    """
+    Works out how a file is compressed. Existing files being read are identified by their first few bytes, so a
+    misleading extension doesn't matter. Files being written go by their extension.
+    """
+    if "r" in mode:
+        with open(filename, 'rb') as config_file:
+            start = config_file.read(6)
+        for magic, compression in MAGIC_BYTES:
+            if start.startswith(magic):
+                return compression
+        return None
+    return EXTENSIONS.get(os.path.splitext(os.fspath(filename))[1].lower())
+
+
+def open_config(filename, mode: str = "r", compression: str | None = None, encoding: str | None = None):
+    """
+    Opens a config file as text, transparently decompressing or compressing gzip, xz and bz2 files as they're read or
+    written. Pass compression to override detection - "gzip", "xz", "bz2", or "none".
+    """
+    if compression is None:
+        compression = detect(filename, mode)
+    if compression in (None, "none"):
+        return open(filename, mode, buffering=BUFFER_SIZE, encoding=encoding)
+    try:
+        opener = OPENERS[compression]
+    except KeyError:
+        raise ValueError(f"Unknown compression type: {compression}") from None
+    binary_mode = mode.replace("t", "") + "b"
+    raw = opener(filename, binary_mode)
+    if "r" in mode:
+        stream = io.BufferedReader(raw, BUFFER_SIZE)
+    else:
+        stream = io.BufferedWriter(raw, BUFFER_SIZE)
+    return io.TextIOWrapper(stream, encoding=encoding)
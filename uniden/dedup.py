@@ -0,0 +1,187 @@
+import hashlib
+from dataclasses import replace
+
+from .objects import ConventionalFrequency, Radio, Site, System, TrunkedChannel, UnidenFile
+
+
+def stable_hash(*parts) -> str:
+    """
+    Hashes the text form of the given parts. Unlike hash() the result is the same across interpreter runs, so it can be
+    stored or compared between processes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def system_key(system: System):
+    return system.line_prefix, system.value
+
+
+def group_key(group):
+    return group.line_prefix, group.name
+
+
+def channel_key(channel: TrunkedChannel | ConventionalFrequency):
+    """
+    The identity of a channel - TGID for trunked channels and frequency for conventional ones, matching their __eq__.
+    """
+    if isinstance(channel, TrunkedChannel):
+        return channel.line_prefix, int(channel.tgid)
+    return channel.line_prefix, int(channel.freq)
+
+
+def channel_fingerprint(channel: TrunkedChannel | ConventionalFrequency | Radio) -> bytes:
+    return channel.digest()
+
+
+def site_fingerprint(site: Site) -> str:
+    """
+    Fingerprints a site by its frequencies and band plan only, so the same site listed under different names still
+    matches. Both are taken as exported text, with the T-Freq lines sorted, so sites that export the same match however
+    their values were built.
+    """
+    band_plan = site.bandplan.export() if site.bandplan else ""
+    return stable_hash(band_plan, *sorted(site.frequencies.export().splitlines()))
+
+
+def resolve_conflict(existing, new, policy):
+    """
+    Picks which of two records with the same identity but different settings to keep.
+    Policies are "first", "last" and "error", or a callable taking (existing, new) and returning the record to keep.
+    A callable is given two channels, radios, groups, sites or DQKStatus objects, always of the same type.
+    """
+    if callable(policy):
+        return policy(existing, new)
+    match policy:
+        case "first":
+            return existing
+        case "last":
+            return new
+        case "error":
+            raise ValueError(f"Conflicting duplicate entries found: {existing!r} and {new!r}")
+        case _:
+            raise ValueError(f"Unknown conflict policy: {policy}")
+
+
+class _Collapser:
+    """
+    Keeps the first record seen for each key in insertion order, and runs the conflict policy when a later record with
+    the same key has a different fingerprint.
+    """
+
+    def __init__(self, key, fingerprint, policy):
+        self.key = key
+        self.fingerprint = fingerprint
+        self.policy = policy
+        self.records = {}
+
+    def add(self, record):
+        key = self.key(record)
+        if key not in self.records:
+            self.records[key] = (record, None)
+            return record
+        existing, existing_fingerprint = self.records[key]
+        if existing_fingerprint is None:
+            existing_fingerprint = self.fingerprint(existing)
+        new_fingerprint = self.fingerprint(record)
+        if new_fingerprint == existing_fingerprint:
+            self.records[key] = (existing, existing_fingerprint)
+            return existing
+        kept = resolve_conflict(existing, record, self.policy)
+        self.records[key] = (kept, existing_fingerprint if kept is existing else new_fingerprint)
+        return kept
+
+    def values(self):
+        return [record for record, _ in self.records.values()]
+
+
+class _SiteCollapser(_Collapser):
+    """
+    Sites are keyed by their fingerprint, so the conflict to resolve is a differing site line.
+    """
+
+    def __init__(self, policy):
+        super().__init__(site_fingerprint, lambda site: site.value, policy)
+
+
+class _GroupMerger:
+    """
+    Merges the groups with one type and name: the group settings kept, plus the channels of all of them.
+    """
+
+    def __init__(self, group, policy):
+        self.source = group
+        self.merged = replace(group, channels=[])
+        self.channels = _Collapser(channel_key, channel_fingerprint, policy)
+        self.policy = policy
+
+    def add(self, group):
+        if group is not self.source and group.header() != self.merged.header():
+            kept = resolve_conflict(self.source, group, self.policy)
+            if kept is not self.source:
+                self.source = kept
+                self.merged = replace(kept, channels=[])
+        for channel in group.channels:
+            self.channels.add(channel)
+
+    def result(self):
+        self.merged.channels = self.channels.values()
+        return self.merged
+
+
+class _SystemMerger:
+    """
+    Merges the systems with one type and name, collapsing their groups, sites and radios.
+    """
+
+    def __init__(self, system, policy):
+        self.merged = replace(system, groups=[], sites=[], radios=[], dqk_status=None)
+        self.groups = {}
+        self.sites = _SiteCollapser(policy)
+        self.radios = _Collapser(lambda radio: radio.radio_id, channel_fingerprint, policy)
+        self.policy = policy
+
+    def add(self, system):
+        merged = self.merged
+        if merged.dqk_status is None:
+            merged.dqk_status = system.dqk_status
+        elif system.dqk_status is not None and system.dqk_status != merged.dqk_status:
+            merged.dqk_status = resolve_conflict(merged.dqk_status, system.dqk_status, self.policy)
+        for radio in system.radios:
+            self.radios.add(radio)
+        for site in system.sites:
+            self.sites.add(site)
+        for group in system.groups:
+            key = group_key(group)
+            if key not in self.groups:
+                self.groups[key] = _GroupMerger(group, self.policy)
+            self.groups[key].add(group)
+
+    def result(self):
+        self.merged.radios = self.radios.values()
+        self.merged.sites = self.sites.values()
+        self.merged.groups = [group.result() for group in self.groups.values()]
+        return self.merged
+
+
+def dedupe(uniden_file: UnidenFile, policy="first") -> UnidenFile:
+    """
+    Collapses duplicate systems, sites, groups, channels and radios in a single pass over the file.
+    Systems and groups are matched by type and name, channels by TGID or frequency, radios by ID and sites by their
+    frequencies and band plan. Duplicates whose settings differ - including system DQK statuses and group quick keys,
+    ranges and other group settings - are resolved with the given conflict policy.
+    The channel, site and radio objects kept are shared with the original file rather than copied.
+    """
+    systems = {}
+    for system in uniden_file.systems:
+        key = system_key(system)
+        if key not in systems:
+            systems[key] = _SystemMerger(system, policy)
+        systems[key].add(system)
+
+    deduped = UnidenFile(target_model=uniden_file.target_model, format_version=uniden_file.format_version)
+    deduped.systems = [merger.result() for merger in systems.values()]
+    return deduped
@@ -0,0 +1,103 @@
+from typing import Iterable, Iterator, NamedTuple
+
+from .compression import open_config
+
+# Maps each record's line prefix to the event it fires
+EVENTS = {
+    "TargetModel": "target_model",
+    "FormatVersion": "format_version",
+    "Trunk": "start_system",
+    "Conventional": "start_system",
+    "DQKs_Status": "dqk_status",
+    "UnitIds": "unit_id",
+    "Site": "site",
+    "BandPlan_P25": "bandplan",
+    "T-Freq": "site_freq",
+    "T-Group": "group",
+    "C-Group": "group",
+    "TGID": "tgid",
+    "C-Freq": "cfreq",
+}
+
+# Number of tabs between the line prefix and the first field, for the records that don't use 3
+TABS = {
+    "TargetModel": 1,
+    "FormatVersion": 1,
+    "DQKs_Status": 2,
+    "BandPlan_P25": 2,
+}
+
+
+class Event(NamedTuple):
+    """
+    A single record from a .hpd file. fields holds the tab separated values after the line prefix, as strings.
+    """
+    event: str
+    prefix: str
+    fields: tuple
+
+
+def parse(lines: Iterable[str]) -> Iterator[Event]:
+    """
+    Reads .hpd lines one at a time and yields an Event for each, without building any objects.
+    An end_system event is added after the last record of each system.
+    """
+    events = EVENTS
+    tabs = TABS
+    system = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line:
+            continue
+        values = line.split("\t")
+        prefix = values[0]
+        event = events.get(prefix)
+        if event is None:
+            raise ValueError(f"Unknown entry type found in config file:\r\n{line}")
+        if event == "start_system":
+            if system is not None:
+                yield Event("end_system", system, ())
+            system = prefix
+        yield Event(event, prefix, tuple(values[tabs.get(prefix, 3):]))
+    if system is not None:
+        yield Event("end_system", system, ())
+
+
+def parse_file(filename, compression: str | None = None) -> Iterator[Event]:
+    with open_config(filename, 'r', compression) as config_file:
+        yield from parse(config_file)
+
+
+def dispatch(events: Iterable[Event], handler):
+    """
+    Calls the handler method named after each event with its prefix and fields. Events the handler has no method for
+    are skipped.
+    """
+    callbacks = {}
+    for event, prefix, fields in events:
+        try:
+            callback = callbacks[event]
+        except KeyError:
+            callback = callbacks[event] = getattr(handler, event, None)
+        if callback is not None:
+            callback(prefix, fields)
+    return handler
+
+
+def tree_events(uniden_file) -> Iterator[Event]:
+    """
+    Yields the events for an already loaded UnidenFile, one system at a time.
+    """
+    yield Event("target_model", "TargetModel", (uniden_file.target_model.rstrip(),))
+    yield Event("format_version", "FormatVersion", (uniden_file.format_version.rstrip(),))
+    for system in uniden_file.systems:
+        yield from parse(system.export().splitlines())
+
+
+def to_line(event: Event) -> str:
+    """
+    Turns an event back into its .hpd line. end_system events have no line and return an empty string.
+    """
+    if event.event == "end_system":
+        return ""
+    return event.prefix + "\t" * TABS.get(event.prefix, 3) + "\t".join(event.fields) + "\n"
@@ -0,0 +1,190 @@
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+from .objects import UnidenFile
+
+INDEX_FILENAME = "f_list.cfg"
+# Used for reading and writing both the index and the list files, whatever the locale
+ENCODING = "utf-8"
+LIST_PREFIX = "F-List"
+# Settings written for new lists after their name and filename: location control, monitor, quick key, number tag
+DEFAULT_SETTINGS = ("Off", "On", "Off", "Off")
+
+
+@dataclass
+class FavoritesList:
+    """
+    One favorites list: its entry in f_list.cfg and the config in its .hpd file. settings holds the entry's fields after
+    the filename, kept as read so they're written back unchanged.
+    """
+    name: str
+    config: UnidenFile = field(default_factory=UnidenFile)
+    filename: str | None = None
+    settings: tuple = DEFAULT_SETTINGS
+
+    def index_line(self) -> str:
+        return "\t".join((LIST_PREFIX, self.name, self.filename, *self.settings)) + "\n"
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _file_digest(path) -> bytes | None:
+    try:
+        with open(path, 'rb') as existing:
+            return _digest(existing.read())
+    except FileNotFoundError:
+        return None
+
+
+def _write_if_changed(path, data: bytes) -> bool:
+    """
+    Writes the data unless the file already holds exactly the same bytes. Returns whether it was written.
+    """
+    if _file_digest(path) == _digest(data):
+        return False
+    _write_atomic(path, data)
+    return True
+
+
+def _new_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# mkstemp creates files readable only by their owner, so written files are given the mode a plain open() would use.
+# The umask can only be read by changing it, so that's done once here rather than from the writer threads.
+NEW_FILE_MODE = _new_file_mode()
+
+
+def _sync_directory(directory):
+    """
+    Flushes a rename in the directory to disk, where the platform allows directories to be opened and synced.
+    """
+    try:
+        handle = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(handle)
+    except OSError:
+        pass
+    finally:
+        os.close(handle)
+
+
+def _write_atomic(path, data: bytes):
+    """
+    Writes to a temporary file in the same directory, syncs it to disk and renames it over the target, so the target is
+    never left half written. Existing files keep their mode, new ones get the mode the umask allows.
+    """
+    directory, name = os.path.split(path)
+    directory = directory or "."
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = NEW_FILE_MODE
+    handle, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    _sync_directory(directory)
+
+
+class FavoritesTree:
+    """
+    A scanner's favorites lists directory: the f_list.cfg index plus one .hpd file per list.
+    Writing only touches lists whose content has changed since they were read or last written, or that differ from what
+    is already on disk, and writes them in parallel.
+    """
+
+    def __init__(self, lists: list[FavoritesList] | None = None, target_model: str = "BCDx36HP",
+                 format_version: str = "1.00"):
+        self.lists = lists if lists is not None else []
+        self.target_model = target_model
+        self.format_version = format_version
+        # Digest of each list's config when it was last read or written, by path
+        self.saved = {}
+
+    def add(self, name: str, config: UnidenFile, settings: tuple = DEFAULT_SETTINGS) -> FavoritesList:
+        favorites_list = FavoritesList(name, config, settings=settings)
+        self.lists.append(favorites_list)
+        return favorites_list
+
+    def _assign_filenames(self):
+        used = {favorites_list.filename for favorites_list in self.lists if favorites_list.filename}
+        number = 1
+        for favorites_list in self.lists:
+            if not favorites_list.filename:
+                while f"f_{number:06}.hpd" in used:
+                    number += 1
+                favorites_list.filename = f"f_{number:06}.hpd"
+                used.add(favorites_list.filename)
+
+    def index(self) -> str:
+        header = f"TargetModel\t{self.target_model.rstrip()}\nFormatVersion\t{self.format_version.rstrip()}\n"
+        return header + "".join(favorites_list.index_line() for favorites_list in self.lists)
+
+    @classmethod
+    def read(cls, directory, workers: int | None = None) -> 'FavoritesTree':
+        """
+        Loads the index and every list it names, reading the list files in parallel.
+        """
+        tree = cls()
+        entries = []
+        with open(os.path.join(directory, INDEX_FILENAME), encoding=ENCODING) as index_file:
+            for line in index_file:
+                values = line.rstrip("\r\n").split("\t")
+                if values[0] == "TargetModel":
+                    tree.target_model = values[1]
+                elif values[0] == "FormatVersion":
+                    tree.format_version = values[1]
+                elif values[0] == LIST_PREFIX:
+                    if len(values) < 3:
+                        raise ValueError(f"Invalid favorites list entry in {INDEX_FILENAME}:\r\n{line}")
+                    entries.append(values)
+                elif line.strip():
+                    raise ValueError(f"Unknown entry type found in {INDEX_FILENAME}:\r\n{line}")
+
+        paths = [os.path.join(directory, values[2]) for values in entries]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            configs = list(executor.map(partial(UnidenFile.from_file, encoding=ENCODING), paths))
+        for values, path, config in zip(entries, paths, configs):
+            tree.lists.append(FavoritesList(values[1], config, values[2], tuple(values[3:])))
+            tree.saved[path] = config.digest()
+        return tree
+
+    def _write_list(self, directory, favorites_list: FavoritesList) -> bool:
+        digest = favorites_list.config.digest()
+        path = os.path.join(directory, favorites_list.filename)
+        if self.saved.get(path) == digest and os.path.exists(path):
+            return False
+        written = _write_if_changed(path, favorites_list.config.export().encode(ENCODING))
+        self.saved[path] = digest
+        return written
+
+    def write(self, directory, workers: int | None = None) -> list[str]:
+        """
+        Writes the lists that have changed, in parallel, then the index. Every file is written to a temporary file and
+        renamed into place, so a card that's pulled mid-write still has a complete copy of each file. Returns the
+        filenames of the lists that were written.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._assign_filenames()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            written = list(executor.map(lambda favorites_list: self._write_list(directory, favorites_list), self.lists))
+        _write_if_changed(os.path.join(directory, INDEX_FILENAME), self.index().encode(ENCODING))
+        return [favorites_list.filename for favorites_list, changed in zip(self.lists, written) if changed]
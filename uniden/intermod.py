@@ -0,0 +1,129 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Iterable, NamedTuple
+
+from .objects import ConventionalGroup, System, UnidenFile
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Entry(NamedTuple):
+    """
+    A frequency in Hz and where it came from - a site frequency (name is empty) or a conventional channel.
+    """
+    frequency: int
+    system: str
+    location: str
+    name: str = ""
+
+
+class SpacingViolation(NamedTuple):
+    first: Entry
+    second: Entry
+    separation: int
+
+
+class IntermodHit(NamedTuple):
+    """
+    A 3rd order product 2A - B landing within the tolerance of another frequency. a, b and victims list every entry on
+    those frequencies.
+    """
+    product: int
+    a: list[Entry]
+    b: list[Entry]
+    victims: list[Entry]
+
+
+def collect(source: UnidenFile | System | Iterable[System]) -> list[Entry]:
+    """
+    Gathers every site frequency and conventional channel frequency in a file, a system, or a list of systems.
+    """
+    if isinstance(source, UnidenFile):
+        systems = source.systems
+    elif isinstance(source, System):
+        systems = [source]
+    else:
+        systems = source
+    entries = []
+    for system in systems:
+        for site in system.sites:
+            entries.extend(Entry(frequency, system.value, site.value) for frequency in site.frequencies.hz())
+        for group in system.groups:
+            if isinstance(group, ConventionalGroup):
+                entries.extend(
+                    Entry(int(channel.freq), system.value, group.name, channel.name) for channel in group.channels
+                )
+    return entries
+
+
+def spacing_violations(entries: Iterable[Entry], min_spacing: int) -> list[SpacingViolation]:
+    """
+    Finds every pair of entries less than min_spacing Hz apart. Entries on exactly the same frequency are included.
+    The entries are sorted once and each one is compared only with the entries inside its window, found by bisecting.
+    """
+    entries = sorted(entries)
+    frequencies = [entry.frequency for entry in entries]
+    violations = []
+    for index, entry in enumerate(entries):
+        end = bisect_left(frequencies, entry.frequency + min_spacing, index + 1)
+        for other in entries[index + 1:end]:
+            violations.append(SpacingViolation(entry, other, other.frequency - entry.frequency))
+    return violations
+
+
+def _products_python(frequencies: list[int], tolerance: int):
+    count = len(frequencies)
+    low = frequencies[0] - tolerance
+    high = frequencies[-1] + tolerance
+    for i, a in enumerate(frequencies):
+        # Only the Bs giving a product inside the range of frequencies can hit anything
+        start = bisect_left(frequencies, 2 * a - high)
+        stop = bisect_right(frequencies, 2 * a - low)
+        for j in range(start, stop):
+            if j == i:
+                continue
+            product = 2 * a - frequencies[j]
+            k = bisect_left(frequencies, product - tolerance)
+            while k < count and frequencies[k] <= product + tolerance:
+                if k != i and k != j:
+                    yield product, i, j, k
+                k += 1
+
+
+def _products_numpy(frequencies: list[int], tolerance: int):
+    values = numpy.array(frequencies, dtype=numpy.int64)
+    for i, a in enumerate(frequencies):
+        products = 2 * a - values
+        starts = numpy.searchsorted(values, products - tolerance, "left")
+        stops = numpy.searchsorted(values, products + tolerance, "right")
+        for j in numpy.nonzero(stops > starts)[0].tolist():
+            if j == i:
+                continue
+            for k in range(int(starts[j]), int(stops[j])):
+                if k != i and k != j:
+                    yield int(products[j]), i, j, k
+
+
+def intermod_products(entries: Iterable[Entry], tolerance: int = 0, use_numpy: bool | None = None) -> list[IntermodHit]:
+    """
+    Finds 3rd order intermodulation products (2A - B) that land within the tolerance of another frequency in the list.
+    Each pair of distinct frequencies is tried once, with the victims found by bisecting the sorted frequencies, so the
+    work grows with the square of the number of distinct frequencies rather than the cube. NumPy is used to vectorise
+    the search when it's installed, unless use_numpy is False.
+    """
+    by_frequency = defaultdict(list)
+    for entry in entries:
+        by_frequency[entry.frequency].append(entry)
+    frequencies = sorted(by_frequency)
+    if len(frequencies) < 3:
+        return []
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    products = _products_numpy if use_numpy else _products_python
+    return [
+        IntermodHit(product, by_frequency[frequencies[i]], by_frequency[frequencies[j]], by_frequency[frequencies[k]])
+        for product, i, j, k in products(frequencies, tolerance)
+    ]
@@ -0,0 +1,135 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple
+
+from .base_classes import clone_object
+from .objects import BandPlan, Radio, Site, System, UnidenFile
+
+
+class Snapshot(NamedTuple):
+    """
+    One published version of a LiveConfig. Nothing reachable from a snapshot is ever changed once it's published, so
+    it can be read from any number of threads without locking.
+    """
+    version: int
+    target_model: str
+    format_version: str
+    systems: tuple
+
+    def to_uniden_file(self) -> UnidenFile:
+        """
+        Wraps the snapshot as a UnidenFile for exporting. The systems are shared with the snapshot, so don't modify them.
+        """
+        return UnidenFile(target_model=self.target_model, format_version=self.format_version, systems=list(self.systems))
+
+
+class Draft:
+    """
+    The next version of a config, being edited. Systems, groups, channels, sites and radios are copied the first time
+    they're asked for through system(), group(), channel(), site() or radio(), and everything left alone is shared with
+    the snapshot the draft started from. Only change objects returned by those methods, never ones read directly from
+    the snapshot.
+    """
+
+    def __init__(self, snapshot: Snapshot):
+        self.base = snapshot
+        self.target_model = snapshot.target_model
+        self.format_version = snapshot.format_version
+        self.systems = list(snapshot.systems)
+        self._copies = set()
+
+    def _track(self, copy):
+        self._copies.add(id(copy))
+        return copy
+
+    def system(self, index: int) -> System:
+        """
+        Returns a writable copy of a system, with its own group, site and radio lists and DQK status.
+        """
+        system = self.systems[index]
+        if id(system) not in self._copies:
+            system = self.systems[index] = self._track(system.clone(groups=list(system.groups)))
+        return system
+
+    def group(self, system_index: int, group_index: int):
+        """
+        Returns a writable copy of a group, with its own channel list.
+        """
+        system = self.system(system_index)
+        group = system.groups[group_index]
+        if id(group) not in self._copies:
+            group = system.groups[group_index] = self._track(clone_object(group, channels=list(group.channels)))
+        return group
+
+    def channel(self, system_index: int, group_index: int, channel_index: int):
+        group = self.group(system_index, group_index)
+        channel = group.channels[channel_index]
+        if id(channel) not in self._copies:
+            channel = group.channels[channel_index] = self._track(channel.clone())
+        return channel
+
+    def site(self, system_index: int, site_index: int) -> Site:
+        """
+        Returns a writable copy of a site, with its own frequencies and band plan.
+        """
+        system = self.system(system_index)
+        site = system.sites[site_index]
+        if id(site) not in self._copies:
+            bandplan = BandPlan(list(site.bandplan.band_plans)) if site.bandplan is not None else None
+            site = system.sites[site_index] = self._track(site.clone(bandplan=bandplan))
+        return site
+
+    def radio(self, system_index: int, radio_index: int) -> Radio:
+        system = self.system(system_index)
+        radio = system.radios[radio_index]
+        if id(radio) not in self._copies:
+            radio = system.radios[radio_index] = self._track(radio.clone())
+        return radio
+
+    def add_system(self, system: System) -> int:
+        """
+        Adds a new system to the draft and returns its index. The system belongs to the config from then on.
+        """
+        self.systems.append(system)
+        self._copies.add(id(system))
+        return len(self.systems) - 1
+
+    def remove_system(self, index: int) -> System:
+        return self.systems.pop(index)
+
+    def to_snapshot(self) -> Snapshot:
+        return Snapshot(self.base.version + 1, self.target_model, self.format_version, tuple(self.systems))
+
+
+class LiveConfig:
+    """
+    A config shared between threads. Readers call snapshot() and get a consistent version without taking any lock.
+    Writers edit a Draft inside edit(), one at a time, and the finished draft replaces the current snapshot in a single
+    assignment when the block exits, so readers see either all of an edit or none of it.
+    """
+
+    def __init__(self, uniden_file: UnidenFile | None = None):
+        if uniden_file is None:
+            uniden_file = UnidenFile()
+        self._snapshot = Snapshot(
+            0, uniden_file.target_model, uniden_file.format_version, tuple(uniden_file.systems)
+        )
+        self._write_lock = threading.Lock()
+
+    def snapshot(self) -> Snapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    @contextmanager
+    def edit(self) -> Iterator[Draft]:
+        """
+        Yields a Draft of the current version. It's published when the block finishes, or thrown away if the block
+        raises.
+        """
+        with self._write_lock:
+            draft = Draft(self._snapshot)
+            yield draft
+            self._snapshot = draft.to_snapshot()
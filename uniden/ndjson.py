@@ -0,0 +1,161 @@
+import json
+from typing import Iterable, Iterator, TextIO
+
+from .events import EVENTS, Event, tree_events
+from .objects import TreeBuilder, UnidenFile
+
+ALERT = ("alert_tone", "alert_volume", "alert_colour", "alert_pattern")
+RANGE = ("latitude", "longitude", "range", "shape")
+
+# Names for each record's fields, in the order they appear in the .hpd line. Records with a variable number of
+# fields store them as a single list instead.
+FIELD_NAMES = {
+    "TargetModel": ("value",),
+    "FormatVersion": ("value",),
+    "Trunk": ("name",),
+    "Conventional": ("name",),
+    "UnitIds": ("name", "radio_id") + ALERT,
+    "T-Freq": ("unknown_value", "frequency", "dmr_lcn", "colour"),
+    "T-Group": ("name", "avoid") + RANGE + ("quick_key",),
+    "C-Group": ("name", "avoid") + RANGE + ("quick_key", "filter"),
+    "TGID": (
+        "name", "avoid", "tgid", "tdma_slot", "service_type", "delay", "volume_offset", *ALERT, "number_tag",
+        "p_channel", "audio_type",
+    ),
+    "C-Freq": (
+        "name", "avoid", "frequency", "modulation", "audio_option", "service_type", "attenuator", "delay",
+        "volume_offset", *ALERT, "number_tag", "p_channel",
+    ),
+}
+LIST_FIELDS = {
+    "Site": "values",
+    "BandPlan_P25": "band_plan",
+    "DQKs_Status": "statuses",
+}
+NUMERIC_FIELDS = {"radio_id", "frequency", "tgid", "delay", "volume_offset"}
+
+# Context records carry so each line can be read on its own
+CONTEXT = {
+    "start_system": (),
+    "dqk_status": ("system",),
+    "unit_id": ("system",),
+    "site": ("system",),
+    "bandplan": ("system", "site"),
+    "site_freq": ("system", "site"),
+    "group": ("system",),
+    "tgid": ("system", "group"),
+    "cfreq": ("system", "group"),
+}
+
+
+def _number(value: str):
+    """
+    Converts a field to an int, but only when that can be turned back into exactly the same text.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        return value
+    return number if str(number) == value else value
+
+
+def _serializer(prefix: str):
+    """
+    Builds the function that turns one record's fields into a flat dict, so the field layout is only worked out once
+    per record type rather than on every record.
+    """
+    record_type = EVENTS[prefix]
+    if prefix in LIST_FIELDS:
+        list_name = LIST_FIELDS[prefix]
+        return lambda fields, context: {"record": record_type, "prefix": prefix, **context, list_name: list(fields)}
+
+    names = FIELD_NAMES[prefix]
+    numeric = [index for index, name in enumerate(names) if name in NUMERIC_FIELDS]
+    count = len(names)
+
+    def serialize(fields, context):
+        values = list(fields[:count])
+        for index in numeric:
+            if index < len(values):
+                values[index] = _number(values[index])
+        record = {"record": record_type, "prefix": prefix, **context, **dict(zip(names, values))}
+        if len(fields) > count:
+            record["extra"] = list(fields[count:])
+        return record
+
+    return serialize
+
+
+def _deserializer(prefix: str):
+    if prefix in LIST_FIELDS:
+        list_name = LIST_FIELDS[prefix]
+        return lambda record: tuple(record[list_name])
+    names = FIELD_NAMES[prefix]
+    return lambda record: tuple(
+        [str(record[name]) for name in names if name in record] + record.get("extra", [])
+    )
+
+
+SERIALIZERS = {prefix: _serializer(prefix) for prefix in EVENTS}
+DESERIALIZERS = {prefix: _deserializer(prefix) for prefix in EVENTS}
+
+
+def iter_records(events: Iterable[Event]) -> Iterator[dict]:
+    """
+    Turns events into flat dicts, one per record, each carrying the names of the system and group or site it's in.
+    """
+    context = {}
+    for event, prefix, fields in events:
+        if event == "end_system":
+            context = {}
+            continue
+        if event == "start_system":
+            context = {"system": fields[0] if fields else ""}
+        elif event == "site":
+            context = {"system": context.get("system"), "site": "\t".join(fields)}
+        elif event == "group":
+            context = {"system": context.get("system"), "group": fields[0] if fields else ""}
+        keys = CONTEXT.get(event, ())
+        yield SERIALIZERS[prefix](fields, {key: context.get(key) for key in keys})
+
+
+def write(source: UnidenFile | Iterable[Event], output: TextIO) -> int:
+    """
+    Writes a UnidenFile, or a stream of events, as newline delimited JSON and returns the number of lines written.
+    """
+    if isinstance(source, UnidenFile):
+        source = tree_events(source)
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    lines = 0
+    for record in iter_records(source):
+        output.write(dumps(record))
+        output.write("\n")
+        lines += 1
+    return lines
+
+
+def read(lines: Iterable[str]) -> Iterator[Event]:
+    """
+    Reads newline delimited JSON written by write() back into events.
+    """
+    system = None
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        prefix = record["prefix"]
+        event = EVENTS[prefix]
+        if event == "start_system":
+            if system is not None:
+                yield Event("end_system", system, ())
+            system = prefix
+        yield Event(event, prefix, DESERIALIZERS[prefix](record))
+    if system is not None:
+        yield Event("end_system", system, ())
+
+
+def load(lines: Iterable[str]) -> UnidenFile:
+    """
+    Rebuilds a UnidenFile from newline delimited JSON.
+    """
+    return TreeBuilder().feed(read(lines))
@@ -1,7 +1,18 @@
+import copy
+import multiprocessing
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import TextIO
 
-from .base_classes import UnidenBool, UnidenRange, AlertLight, AlertTone, UnidenTextType
+from .binary import decode, encode
+from .compression import open_config
+from .events import dispatch, parse, tree_events
+from .base_classes import (
+    UnidenBool, UnidenRange, AlertLight, AlertTone, UnidenTextType, ExportCache, build_object, clone_object,
+    content_digest
+)
 
 
 class ServiceType:
@@ -93,7 +104,7 @@ class ServiceType:
 
 
 @dataclass(slots=True)
-class Radio:
+class Radio(ExportCache):
     """
     Stores all relevant information for a given trunked radio UID
     """
@@ -104,11 +115,16 @@ class Radio:
     alert_light: AlertLight = field(default_factory=lambda: AlertLight())
 
     def export(self):
-        return f"UnitIds\t\t\t{self.name}\t{self.radio_id}\t{self.alert_tone}\t{self.alert_light}\n"
+        if self._export_cache is None:
+            self._export_cache = f"UnitIds\t\t\t{self.name}\t{self.radio_id}\t{self.alert_tone}\t{self.alert_light}\n"
+        return self._export_cache
 
     def __repr__(self):
         return f"{self.name} UID: {self.radio_id}"
 
+    def clone(self, **changes) -> 'Radio':
+        return clone_object(self, **changes)
+
     @staticmethod
     def from_text(text: str):
         text = text.strip("\n")
@@ -116,8 +132,12 @@ class Radio:
             text = text[10:]
         else:
             raise TypeError("Text does not match Radio type")
-        values = text.split('\t')
-        return Radio(
+        return Radio.from_values(text.split('\t'))
+
+    @classmethod
+    def from_values(cls, values) -> 'Radio':
+        return build_object(
+            cls,
             name=values[0],
             radio_id=int(values[1]),
             alert_tone=AlertTone((values[2], values[3])),
@@ -126,7 +146,7 @@ class Radio:
 
 
 @dataclass
-class TrunkedChannel:
+class TrunkedChannel(ExportCache):
     """
     All the relevant info for a Trunked system channel
     """
@@ -144,11 +164,19 @@ class TrunkedChannel:
     p_channel: UnidenBool = field(default_factory=lambda: UnidenBool())
 
     def export(self):
-        return f"{self.line_prefix}\t\t\t{self.name}\t{self.avoid}\t{self.tgid}\t{self.tdma_slot}\t{self.service_type.index}\t{self.delay}\t{self.volume_offset}\t{self.alert_tone.export()}\t{self.alert_light.export()}\t{self.number_tag}\t{self.p_channel}\tAny\n"
+        if self._export_cache is None:
+            self._export_cache = f"{self.line_prefix}\t\t\t{self.name}\t{self.avoid}\t{self.tgid}\t{self.tdma_slot}\t{self.service_type.index}\t{self.delay}\t{self.volume_offset}\t{self.alert_tone.export()}\t{self.alert_light.export()}\t{self.number_tag}\t{self.p_channel}\tAny\n"
+        return self._export_cache
 
     def __repr__(self):
         return f'{self.name} TGID: {self.tgid}'
 
+    def clone(self, **changes) -> 'TrunkedChannel':
+        """
+        Copies the channel, sharing its alert, service type and flag objects with the original.
+        """
+        return clone_object(self, **changes)
+
     def __eq__(self, other):
         if isinstance(other, TrunkedChannel):
             if other.tgid == self.tgid:
@@ -172,8 +200,12 @@ class TrunkedChannel:
             text = text[7:]
         else:
             raise TypeError("Text does not match TrunkedChannel type")
-        values = text.split('\t')
-        return TrunkedChannel(
+        return cls.from_values(text.split('\t'))
+
+    @classmethod
+    def from_values(cls, values) -> 'TrunkedChannel':
+        return build_object(
+            cls,
             name=values[0],
             avoid=UnidenBool(values[1]),
             tgid=values[2],
@@ -189,7 +221,7 @@ class TrunkedChannel:
 
 
 @dataclass(order=True, slots=True)
-class TrunkedGroup:
+class TrunkedGroup(ExportCache):
     """
     All the relevant info for a trunked channel group - also known as departments depending on the software you use
     """
@@ -200,15 +232,27 @@ class TrunkedGroup:
     range: UnidenRange = field(default_factory=lambda: UnidenRange())
     channels: list[TrunkedChannel] = field(default_factory=list)
 
+    def header(self) -> str:
+        if self._export_cache is None:
+            self._export_cache = f"T-Group\t\t\t{self.name}\t{self.avoid}\t{self.range}\t{self.quick_key}\n"
+        return self._export_cache
+
     def export(self):
-        data = f"T-Group\t\t\t{self.name}\t{self.avoid}\t{self.range}\t{self.quick_key}\n"
-        for channel in self.channels:
-            data += channel.export()
-        return data
+        return self.header() + "".join([channel.export() for channel in self.channels])
+
+    def digest(self) -> bytes:
+        return self._tree_digest(self.header(), tuple([channel.digest() for channel in self.channels]))
 
     def __repr__(self):
         return f"TrunkedGroup {self.name} QK {self.quick_key} [{len(self.channels)} Channels]"
 
+    def clone(self, **changes) -> 'TrunkedGroup':
+        """
+        Copies the group with its own channel list. The channels themselves are shared with the original.
+        """
+        changes.setdefault("channels", list(self.channels))
+        return clone_object(self, **changes)
+
     @staticmethod
     def from_text(text):
         text = text.strip("\n")
@@ -216,8 +260,11 @@ class TrunkedGroup:
             text = text[10:]
         else:
             raise TypeError("Text does not match TrunkedGroup type")
-        values = text.split('\t')
-        return TrunkedGroup(
+        return TrunkedGroup.from_values(text.split('\t'))
+
+    @classmethod
+    def from_values(cls, values) -> 'TrunkedGroup':
+        return cls(
             name=values[0],
             avoid=UnidenBool(values[1]),
             range=UnidenRange(values[2], values[3], values[4], values[5]),
@@ -239,7 +286,7 @@ class TrunkedGroup:
 
 
 @dataclass
-class ConventionalFrequency:
+class ConventionalFrequency(ExportCache):
     """
     All the relevant info for a conventional system channel
     """
@@ -259,11 +306,19 @@ class ConventionalFrequency:
     p_channel: UnidenBool = field(default_factory=lambda: UnidenBool())
 
     def export(self):
-        return f"{self.line_prefix}\t\t\t{self.name}\t{self.avoid}\t{self.freq}\t{self.modulation}\t{self.audio_option}\t{self.service_type.index}\t{self.attenuator}\t{self.delay}\t{self.volume_offset}\t{self.alert_tone.export()}\t{self.alert_light.export()}\t{self.number_tag}\t{self.p_channel}\n"
+        if self._export_cache is None:
+            self._export_cache = f"{self.line_prefix}\t\t\t{self.name}\t{self.avoid}\t{self.freq}\t{self.modulation}\t{self.audio_option}\t{self.service_type.index}\t{self.attenuator}\t{self.delay}\t{self.volume_offset}\t{self.alert_tone.export()}\t{self.alert_light.export()}\t{self.number_tag}\t{self.p_channel}\n"
+        return self._export_cache
 
     def __repr__(self):
         return f'{self.name} Frequency: {self.freq / 1_000_000}'
 
+    def clone(self, **changes) -> 'ConventionalFrequency':
+        """
+        Copies the channel, sharing its alert, service type and flag objects with the original.
+        """
+        return clone_object(self, **changes)
+
     def __eq__(self, other):
         if isinstance(other, ConventionalFrequency):
             if other.freq == self.freq:
@@ -287,8 +342,12 @@ class ConventionalFrequency:
             text = text[9:]
         else:
             raise TypeError("Text does not match TrunkedChannel type")
-        values = text.split('\t')
-        return ConventionalFrequency(
+        return cls.from_values(text.split('\t'))
+
+    @classmethod
+    def from_values(cls, values) -> 'ConventionalFrequency':
+        return build_object(
+            cls,
             name=values[0],
             avoid=UnidenBool(values[1]),
             freq=values[2],
@@ -306,7 +365,7 @@ class ConventionalFrequency:
 
 
 @dataclass(order=True, slots=True)
-class ConventionalGroup:
+class ConventionalGroup(ExportCache):
     """
     All the relevant info for a conventional channel group - also known as departments depending on the software you use
     """
@@ -318,15 +377,27 @@ class ConventionalGroup:
     channels: list[ConventionalFrequency] = field(default_factory=list)
     filter: str = "Global"
 
+    def header(self) -> str:
+        if self._export_cache is None:
+            self._export_cache = f"C-Group\t\t\t{self.name}\t{self.avoid}\t{self.range}\t{self.quick_key}\t{self.filter}\n"
+        return self._export_cache
+
     def export(self):
-        data = f"C-Group\t\t\t{self.name}\t{self.avoid}\t{self.range}\t{self.quick_key}\t{self.filter}\n"
-        for channel in self.channels:
-            data += channel.export()
-        return data
+        return self.header() + "".join([channel.export() for channel in self.channels])
+
+    def digest(self) -> bytes:
+        return self._tree_digest(self.header(), tuple([channel.digest() for channel in self.channels]))
 
     def __repr__(self):
         return f"TrunkedGroup {self.name} QK {self.quick_key} [{len(self.channels)} Channels]"
 
+    def clone(self, **changes) -> 'ConventionalGroup':
+        """
+        Copies the group with its own channel list. The channels themselves are shared with the original.
+        """
+        changes.setdefault("channels", list(self.channels))
+        return clone_object(self, **changes)
+
     @classmethod
     def from_text(cls, text):
         text = text.strip("\n")
@@ -334,8 +405,11 @@ class ConventionalGroup:
             text = text[10:]
         else:
             raise TypeError("Text does not match TrunkedGroup type")
-        values = text.split('\t')
-        return ConventionalGroup(
+        return cls.from_values(text.split('\t'))
+
+    @classmethod
+    def from_values(cls, values) -> 'ConventionalGroup':
+        return cls(
             name=values[0],
             avoid=UnidenBool(values[1]),
             range=UnidenRange(values[2], values[3], values[4], values[5]),
@@ -367,7 +441,10 @@ class SiteFrequency:
     colour: str = "Off"
 
     def __str__(self):
-        return f"{self.frequency / 1_000_000} Mhz"
+        return f"{int(self.frequency) / 1_000_000} Mhz"
+
+    def export(self):
+        return f"T-Freq\t\t\t{self.unknown_value}\t{self.frequency}\t{self.dmr_lcn}\t{self.colour}\n"
 
     @classmethod
     def from_text(cls, text):
@@ -375,13 +452,181 @@ class SiteFrequency:
         offset = len(cls.line_prefix) + cls.tabs
         if text[:offset] == cls.line_prefix + "\t" * cls.tabs:
             text = text[offset:]
-            values = text.split('\t')
-            return SiteFrequency(
-                frequency=values[1], unknown_value=UnidenBool(values[0]), dmr_lcn=values[2], colour=values[3]
-                )
+            return cls.from_values(text.split('\t'))
         else:
             raise TypeError(f"Text does not match {cls.__name__} type")
 
+    @classmethod
+    def from_values(cls, values) -> 'SiteFrequency':
+        return cls(frequency=values[1], unknown_value=UnidenBool(values[0]), dmr_lcn=values[2], colour=values[3])
+
+
+def _site_number(value) -> int | None:
+    if isinstance(value, int):
+        if 0 <= value <= 0x7fffffff:
+            return value
+    elif value.isascii() and value.isdigit() and len(value) < 10 and str(int(value)) == value:
+        return int(value)
+    return None
+
+
+class SiteFrequencies:
+    """
+    A site's T-Freq entries, stored as columns of numbers rather than one SiteFrequency per entry: frequencies, LCNs and
+    colour codes as 32 bit integer arrays and the unknown value flag as a byte each. Anything that isn't a plain number
+    ("Off" and the like) is kept in the container's own string table and stored as a negative index into it, so every
+    entry exports exactly as it was read.
+    Behaves like a list of SiteFrequency, but indexing and iterating build new SiteFrequency objects, so replace entries
+    (frequencies[i] = ...) rather than changing the ones handed out.
+    """
+    __slots__ = ("frequencies", "lcns", "colours", "flags", "strings", "_string_codes", "_export_cache")
+
+    def __init__(self, frequencies=()):
+        self.frequencies = array("i")
+        self.lcns = array("i")
+        self.colours = array("i")
+        self.flags = bytearray()
+        self.strings = ["Off"]
+        self._string_codes = {"Off": -1}
+        self._export_cache = None
+        self.extend(frequencies)
+
+    def _code(self, value) -> int:
+        """
+        The column value for a field: plain numbers as themselves, and any other text as -1 - n, where n is its index
+        in the string table.
+        """
+        number = _site_number(value)
+        if number is not None:
+            return number
+        value = str(value)
+        code = self._string_codes.get(value)
+        if code is None:
+            self.strings.append(value)
+            code = self._string_codes[value] = -len(self.strings)
+        return code
+
+    def _text(self, code: int) -> str:
+        return str(code) if code >= 0 else self.strings[-1 - code]
+
+    def append(self, frequency: SiteFrequency):
+        self.frequencies.append(self._code(frequency.frequency))
+        self.lcns.append(self._code(frequency.dmr_lcn))
+        self.colours.append(self._code(frequency.colour))
+        self.flags.append(str(frequency.unknown_value) == "On")
+        self._export_cache = None
+
+    def append_values(self, values):
+        """
+        Adds an entry straight from the fields of a T-Freq line, without making a SiteFrequency for it.
+        """
+        if values[0] not in ("On", "Off"):
+            raise ValueError(f"Invalid T-Freq value: {values[0]}")
+        self.frequencies.append(self._code(values[1]))
+        self.lcns.append(self._code(values[2]))
+        self.colours.append(self._code(values[3]))
+        self.flags.append(values[0] == "On")
+        self._export_cache = None
+
+    def extend(self, frequencies):
+        if isinstance(frequencies, SiteFrequencies):
+            if frequencies.strings == self.strings[:len(frequencies.strings)]:
+                # Same codes for the same strings, so the columns can be copied as they are
+                columns = (frequencies.frequencies, frequencies.lcns, frequencies.colours)
+            else:
+                codes = {-1 - index: self._code(text) for index, text in enumerate(frequencies.strings)}
+                columns = [[codes.get(code, code) for code in column]
+                           for column in (frequencies.frequencies, frequencies.lcns, frequencies.colours)]
+            self.frequencies.extend(columns[0])
+            self.lcns.extend(columns[1])
+            self.colours.extend(columns[2])
+            self.flags.extend(frequencies.flags)
+            self._export_cache = None
+        else:
+            for frequency in frequencies:
+                self.append(frequency)
+
+    def _entry(self, index: int) -> SiteFrequency:
+        return SiteFrequency(
+            frequency=self._text(self.frequencies[index]),
+            unknown_value=UnidenBool(bool(self.flags[index])),
+            dmr_lcn=self._text(self.lcns[index]),
+            colour=self._text(self.colours[index]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.frequencies)
+
+    def __iter__(self):
+        for index in range(len(self.frequencies)):
+            yield self._entry(index)
+
+    def __getitem__(self, index: int) -> SiteFrequency:
+        if index < 0:
+            index += len(self.frequencies)
+        if not 0 <= index < len(self.frequencies):
+            raise IndexError("Site frequency index out of range")
+        return self._entry(index)
+
+    def __setitem__(self, index: int, frequency: SiteFrequency):
+        self.frequencies[index] = self._code(frequency.frequency)
+        self.lcns[index] = self._code(frequency.dmr_lcn)
+        self.colours[index] = self._code(frequency.colour)
+        self.flags[index] = str(frequency.unknown_value) == "On"
+        self._export_cache = None
+
+    def __delitem__(self, index: int):
+        del self.frequencies[index]
+        del self.lcns[index]
+        del self.colours[index]
+        del self.flags[index]
+        self._export_cache = None
+
+    def clear(self):
+        del self[:]
+
+    def __eq__(self, other):
+        if isinstance(other, SiteFrequencies):
+            if self.strings == other.strings:
+                return (self.frequencies == other.frequencies and self.flags == other.flags
+                        and self.lcns == other.lcns and self.colours == other.colours)
+            return self.export() == other.export()
+        if isinstance(other, list):
+            return self.export() == "".join([frequency.export() for frequency in other])
+        return NotImplemented
+
+    def __copy__(self) -> 'SiteFrequencies':
+        new = SiteFrequencies()
+        new.strings = list(self.strings)
+        new._string_codes = dict(self._string_codes)
+        new.extend(self)
+        new._export_cache = self._export_cache
+        return new
+
+    def __repr__(self):
+        return f"SiteFrequencies([{', '.join(str(frequency) for frequency in self)}])"
+
+    def hz(self) -> list[int]:
+        """
+        The frequencies in Hz, skipping any entries whose frequency isn't a number.
+        """
+        return [frequency for frequency in self.frequencies if frequency >= 0]
+
+    def export(self) -> str:
+        if self._export_cache is None:
+            # LCNs and colour codes repeat a lot, so each distinct value is only turned into text once
+            text = {code: self._text(code) for column in (self.lcns, self.colours) for code in set(column)}
+            if self.frequencies and min(self.frequencies) < 0:
+                frequencies = [self._text(code) for code in self.frequencies]
+            else:
+                frequencies = map(str, self.frequencies)
+            flags = ("Off", "On")
+            self._export_cache = "".join([
+                f"T-Freq\t\t\t{flags[flag]}\t{frequency}\t{text[lcn]}\t{text[colour]}\n"
+                for flag, frequency, lcn, colour in zip(self.flags, frequencies, self.lcns, self.colours)
+            ])
+        return self._export_cache
+
 
 @dataclass
 class BandPlan:
@@ -411,26 +656,48 @@ class BandPlan:
         offset = len(cls.line_prefix) + cls.tabs
         if text[:offset] == cls.line_prefix + "\t" * cls.tabs:
             text = text[offset:]
-            values = text.split('\t')
-            pairs = list(zip(values[::2], values[1::2]))
         else:
             raise TypeError(f"Text does not match {cls.__name__} type")
-        return cls(pairs)
+        return cls.from_values(text.split('\t'))
+
+    @classmethod
+    def from_values(cls, values) -> 'BandPlan':
+        return cls(list(zip(values[::2], values[1::2])))
 
 
 @dataclass
-class Site(UnidenTextType):
+class Site(UnidenTextType, ExportCache):
     line_prefix = "Site"
-    frequencies: list = field(default_factory=list)
+    frequencies: SiteFrequencies = field(default_factory=SiteFrequencies)
     bandplan: BandPlan | None = None
 
-    def export(self):
-        data = f"{self.line_prefix}{self.tabs_text}{self.value}\n"
+    def __setattr__(self, name, value):
+        if name == "frequencies" and not isinstance(value, SiteFrequencies):
+            value = SiteFrequencies(value)
+        super().__setattr__(name, value)
+
+    def header(self) -> str:
+        if self._export_cache is None:
+            self._export_cache = f"{self.line_prefix}{self.tabs_text}{self.value}\n"
         if self.bandplan:
-            data += self.bandplan.export()
-        for freq in self.frequencies:
-            data += freq.export()
-        return data
+            return self._export_cache + self.bandplan.export()
+        return self._export_cache
+
+    def export(self):
+        return self.header() + self.frequencies.export()
+
+    def digest(self) -> bytes:
+        """
+        The frequencies keep their exported text until they change, so it stands in for child digests.
+        """
+        return self._tree_digest(self.header(), (self.frequencies.export(),))
+
+    def clone(self, **changes) -> 'Site':
+        """
+        Copies the site with its own frequency list. The frequencies and band plan are shared with the original.
+        """
+        changes.setdefault("frequencies", copy.copy(self.frequencies))
+        return clone_object(self, **changes)
 
     @classmethod
     def from_file(cls, file: TextIO):
@@ -440,7 +707,7 @@ class Site(UnidenTextType):
             line = file.readline()
             match line.split("\t")[0]:
                 case SiteFrequency.line_prefix:
-                    site.frequencies.append(SiteFrequency.from_text(line))
+                    site.frequencies.append_values(line.rstrip("\n").split("\t")[3:])
                 case BandPlan.line_prefix:
                     site.bandplan = BandPlan.from_text(line)
                 case _:
@@ -465,11 +732,15 @@ class DQKStatus:
             text = text[offset:]
         else:
             raise TypeError(f"Text does not match {cls.__name__} type")
-        return cls(text.split("\t"))
+        return cls.from_values(text.split("\t"))
+
+    @classmethod
+    def from_values(cls, values) -> 'DQKStatus':
+        return cls(list(values))
 
 
 @dataclass
-class System:
+class System(ExportCache):
     system_types = ["Trunk", "Conventional"]
     line_prefix: str
     value: str
@@ -478,17 +749,41 @@ class System:
     sites: list = field(default_factory=list)
     radios: list[Radio] = field(default_factory=list)
 
+    def header(self) -> str:
+        if self._export_cache is None:
+            self._export_cache = f"{self.line_prefix}\t\t\t{self.value}\n"
+        if self.dqk_status is not None:
+            return self._export_cache + self.dqk_status.export()
+        return self._export_cache
+
     def export(self):
-        data = f"{self.line_prefix}\t\t\t{self.value}\n"
+        data = [self.header()]
+        data.extend(radio.export() for radio in self.radios)
+        data.extend(site.export() for site in self.sites)
+        data.extend(group.export() for group in self.groups)
+        return "".join(data)
+
+    def digest(self) -> bytes:
+        """
+        A hash of the whole system, built from the cached digests of its radios, sites and groups so only the parts
+        changed since the last call are rehashed.
+        """
+        children = [radio.digest() for radio in self.radios]
+        children.extend([site.digest() for site in self.sites])
+        children.extend([group.digest() for group in self.groups])
+        return self._tree_digest(self.header(), tuple(children))
+
+    def clone(self, **changes) -> 'System':
+        """
+        Copies the system and its groups. Channels, sites and radios are shared with the original rather than copied, so
+        replace them (e.g. with their own clone()) instead of modifying them in place.
+        """
+        changes.setdefault("groups", [group.clone() for group in self.groups])
+        changes.setdefault("sites", list(self.sites))
+        changes.setdefault("radios", list(self.radios))
         if self.dqk_status is not None:
-            data += self.dqk_status.export()
-        for radio in self.radios:
-            data += radio.export()
-        for site in self.sites:
-            data += site.export()
-        for group in self.groups:
-            data += group.export()
-        return data
+            changes.setdefault("dqk_status", DQKStatus(list(self.dqk_status.statuses)))
+        return clone_object(self, **changes)
 
     @classmethod
     def from_text(cls, text) -> 'System':
@@ -501,6 +796,10 @@ class System:
             raise TypeError("Text does not match System type")
         return System(line_prefix=system_type, value=text)
 
+    @classmethod
+    def from_values(cls, system_type, values) -> 'System':
+        return System(line_prefix=system_type, value="\t".join(values))
+
     @classmethod
     def from_file(cls, file: TextIO):
         line = file.readline()
@@ -552,6 +851,36 @@ class TrunkedSystem(System):
     line_prefix = "Trunk"
 
 
+# Systems being exported, set in each worker process by the pool initializer
+_export_systems = []
+
+
+def _set_export_systems(systems: list[System]):
+    global _export_systems
+    _export_systems = systems
+
+
+def _export_system(index: int) -> str:
+    return _export_systems[index].export()
+
+
+def _export_parallel(systems: list[System], workers: int):
+    """
+    Forked workers get the systems from the parent's memory through the pool initializer, so nothing is pickled on the
+    way there. Forking a process with other threads running can deadlock the child, so in that case, or where fork
+    isn't available, the workers are spawned and each system is pickled over to them instead.
+    """
+    if "fork" in multiprocessing.get_all_start_methods() and threading.active_count() == 1:
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_set_export_systems,
+                                 initargs=(systems,)) as executor:
+            yield from executor.map(_export_system, range(len(systems)))
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            yield from executor.map(System.export, systems)
+
+
 @dataclass
 class UnidenFile:
     target_model: str = "BCDx36HP"
@@ -559,8 +888,12 @@ class UnidenFile:
     systems: list = field(default_factory=list)
 
     @staticmethod
-    def from_file(filename):
-        with open(filename, 'r') as config_file:
+    def from_file(filename, compression: str | None = None, encoding: str | None = None):
+        """
+        Loads a config file. gzip, xz and bz2 compressed files are decompressed as they're read. The text is decoded
+        with the locale's encoding unless encoding is given.
+        """
+        with open_config(filename, 'r', compression, encoding) as config_file:
             line = config_file.readline()
             if line[:12] == "TargetModel\t":
                 target_model = line[12:]
@@ -568,28 +901,120 @@ class UnidenFile:
                 if line[:14] == "FormatVersion\t":
                     format_version = line[14:]
                     uniden_file = UnidenFile(target_model=target_model, format_version=format_version)
-                    while True:
-                        file_pos = config_file.tell()
-                        next_line = config_file.readline()
-                        if next_line.startswith(TrunkedSystem.line_prefix):
-                            config_file.seek(file_pos)
-                            uniden_file.systems.append(System.from_file(config_file))
-                        elif next_line.startswith(ConventionalSystem.line_prefix):
-                            config_file.seek(file_pos)
-                            uniden_file.systems.append(System.from_file(config_file))
-                        elif next_line == "":
-                            return uniden_file
-                        else:
-                            raise ValueError(f"Unknown entry type found in config file:\r\n{next_line}")
+                    TreeBuilder(uniden_file).feed(parse(config_file))
         return uniden_file
 
+    def header(self) -> str:
+        return f"TargetModel\t{self.target_model.rstrip()}\nFormatVersion\t{self.format_version.rstrip()}\n"
+
     def export(self) -> str:
-        output_data = f"TargetModel\t{self.target_model}"
-        output_data += f"FormatVersion\t{self.format_version}"
-        for system in self.systems:
-            output_data += system.export()
-        return output_data
-
-    def to_file(self, filename):
-        with open(filename, 'w') as config_file:
-            config_file.write(self.export())
+        output_data = [self.header()]
+        output_data.extend(system.export() for system in self.systems)
+        return "".join(output_data)
+
+    def digest(self) -> bytes:
+        return content_digest(self.header(), *[system.digest() for system in self.systems])
+
+    def changed_systems(self, previous: 'UnidenFile') -> list[System]:
+        """
+        Returns the systems that don't appear, with exactly the same content, in a previous version of the file.
+        """
+        previous_digests = {system.digest() for system in previous.systems}
+        return [system for system in self.systems if system.digest() not in previous_digests]
+
+    def to_file(self, filename, compression: str | None = None, workers: int | None = None):
+        """
+        Writes the config out one system at a time. Files ending .gz, .xz or .bz2 are compressed as they're written.
+        With workers set, systems are exported in that many processes and written in their original order, giving
+        exactly the same file as a serial export.
+        """
+        with open_config(filename, 'w', compression) as config_file:
+            config_file.write(self.header())
+            if workers and workers > 1 and len(self.systems) > 1:
+                for text in _export_parallel(self.systems, workers):
+                    config_file.write(text)
+            else:
+                for system in self.systems:
+                    config_file.write(system.export())
+
+    def to_binary(self) -> bytes:
+        """
+        Packs the file into the compact binary format from uniden.binary.
+        """
+        return encode(tree_events(self))
+
+    @staticmethod
+    def from_binary(data: bytes) -> 'UnidenFile':
+        return TreeBuilder().feed(decode(data))
+
+
+class TreeBuilder:
+    """
+    Builds a UnidenFile from the events produced by events.parse(), one record at a time.
+    """
+
+    def __init__(self, uniden_file: UnidenFile | None = None):
+        self.uniden_file = UnidenFile() if uniden_file is None else uniden_file
+        self.current_system = None
+        self.current_site = None
+        self.current_group = None
+
+    def feed(self, events) -> UnidenFile:
+        dispatch(events, self)
+        return self.uniden_file
+
+    @staticmethod
+    def _check(parent, prefix, fields, kind=None):
+        if parent is None or (kind is not None and not isinstance(parent, kind)):
+            line = "\t".join((prefix, *fields))
+            raise ValueError(f"Unknown entry type found in config file:\r\n{line}")
+        return parent
+
+    def target_model(self, prefix, fields):
+        self.uniden_file.target_model = fields[0]
+
+    def format_version(self, prefix, fields):
+        self.uniden_file.format_version = fields[0]
+
+    def start_system(self, prefix, fields):
+        self.current_system = System.from_values(prefix, fields)
+        self.current_site = self.current_group = None
+        self.uniden_file.systems.append(self.current_system)
+
+    def end_system(self, prefix, fields):
+        self.current_system = self.current_site = self.current_group = None
+
+    def dqk_status(self, prefix, fields):
+        self._check(self.current_system, prefix, fields).dqk_status = DQKStatus.from_values(fields)
+
+    def unit_id(self, prefix, fields):
+        self._check(self.current_system, prefix, fields).radios.append(Radio.from_values(fields))
+
+    def site(self, prefix, fields):
+        self.current_site = Site.from_values(fields)
+        self.current_group = None
+        self._check(self.current_system, prefix, fields).sites.append(self.current_site)
+
+    def bandplan(self, prefix, fields):
+        self._check(self.current_site, prefix, fields).bandplan = BandPlan.from_values(fields)
+
+    def site_freq(self, prefix, fields):
+        self._check(self.current_site, prefix, fields).frequencies.append_values(fields)
+
+    def group(self, prefix, fields):
+        if prefix == TrunkedGroup.line_prefix:
+            self.current_group = TrunkedGroup.from_values(fields)
+        else:
+            self.current_group = ConventionalGroup.from_values(fields)
+        self.current_site = None
+        self._check(self.current_system, prefix, fields).groups.append(self.current_group)
+
+    def tgid(self, prefix, fields):
+        self._check(self.current_group, prefix, fields, TrunkedGroup).channels.append(
+            TrunkedChannel.from_values(fields)
+        )
+
+    def cfreq(self, prefix, fields):
+        self._check(self.current_group, prefix, fields, ConventionalGroup).channels.append(
+            ConventionalFrequency.from_values(fields)
+        )
@@ -0,0 +1,155 @@
+from dataclasses import dataclass, field
+
+from .objects import System, UnidenFile
+
+
+@dataclass
+class Limits:
+    """
+    The most each output file may hold. quick_keys is the number of distinct group quick keys, as the scanner only
+    has keys 0-99.
+    """
+    systems: int = 500
+    groups: int = 2000
+    channels: int = 10000
+    quick_keys: int = 100
+
+    def __post_init__(self):
+        for name in ("systems", "groups", "channels", "quick_keys"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"Limit {name} must be at least 1")
+
+
+@dataclass
+class _Piece:
+    """
+    A system, or part of one, being placed, with the totals it adds to a file.
+    """
+    position: int
+    system: System
+    groups: int = 0
+    channels: int = 0
+    quick_keys: set = field(default_factory=set)
+    # Which part of a split system this is, to keep the parts in order when they end up in the same file
+    part: int = 0
+
+
+@dataclass
+class _Bin:
+    pieces: list = field(default_factory=list)
+    groups: int = 0
+    channels: int = 0
+    quick_keys: set = field(default_factory=set)
+
+    def fits(self, piece: _Piece, limits: Limits) -> bool:
+        return (len(self.pieces) < limits.systems
+                and self.groups + piece.groups <= limits.groups
+                and self.channels + piece.channels <= limits.channels
+                and len(self.quick_keys | piece.quick_keys) <= limits.quick_keys)
+
+    def add(self, piece: _Piece):
+        self.pieces.append(piece)
+        self.groups += piece.groups
+        self.channels += piece.channels
+        self.quick_keys |= piece.quick_keys
+
+
+def _quick_keys(group) -> set:
+    return set() if str(group.quick_key) == "Off" else {str(group.quick_key)}
+
+
+def _split_group(group, limit: int) -> list:
+    """
+    Splits a group with more channels than fit in one file into numbered parts.
+    """
+    if len(group.channels) <= limit:
+        return [group]
+    return [
+        group.clone(name=f"{group.name} ({number})", channels=group.channels[start:start + limit])
+        for number, start in enumerate(range(0, len(group.channels), limit), 1)
+    ]
+
+
+def _pieces(position: int, system: System, limits: Limits) -> list[_Piece]:
+    """
+    Breaks a system that's too big for one file into consecutive runs of its groups, each small enough to fit. Every
+    part gets its own copy of the system's site and radio lists.
+    """
+    groups = [part for group in system.groups for part in _split_group(group, limits.channels)]
+    whole = _Piece(position, system, len(groups), sum(len(group.channels) for group in groups))
+    for group in groups:
+        whole.quick_keys |= _quick_keys(group)
+    fits = whole.groups <= limits.groups and whole.channels <= limits.channels \
+        and len(whole.quick_keys) <= limits.quick_keys
+    if fits and len(groups) == len(system.groups):
+        return [whole]
+
+    pieces = []
+    current = None
+    for group in groups:
+        channels = len(group.channels)
+        quick_keys = _quick_keys(group)
+        if (current is None or len(current.system.groups) + 1 > limits.groups
+                or current.channels + channels > limits.channels
+                or len(current.quick_keys | quick_keys) > limits.quick_keys):
+            current = _Piece(position, system.clone(groups=[]), part=len(pieces))
+            pieces.append(current)
+        current.system.groups.append(group)
+        current.groups += 1
+        current.channels += channels
+        current.quick_keys |= quick_keys
+    if not pieces:
+        pieces.append(_Piece(position, system.clone(groups=[])))
+    if len(pieces) > 1:
+        # The value is the whole system line, so only its first field, the name, is numbered
+        name, *settings = system.value.split("\t")
+        for number, piece in enumerate(pieces, 1):
+            piece.system.value = "\t".join((f"{name} ({number})", *settings))
+    return pieces
+
+
+def partition(uniden_file: UnidenFile, limits: Limits | None = None) -> list[UnidenFile]:
+    """
+    Packs a config's systems into as few files as possible without any file going over the limits, using first fit
+    decreasing on channel count. Systems too big for a single file are split by group first, and groups too big for a
+    single file are split into parts. Systems keep their original order within each file. Groups and channels are
+    shared with the original config rather than copied.
+    """
+    if limits is None:
+        limits = Limits()
+    pieces = []
+    for position, system in enumerate(uniden_file.systems):
+        pieces.extend(_pieces(position, system, limits))
+
+    bins = []
+    for piece in sorted(pieces, key=lambda piece: piece.channels, reverse=True):
+        for candidate in bins:
+            if candidate.fits(piece, limits):
+                candidate.add(piece)
+                break
+        else:
+            new_bin = _Bin()
+            new_bin.add(piece)
+            bins.append(new_bin)
+
+    return [
+        UnidenFile(
+            target_model=uniden_file.target_model, format_version=uniden_file.format_version,
+            systems=[piece.system for piece in sorted(output.pieces, key=lambda piece: (piece.position, piece.part))],
+        )
+        for output in bins
+    ]
+
+
+def write_partitions(uniden_file: UnidenFile, pattern: str = "part_{:03}.hpd", limits: Limits | None = None,
+                     compression: str | None = None) -> list[str]:
+    """
+    Partitions a config and writes each part to the filename made by formatting pattern with its number, starting at 1.
+    Each file is streamed out system by system with UnidenFile.to_file. Returns the filenames written.
+    """
+    filenames = []
+    for number, part in enumerate(partition(uniden_file, limits), 1):
+        filename = pattern.format(number)
+        part.to_file(filename, compression)
+        filenames.append(filename)
+    return filenames
@@ -0,0 +1,171 @@
+import csv
+from typing import Callable, Iterable, Iterator, TextIO
+
+from .compression import open_config
+from .events import Event, parse, parse_file, to_line, tree_events
+from .objects import (
+    BandPlan, ConventionalFrequency, ConventionalGroup, DQKStatus, Radio, Site, SiteFrequency, System, TrunkedChannel,
+    TrunkedGroup, TrunkedSystem, UnidenFile,
+)
+
+# How deep each record sits in the Trunk -> Site/T-Group -> TGID nesting. Dropping a record drops everything deeper
+# that follows it. end_system counts as a child of its system so it goes when the system does.
+LEVELS = {
+    "target_model": 0,
+    "format_version": 0,
+    "start_system": 1,
+    "end_system": 2,
+    "dqk_status": 2,
+    "unit_id": 2,
+    "site": 2,
+    "group": 2,
+    "bandplan": 3,
+    "site_freq": 3,
+    "tgid": 3,
+    "cfreq": 3,
+}
+
+RECORD_CLASSES = {
+    "dqk_status": DQKStatus,
+    "unit_id": Radio,
+    "site": Site,
+    "bandplan": BandPlan,
+    "site_freq": SiteFrequency,
+    "tgid": TrunkedChannel,
+    "cfreq": ConventionalFrequency,
+}
+# Records that have an object - the file header records and end_system don't
+OBJECT_EVENTS = frozenset(RECORD_CLASSES) | {"start_system", "group"}
+
+
+def to_object(record: Event):
+    """
+    Builds the record class instance for a record, using the same constructors as the tree builder.
+    """
+    if record.event == "start_system":
+        return System.from_values(record.prefix, record.fields)
+    if record.event == "group":
+        if record.prefix == TrunkedGroup.line_prefix:
+            return TrunkedGroup.from_values(record.fields)
+        return ConventionalGroup.from_values(record.fields)
+    if record.event not in RECORD_CLASSES:
+        raise ValueError(f"{record.prefix} records have no record class")
+    return RECORD_CLASSES[record.event].from_values(record.fields)
+
+
+def from_object(obj) -> Event:
+    """
+    Turns a record object back into a record from its exported line. Groups, sites and systems must not have any
+    children attached, or only their own line is kept.
+    """
+    return next(parse(obj.export().splitlines()))
+
+
+class Pipeline:
+    """
+    Passes .hpd records one at a time through a chain of map and filter stages. Records are events.Event tuples of
+    (event, prefix, fields). When a filter drops a system, site or group, the records nested under it are dropped too,
+    without having to buffer the whole system.
+    """
+
+    def __init__(self, source: Iterable[Event]):
+        self.source = source
+        self.stages = []
+
+    @classmethod
+    def from_file(cls, filename) -> 'Pipeline':
+        return cls(parse_file(filename))
+
+    @classmethod
+    def from_uniden_file(cls, uniden_file: UnidenFile) -> 'Pipeline':
+        return cls(tree_events(uniden_file))
+
+    def map(self, function: Callable[[Event], Event], *events: str) -> 'Pipeline':
+        """
+        Replaces each record with the result of the function. If any events are named, only those records are passed in.
+        """
+        self.stages.append((True, function, frozenset(events)))
+        return self
+
+    def filter(self, function: Callable[[Event], bool], *events: str) -> 'Pipeline':
+        """
+        Keeps only the records the function returns True for. If any events are named, other records are kept as is.
+        """
+        self.stages.append((False, function, frozenset(events)))
+        return self
+
+    def map_objects(self, function: Callable, *events: str) -> 'Pipeline':
+        """
+        Like map(), but the function is given the record's object (TrunkedChannel, Radio etc.) and returns one.
+        Records without an object, such as the TargetModel header, are passed through unchanged.
+        """
+        def map_object(record: Event) -> Event:
+            if record.event not in OBJECT_EVENTS:
+                return record
+            return from_object(function(to_object(record)))
+
+        return self.map(map_object, *events)
+
+    def __iter__(self) -> Iterator[Event]:
+        stages = self.stages
+        dropped_level = None
+        for record in self.source:
+            level = LEVELS[record.event]
+            if dropped_level is not None:
+                if level > dropped_level:
+                    continue
+                dropped_level = None
+            if record.event == "end_system":
+                yield record
+                continue
+            for is_map, function, events in stages:
+                if events and record.event not in events:
+                    continue
+                if is_map:
+                    record = function(record)
+                elif not function(record):
+                    record = None
+                    break
+            if record is None:
+                dropped_level = level
+                continue
+            yield record
+
+    def write(self, sink: TextIO | str) -> int:
+        """
+        Writes the records to a file name or open text file as they come out of the pipeline, and returns the number
+        of lines written. A default header is written first if the source didn't start with one.
+        """
+        if isinstance(sink, str):
+            with open_config(sink, 'w') as config_file:
+                return self.write(config_file)
+        lines = 0
+        for record in self:
+            if lines == 0 and record.event != "target_model":
+                default = UnidenFile()
+                sink.write(f"TargetModel\t{default.target_model}\nFormatVersion\t{default.format_version}\n")
+                lines = 2
+            line = to_line(record)
+            if line:
+                sink.write(line)
+                lines += 1
+        return lines
+
+
+def radioreference_source(filename, system_name: str) -> Iterator[Event]:
+    """
+    Reads a RadioReference talkgroup CSV export as records for a single trunked system, starting a new T-Group each time
+    the Category column changes.
+    """
+    yield Event("start_system", TrunkedSystem.line_prefix, (system_name,))
+    with open(filename, newline='', encoding='utf-8-sig') as channel_file:
+        reader = csv.reader(channel_file, dialect='excel')
+        header = next(reader)
+        tgid, alpha_tag, category = (header.index(name) for name in ("Decimal", "Alpha Tag", "Category"))
+        current_category = None
+        for row in reader:
+            if row[category] != current_category:
+                current_category = row[category]
+                yield from_object(TrunkedGroup(name=current_category, quick_key="Off"))
+            yield from_object(TrunkedChannel(tgid=int(row[tgid]), name=row[alpha_tag]))
+    yield Event("end_system", TrunkedSystem.line_prefix, ())
@@ -0,0 +1,141 @@
+import csv
+from typing import Iterable, Iterator
+
+from .base_classes import AlertLight, AlertTone
+from .dedup import resolve_conflict
+from .objects import Radio, System
+
+# Accepted header names for each column, checked in order. Only the ID and name columns are required.
+COLUMNS = {
+    "radio_id": ("Radio ID", "Unit ID", "ID", "Decimal"),
+    "name": ("Name", "Alpha Tag"),
+    "alert_tone": ("Alert Tone",),
+    "alert_volume": ("Alert Volume",),
+    "alert_colour": ("Alert Colour", "Alert Color"),
+    "alert_pattern": ("Alert Pattern",),
+}
+REQUIRED = ("radio_id", "name")
+
+
+def _positions(header: list[str]) -> dict:
+    header = [name.strip() for name in header]
+    positions = {}
+    for field_name, names in COLUMNS.items():
+        for name in names:
+            if name in header:
+                positions[field_name] = header.index(name)
+                break
+        else:
+            if field_name in REQUIRED:
+                raise ValueError(f"Unit ID CSV has no {' or '.join(repr(name) for name in names)} column")
+    return positions
+
+
+def read_rows(rows: Iterable[list[str]]) -> Iterator[Radio]:
+    """
+    Turns CSV rows, starting with the header, into Radios. Alert settings come from the optional alert columns and
+    radios with the same settings share the same AlertTone and AlertLight, which aren't shared with any other import.
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    positions = _positions(header)
+    radio_id, name = positions["radio_id"], positions["name"]
+    alerts = [positions.get(field_name) for field_name in ("alert_tone", "alert_volume", "alert_colour", "alert_pattern")]
+    tones = {}
+    lights = {}
+    for line_number, row in enumerate(rows, 2):
+        if not row:
+            continue
+        try:
+            value = int(row[radio_id])
+        except (ValueError, IndexError):
+            raise ValueError(f"Line {line_number} has an invalid radio ID") from None
+        tone, volume, colour, pattern = (row[index] if index is not None and index < len(row) else None
+                                         for index in alerts)
+        tone_key = (tone, volume or "Auto") if tone else (0, 0)
+        alert_tone = tones.get(tone_key)
+        if alert_tone is None:
+            alert_tone = tones[tone_key] = AlertTone(tone_key)
+        light_key = (colour, pattern or "On") if colour else ("Off", "On")
+        alert_light = lights.get(light_key)
+        if alert_light is None:
+            alert_light = lights[light_key] = AlertLight(light_key)
+        yield Radio(row[name] if name < len(row) else "", value, alert_tone, alert_light)
+
+
+def iter_csv(file) -> Iterator[Radio]:
+    with open(file, newline='', encoding='utf-8-sig') as radio_file:
+        yield from read_rows(csv.reader(radio_file, dialect='excel'))
+
+
+class RadioRoster:
+    """
+    A system's unit IDs indexed by radio ID, for constant time lookups and merging. Radios keep the order they were
+    first added in. A radio added with an ID that's already present is dropped if it's identical, otherwise the
+    conflict policy picks which to keep - "first", "last", "error", or a callable as in uniden.dedup.
+    """
+
+    def __init__(self, radios: Iterable[Radio] = (), policy="last"):
+        self.policy = policy
+        self.radios = {}
+        self.merge(radios)
+
+    @classmethod
+    def from_system(cls, system: System, policy="last") -> 'RadioRoster':
+        return cls(system.radios, policy)
+
+    def __len__(self) -> int:
+        return len(self.radios)
+
+    def __iter__(self) -> Iterator[Radio]:
+        return iter(self.radios.values())
+
+    def __contains__(self, radio_id: int) -> bool:
+        return radio_id in self.radios
+
+    def __getitem__(self, radio_id: int) -> Radio:
+        return self.radios[radio_id]
+
+    def get(self, radio_id: int, default=None) -> Radio | None:
+        return self.radios.get(radio_id, default)
+
+    def add(self, radio: Radio) -> Radio:
+        """
+        Adds a radio and returns the one kept for its ID.
+        """
+        existing = self.radios.get(radio.radio_id)
+        if existing is None:
+            self.radios[radio.radio_id] = radio
+            return radio
+        if existing.export() == radio.export():
+            return existing
+        kept = self.radios[radio.radio_id] = resolve_conflict(existing, radio, self.policy)
+        return kept
+
+    def merge(self, radios: Iterable[Radio]) -> 'RadioRoster':
+        add = self.add
+        for radio in radios:
+            add(radio)
+        return self
+
+    def remove(self, radio_id: int) -> Radio:
+        return self.radios.pop(radio_id)
+
+    def apply(self, system: System):
+        """
+        Replaces the system's radios with the roster's.
+        """
+        system.radios = list(self.radios.values())
+
+
+def import_csv(system: System, file, policy="last") -> RadioRoster:
+    """
+    Merges the unit IDs in a CSV file into a system, updating radios whose ID is already there, and returns the
+    resulting roster.
+    """
+    roster = RadioRoster.from_system(system, policy)
+    roster.merge(iter_csv(file))
+    roster.apply(system)
+    return roster
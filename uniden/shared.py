@@ -0,0 +1,140 @@
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from typing import Iterator
+
+from .binary import decode, encode
+from .events import Event, parse
+from .objects import System, TreeBuilder, UnidenFile
+
+MAGIC = b"USHM"
+VERSION = 1
+# Magic, version, number of blocks. The header block comes first, then one block per system.
+HEADER = Struct("<4sBI")
+OFFSET = Struct("<Q")
+
+
+class SharedConfig:
+    """
+    A parsed config published into shared memory, so other processes can attach to it by name instead of re-parsing
+    it or having it pickled to them. Each system is stored as its own block in the uniden.binary format, after a
+    table of block offsets, so a view only has to decode the systems it actually uses.
+    The publishing process owns the memory and should unlink() it once every worker is done.
+    """
+
+    def __init__(self, uniden_file: UnidenFile, name: str | None = None):
+        header = [
+            Event("target_model", "TargetModel", (uniden_file.target_model.rstrip(),)),
+            Event("format_version", "FormatVersion", (uniden_file.format_version.rstrip(),)),
+        ]
+        blocks = [encode(header)]
+        blocks.extend(encode(parse(system.export().splitlines())) for system in uniden_file.systems)
+
+        table_size = HEADER.size + OFFSET.size * (len(blocks) + 1)
+        offsets = [table_size]
+        for block in blocks:
+            offsets.append(offsets[-1] + len(block))
+        self.memory = SharedMemory(name=name, create=True, size=offsets[-1])
+        buffer = self.memory.buf
+        HEADER.pack_into(buffer, 0, MAGIC, VERSION, len(blocks))
+        for index, offset in enumerate(offsets):
+            OFFSET.pack_into(buffer, HEADER.size + index * OFFSET.size, offset)
+        for block, start in zip(blocks, offsets):
+            buffer[start:start + len(block)] = block
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        self.unlink()
+
+    def close(self):
+        self.memory.close()
+
+    def unlink(self):
+        self.memory.unlink()
+
+
+def publish(uniden_file: UnidenFile, name: str | None = None) -> SharedConfig:
+    return SharedConfig(uniden_file, name)
+
+
+class SharedConfigView:
+    """
+    Read only access to a config published with publish(). Systems are decoded the first time they're asked for and
+    kept, so each process only pays for the systems it touches.
+    Attach from processes started through multiprocessing by the publisher, so they share its resource tracker and
+    don't remove the memory when they exit.
+    """
+
+    def __init__(self, name: str):
+        if sys.version_info >= (3, 13):
+            self.memory = SharedMemory(name=name, track=False)
+        else:
+            self.memory = SharedMemory(name=name)
+        magic, version, count = HEADER.unpack_from(self.memory.buf)
+        if magic != MAGIC:
+            raise ValueError(f"Shared memory {name} does not hold a published config")
+        if version != VERSION:
+            raise ValueError(f"Unsupported shared config version {version}")
+        self.offsets = [
+            OFFSET.unpack_from(self.memory.buf, HEADER.size + index * OFFSET.size)[0] for index in range(count + 1)
+        ]
+        self.systems = {}
+        header = dict((event, fields[0]) for event, _, fields in self._events(0))
+        self.target_model = header["target_model"]
+        self.format_version = header["format_version"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.systems.clear()
+        self.memory.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 2
+
+    def _events(self, block: int) -> list[Event]:
+        data = self.memory.buf[self.offsets[block]:self.offsets[block + 1]]
+        try:
+            return list(decode(data))
+        finally:
+            data.release()
+
+    def system_events(self, index: int) -> Iterator[Event]:
+        if not 0 <= index < len(self):
+            raise IndexError("System index out of range")
+        return iter(self._events(index + 1))
+
+    def system(self, index: int) -> System:
+        system = self.systems.get(index)
+        if system is None:
+            builder = TreeBuilder()
+            builder.feed(self.system_events(index))
+            system = self.systems[index] = builder.uniden_file.systems[0]
+        return system
+
+    def __getitem__(self, index: int) -> System:
+        if index < 0:
+            index += len(self)
+        return self.system(index)
+
+    def __iter__(self) -> Iterator[System]:
+        for index in range(len(self)):
+            yield self.system(index)
+
+    def to_uniden_file(self) -> UnidenFile:
+        return UnidenFile(target_model=self.target_model, format_version=self.format_version, systems=list(self))
+
+
+def attach(name: str) -> SharedConfigView:
+    return SharedConfigView(name)
@@ -0,0 +1,76 @@
+from dataclasses import replace
+
+from .objects import BandPlan, Site, SiteFrequencies, System, UnidenFile
+
+
+class SharedPool:
+    """
+    Stores identical sites and band plans once, so systems built from the same template reference a single copy.
+    Shared objects must not be changed in place - use mutable_site() or mutable_band_plan() to get a private copy
+    for a given system first. Exporting is unaffected, each system still writes out every site it references.
+    """
+
+    def __init__(self):
+        self.sites = {}
+        self.band_plans = {}
+        # The pool holds a reference to everything in it, so ids can't be reused while they're in this set
+        self._shared_ids = set()
+
+    def __len__(self):
+        return len(self.sites) + len(self.band_plans)
+
+    def is_shared(self, item: Site | BandPlan) -> bool:
+        return id(item) in self._shared_ids
+
+    @staticmethod
+    def band_plan_key(bandplan: BandPlan):
+        return tuple(tuple(entry) for entry in bandplan.band_plans)
+
+    @staticmethod
+    def site_key(site: Site):
+        # Keyed by the exact exported content, so sites are only merged when every system would write them out the same
+        return site.value, site.digest()
+
+    def intern_band_plan(self, bandplan: BandPlan | None) -> BandPlan | None:
+        if bandplan is None:
+            return None
+        shared = self.band_plans.setdefault(self.band_plan_key(bandplan), bandplan)
+        self._shared_ids.add(id(shared))
+        return shared
+
+    def intern_site(self, site: Site) -> Site:
+        """
+        Returns the pooled site matching the given one, adding it to the pool if it hasn't been seen before.
+        """
+        key = self.site_key(site)
+        shared = self.sites.get(key)
+        if shared is None:
+            site.bandplan = self.intern_band_plan(site.bandplan)
+            shared = self.sites[key] = site
+            self._shared_ids.add(id(shared))
+        return shared
+
+    def share(self, uniden_file: UnidenFile) -> UnidenFile:
+        """
+        Replaces every site in the file with its pooled copy.
+        """
+        for system in uniden_file.systems:
+            system.sites = [self.intern_site(site) for site in system.sites]
+        return uniden_file
+
+    def mutable_site(self, system: System, index: int) -> Site:
+        """
+        Gives the system its own copy of a shared site, with its own frequency columns, and returns it. Sites that
+        aren't shared are returned as is. The band plan stays shared until mutable_band_plan() is called.
+        """
+        site = system.sites[index]
+        if self.is_shared(site):
+            site = replace(site, frequencies=SiteFrequencies(site.frequencies))
+            system.sites[index] = site
+        return site
+
+    def mutable_band_plan(self, system: System, index: int) -> BandPlan | None:
+        site = self.mutable_site(system, index)
+        if site.bandplan is not None and self.is_shared(site.bandplan):
+            site.bandplan = BandPlan(list(site.bandplan.band_plans))
+        return site.bandplan
@@ -0,0 +1,120 @@
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .compression import open_config
+from .objects import ServiceType
+
+# Lower edge in Hz and name of each band conventional frequencies are counted in. A frequency belongs to the last band
+# starting at or below it, up to that band's upper edge.
+BANDS = (
+    (25_000_000, 54_000_000, "VHF Low"),
+    (108_000_000, 137_000_000, "Aircraft"),
+    (137_000_000, 174_000_000, "VHF High"),
+    (220_000_000, 225_000_000, "220 MHz"),
+    (225_000_000, 406_000_000, "Military Air"),
+    (406_000_000, 512_000_000, "UHF"),
+    (764_000_000, 806_000_000, "700 MHz"),
+    (806_000_000, 960_000_000, "800/900 MHz"),
+)
+BAND_STARTS = [start for start, _, _ in BANDS]
+OTHER_BAND = "Other"
+
+
+def band(frequency: int) -> str:
+    index = bisect_right(BAND_STARTS, frequency) - 1
+    if index >= 0 and frequency < BANDS[index][1]:
+        return BANDS[index][2]
+    return OTHER_BAND
+
+
+@dataclass
+class Stats:
+    """
+    Counts for one or more config files. records counts lines by their prefix, service_types counts TGIDs by service
+    type index, and bands counts conventional frequencies by band.
+    """
+    records: Counter = field(default_factory=Counter)
+    service_types: Counter = field(default_factory=Counter)
+    bands: Counter = field(default_factory=Counter)
+
+    @property
+    def systems(self) -> int:
+        return self.records["Trunk"] + self.records["Conventional"]
+
+    @property
+    def sites(self) -> int:
+        return self.records["Site"]
+
+    @property
+    def groups(self) -> int:
+        return self.records["T-Group"] + self.records["C-Group"]
+
+    @property
+    def tgids(self) -> int:
+        return self.records["TGID"]
+
+    @property
+    def conventional_frequencies(self) -> int:
+        return self.records["C-Freq"]
+
+    @property
+    def unit_ids(self) -> int:
+        return self.records["UnitIds"]
+
+    def service_type_names(self) -> Counter:
+        return Counter({ServiceType.indexes.get(index, index): count for index, count in self.service_types.items()})
+
+    def __add__(self, other: 'Stats') -> 'Stats':
+        return Stats(self.records + other.records, self.service_types + other.service_types, self.bands + other.bands)
+
+
+def scan(lines: Iterable[str]) -> Stats:
+    """
+    Counts records straight from .hpd lines. Only the prefix of each line is looked at, apart from the service type of
+    TGIDs and the frequency of conventional channels, which are cut out of the line without splitting the rest of it.
+    """
+    records = Counter()
+    service_types = Counter()
+    frequencies = Counter()
+    for line in lines:
+        tab = line.find("\t")
+        if tab < 0:
+            continue
+        prefix = line[:tab]
+        records[prefix] += 1
+        if prefix == "TGID":
+            fields = line.split("\t", 8)
+            if len(fields) > 7:
+                service_types[fields[7]] += 1
+        elif prefix == "C-Freq":
+            fields = line.split("\t", 6)
+            if len(fields) > 5:
+                frequencies[fields[5]] += 1
+
+    bands = Counter()
+    for frequency, count in frequencies.items():
+        try:
+            bands[band(int(frequency))] += count
+        except ValueError:
+            bands[OTHER_BAND] += count
+    return Stats(records, service_types, bands)
+
+
+def scan_file(filename, compression: str | None = None) -> Stats:
+    with open_config(filename, 'r', compression) as config_file:
+        return scan(config_file)
+
+
+def scan_many(filenames: Iterable, workers: int | None = None) -> list[Stats]:
+    """
+    Scans files in parallel processes, returning their stats in the same order as the filenames. Add the results
+    together for totals across all of them.
+    """
+    filenames = list(filenames)
+    if workers == 1 or len(filenames) < 2:
+        return [scan_file(filename) for filename in filenames]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(scan_file, filenames))
@@ -0,0 +1,317 @@
+import sqlite3
+from typing import Iterable, Iterator
+
+from .events import Event, parse_file, tree_events
+from .objects import TreeBuilder, UnidenFile
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    target_model TEXT,
+    format_version TEXT
+);
+CREATE TABLE IF NOT EXISTS systems (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    position INTEGER NOT NULL,
+    system_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    dqk_status TEXT,
+    fields TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS radios (
+    system_id INTEGER NOT NULL REFERENCES systems(id),
+    position INTEGER NOT NULL,
+    name TEXT,
+    radio_id INTEGER,
+    fields TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sites (
+    id INTEGER PRIMARY KEY,
+    system_id INTEGER NOT NULL REFERENCES systems(id),
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    bandplan TEXT
+);
+CREATE TABLE IF NOT EXISTS site_frequencies (
+    site_id INTEGER NOT NULL REFERENCES sites(id),
+    position INTEGER NOT NULL,
+    unknown_value TEXT,
+    frequency INTEGER,
+    dmr_lcn TEXT,
+    colour TEXT,
+    fields TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY,
+    system_id INTEGER NOT NULL REFERENCES systems(id),
+    position INTEGER NOT NULL,
+    group_type TEXT NOT NULL,
+    name TEXT,
+    avoid TEXT,
+    quick_key TEXT,
+    fields TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS channels (
+    group_id INTEGER NOT NULL REFERENCES groups(id),
+    position INTEGER NOT NULL,
+    channel_type TEXT NOT NULL,
+    name TEXT,
+    avoid TEXT,
+    number INTEGER,
+    service_type TEXT,
+    fields TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS systems_file ON systems(file_id, position);
+CREATE INDEX IF NOT EXISTS systems_name ON systems(name);
+CREATE INDEX IF NOT EXISTS radios_system ON radios(system_id, position);
+CREATE INDEX IF NOT EXISTS radios_radio_id ON radios(radio_id);
+CREATE INDEX IF NOT EXISTS sites_system ON sites(system_id, position);
+CREATE INDEX IF NOT EXISTS site_frequencies_site ON site_frequencies(site_id, position);
+CREATE INDEX IF NOT EXISTS site_frequencies_frequency ON site_frequencies(frequency);
+CREATE INDEX IF NOT EXISTS groups_system ON groups(system_id, position);
+CREATE INDEX IF NOT EXISTS channels_group ON channels(group_id, position);
+CREATE INDEX IF NOT EXISTS channels_number ON channels(number);
+CREATE INDEX IF NOT EXISTS channels_service_type ON channels(service_type);
+"""
+
+INSERTS = {
+    "systems": "INSERT INTO systems VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "radios": "INSERT INTO radios VALUES (?, ?, ?, ?, ?)",
+    "sites": "INSERT INTO sites VALUES (?, ?, ?, ?, ?)",
+    "site_frequencies": "INSERT INTO site_frequencies VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "groups": "INSERT INTO groups VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    "channels": "INSERT INTO channels VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+}
+
+# Position of the service type index in each channel record's fields
+SERVICE_TYPE_FIELD = {"TGID": 4, "C-Freq": 5}
+
+
+def _number(value):
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class _Loader:
+    """
+    Turns a stream of events into table rows, handing them to executemany() in batches. Row ids are allocated here
+    rather than by SQLite so child rows can reference their parents without a round trip per insert.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, batch_size: int):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.rows = {table: [] for table in INSERTS}
+        self.next_id = {
+            table: connection.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}").fetchone()[0]
+            for table in ("systems", "sites", "groups")
+        }
+        self.positions = {}
+        self.file_id = None
+        self.system_id = None
+        self.site_id = None
+        self.group_id = None
+        # System and site rows are held back until they're complete, as their DQK status and band plan come later
+        self.system_row = None
+        self.site_row = None
+
+    def _id(self, table):
+        new_id = self.next_id[table]
+        self.next_id[table] += 1
+        return new_id
+
+    def _position(self, key):
+        position = self.positions.get(key, 0)
+        self.positions[key] = position + 1
+        return position
+
+    def _add(self, table, row):
+        rows = self.rows[table]
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self._flush(table)
+
+    def _flush(self, table):
+        if self.rows[table]:
+            self.connection.executemany(INSERTS[table], self.rows[table])
+            self.rows[table] = []
+
+    def _close_site(self):
+        if self.site_row is not None:
+            self._add("sites", self.site_row)
+            self.site_row = None
+
+    def _close_system(self):
+        self._close_site()
+        if self.system_row is not None:
+            self._add("systems", self.system_row)
+            self.system_row = None
+
+    def flush(self):
+        self._close_system()
+        for table in INSERTS:
+            self._flush(table)
+
+    def load(self, events: Iterable[Event], name: str | None) -> int:
+        target_model, format_version = UnidenFile.target_model, UnidenFile.format_version
+        cursor = self.connection.execute(
+            "INSERT INTO files (name, target_model, format_version) VALUES (?, ?, ?)", (name, None, None)
+        )
+        self.file_id = cursor.lastrowid
+        for event, prefix, fields in events:
+            match event:
+                case "target_model":
+                    target_model = fields[0]
+                case "format_version":
+                    format_version = fields[0]
+                case "start_system":
+                    self._close_system()
+                    self.system_id = self._id("systems")
+                    self.system_row = [
+                        self.system_id, self.file_id, self._position(self.file_id), prefix, fields[0], None,
+                        "\t".join(fields),
+                    ]
+                case "dqk_status":
+                    self.system_row[5] = "\t".join(fields)
+                case "unit_id":
+                    self._add("radios", (
+                        self.system_id, self._position(("radios", self.system_id)), fields[0], _number(fields[1]),
+                        "\t".join(fields),
+                    ))
+                case "site":
+                    self._close_site()
+                    self.site_id = self._id("sites")
+                    self.site_row = [
+                        self.site_id, self.system_id, self._position(("sites", self.system_id)), "\t".join(fields),
+                        None,
+                    ]
+                case "bandplan":
+                    self.site_row[4] = "\t".join(fields)
+                case "site_freq":
+                    self._add("site_frequencies", (
+                        self.site_id, self._position(("site", self.site_id)), fields[0], _number(fields[1]), fields[2],
+                        fields[3], "\t".join(fields),
+                    ))
+                case "group":
+                    self.group_id = self._id("groups")
+                    self._add("groups", (
+                        self.group_id, self.system_id, self._position(("groups", self.system_id)), prefix, fields[0],
+                        fields[1], fields[6], "\t".join(fields),
+                    ))
+                case "tgid" | "cfreq":
+                    self._add("channels", (
+                        self.group_id, self._position(("group", self.group_id)), prefix, fields[0], fields[1],
+                        _number(fields[2]), fields[SERVICE_TYPE_FIELD[prefix]], "\t".join(fields),
+                    ))
+        self.flush()
+        self.connection.execute(
+            "UPDATE files SET target_model = ?, format_version = ? WHERE id = ?",
+            (target_model, format_version, self.file_id),
+        )
+        return self.file_id
+
+
+class SQLiteStore:
+    """
+    Keeps any number of scanner configs in one SQLite database so they can be queried together.
+    Every record keeps its original fields, so configs export back out exactly as they were loaded, and the commonly
+    searched values (names, TGIDs, frequencies, service types, radio IDs) get their own indexed columns. Those columns
+    are copies for querying, and are NULL where a value isn't a number.
+    """
+
+    def __init__(self, database=":memory:", batch_size: int = 5000):
+        self.connection = sqlite3.connect(database)
+        self.batch_size = batch_size
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def load_events(self, events: Iterable[Event], name: str | None = None) -> int:
+        """
+        Stores a config from a stream of events in a single transaction and returns its file ID.
+        """
+        with self.connection:
+            return _Loader(self.connection, self.batch_size).load(events, name)
+
+    def load(self, uniden_file: UnidenFile, name: str | None = None) -> int:
+        return self.load_events(tree_events(uniden_file), name)
+
+    def load_file(self, filename) -> int:
+        return self.load_events(parse_file(filename), str(filename))
+
+    def query(self, sql: str, parameters=()) -> list:
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def files(self) -> list:
+        return self.query("SELECT id, name, target_model, format_version FROM files ORDER BY id")
+
+    def systems(self, file_id: int | None = None) -> list:
+        if file_id is None:
+            return self.query("SELECT id, file_id, system_type, name FROM systems ORDER BY file_id, position")
+        return self.query(
+            "SELECT id, file_id, system_type, name FROM systems WHERE file_id = ? ORDER BY position", (file_id,)
+        )
+
+    def system_events(self, system_id: int) -> Iterator[Event]:
+        """
+        Reads a single system back out of the database as events.
+        """
+        row = self.connection.execute(
+            "SELECT system_type, fields, dqk_status FROM systems WHERE id = ?", (system_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"No system with ID {system_id}")
+        system_type, fields, dqk_status = row
+        yield Event("start_system", system_type, tuple(fields.split("\t")))
+        if dqk_status is not None:
+            yield Event("dqk_status", "DQKs_Status", tuple(dqk_status.split("\t")))
+        for (fields,) in self.connection.execute(
+                "SELECT fields FROM radios WHERE system_id = ? ORDER BY position", (system_id,)):
+            yield Event("unit_id", "UnitIds", tuple(fields.split("\t")))
+        for site_id, value, bandplan in self.connection.execute(
+                "SELECT id, value, bandplan FROM sites WHERE system_id = ? ORDER BY position", (system_id,)).fetchall():
+            yield Event("site", "Site", tuple(value.split("\t")))
+            if bandplan is not None:
+                yield Event("bandplan", "BandPlan_P25", tuple(bandplan.split("\t")))
+            for (fields,) in self.connection.execute(
+                    "SELECT fields FROM site_frequencies WHERE site_id = ? ORDER BY position", (site_id,)):
+                yield Event("site_freq", "T-Freq", tuple(fields.split("\t")))
+        for group_id, group_type, fields in self.connection.execute(
+                "SELECT id, group_type, fields FROM groups WHERE system_id = ? ORDER BY position",
+                (system_id,)).fetchall():
+            yield Event("group", group_type, tuple(fields.split("\t")))
+            for channel_type, channel_fields in self.connection.execute(
+                    "SELECT channel_type, fields FROM channels WHERE group_id = ? ORDER BY position", (group_id,)):
+                event = "tgid" if channel_type == "TGID" else "cfreq"
+                yield Event(event, channel_type, tuple(channel_fields.split("\t")))
+        yield Event("end_system", system_type, ())
+
+    def to_uniden_file(self, system_ids: Iterable[int], target_model: str = UnidenFile.target_model,
+                       format_version: str = UnidenFile.format_version) -> UnidenFile:
+        """
+        Builds a UnidenFile from the given systems, in the order given.
+        """
+        builder = TreeBuilder(UnidenFile(target_model=target_model, format_version=format_version))
+        for system_id in system_ids:
+            builder.feed(self.system_events(system_id))
+        return builder.uniden_file
+
+    def file(self, file_id: int) -> UnidenFile:
+        row = self.connection.execute(
+            "SELECT target_model, format_version FROM files WHERE id = ?", (file_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"No file with ID {file_id}")
+        system_ids = [system_id for system_id, *_ in self.systems(file_id)]
+        return self.to_uniden_file(system_ids, *row)
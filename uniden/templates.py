@@ -0,0 +1,78 @@
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from .base_classes import clone_object
+from .objects import DQKStatus, System
+
+
+@dataclass
+class Override:
+    """
+    Field changes for a variant of a template. channel_fields are set on every channel matching the filters and
+    group_fields on every group matching them. Leaving group or where as None matches everything.
+    """
+    channel_fields: dict = field(default_factory=dict)
+    group_fields: dict = field(default_factory=dict)
+    group: str | None = None
+    where: Callable | None = None
+
+    def matches_group(self, group) -> bool:
+        return self.group is None or group.name == self.group
+
+    def matches_channel(self, channel) -> bool:
+        return self.where is None or self.where(channel)
+
+
+class SystemTemplate:
+    """
+    Generates variants of a base system. Each variant only copies the groups and channels its overrides change, the
+    rest are shared with the base system, so the base should be treated as read only while variants are in use.
+    """
+
+    def __init__(self, base: System):
+        self.base = base
+
+    def render(self, overrides: Iterable[Override] = (), **system_changes) -> System:
+        overrides = list(overrides)
+        groups = []
+        for group in self.base.groups:
+            group_overrides = [override for override in overrides if override.matches_group(group)]
+            if group_overrides:
+                group = self._apply(group, group_overrides)
+            groups.append(group)
+        system_changes.setdefault("groups", groups)
+        system_changes.setdefault("sites", list(self.base.sites))
+        system_changes.setdefault("radios", list(self.base.radios))
+        if self.base.dqk_status is not None:
+            system_changes.setdefault("dqk_status", DQKStatus(list(self.base.dqk_status.statuses)))
+        return clone_object(self.base, **system_changes)
+
+    def render_many(self, variants: Iterable[tuple[Iterable[Override], dict]]):
+        """
+        Yields a system for each (overrides, system_changes) pair.
+        """
+        for overrides, system_changes in variants:
+            yield self.render(overrides, **system_changes)
+
+    @staticmethod
+    def _apply(group, overrides: list[Override]):
+        group_fields = {}
+        for override in overrides:
+            group_fields.update(override.group_fields)
+        channel_overrides = [override for override in overrides if override.channel_fields]
+        if not channel_overrides:
+            return group.clone(**group_fields) if group_fields else group
+
+        channels = None
+        for index, channel in enumerate(group.channels):
+            changes = {}
+            for override in channel_overrides:
+                if override.matches_channel(channel):
+                    changes.update(override.channel_fields)
+            if changes:
+                if channels is None:
+                    channels = list(group.channels)
+                channels[index] = channel.clone(**changes)
+        if channels is None:
+            return group.clone(**group_fields) if group_fields else group
+        return group.clone(channels=channels, **group_fields)